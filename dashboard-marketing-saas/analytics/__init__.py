@@ -0,0 +1,66 @@
+"""
+Módulo de análises (forecast e cálculos) independente do Streamlit
+
+O relatório headless (analytics.report) não é importado aqui, para poder ser
+executado com `python -m analytics.report`.
+"""
+
+from .cache import memoize, content_key, cache_stats, clear_cache, memory_usage
+from .forecast import forecast_batch, forecast_kpis, kendall_trend
+from .models import AUTOMATICO, MODELOS, fit_models, select_best, forecast_with_models
+from .intervals import N_BOOT, bootstrap_intervals, confidence_quantiles
+from .partner import simulate_partner
+from .ledger import cohort_ledger, partner_ledger
+from .referral import partner_economics, referral_projection
+from .profiling import span, profiled, start_profile, stop_profile, export_jsonl
+from .downsample import lttb_indices, minmax_indices, downsample_frame
+from .rolling import rolling_column, rolling_stats, rolling_overlay, rolling_start, rolling_push
+from .commissions import (
+    commission_grid,
+    lookup_commission,
+    bundle_table,
+    rank_bundles,
+    describe_bundles
+)
+
+__all__ = [
+    'memoize',
+    'content_key',
+    'cache_stats',
+    'clear_cache',
+    'memory_usage',
+    'forecast_batch',
+    'forecast_kpis',
+    'kendall_trend',
+    'AUTOMATICO',
+    'MODELOS',
+    'fit_models',
+    'select_best',
+    'forecast_with_models',
+    'N_BOOT',
+    'bootstrap_intervals',
+    'confidence_quantiles',
+    'simulate_partner',
+    'cohort_ledger',
+    'partner_ledger',
+    'partner_economics',
+    'referral_projection',
+    'span',
+    'profiled',
+    'start_profile',
+    'stop_profile',
+    'export_jsonl',
+    'lttb_indices',
+    'minmax_indices',
+    'downsample_frame',
+    'rolling_column',
+    'rolling_stats',
+    'rolling_overlay',
+    'rolling_start',
+    'rolling_push',
+    'commission_grid',
+    'lookup_commission',
+    'bundle_table',
+    'rank_bundles',
+    'describe_bundles'
+]
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Cache em memória com chave pelo hash do conteúdo dos argumentos
+
+Um único cache LRU por processo, dividido em namespaces (dados, resumos,
+forecasts, figuras...), com orçamento de memória comum em config.CACHE. Em
+modo multi-tenant as chaves já diferem por tenant (caminho da fonte ou versão
+dos dados), e todos os tenants disputam o mesmo orçamento. Além dos totais do
+processo, os acertos e falhas podem ser somados por contexto (count_context),
+como a execução de uma sessão.
+"""
+import contextvars
+import functools
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config import CACHE
+
+LIMITE_BYTES = int(CACHE['limite_mb'] * 1024 * 1024)
+
+_lock = threading.Lock()
+_store = OrderedDict()
+_stats = {}
+_total = {'bytes': 0}
+_contexto = contextvars.ContextVar('contagem_cache', default=None)
+
+
+def content_key(*parts):
+    """Hash estável de arrays, Series/DataFrames e valores simples
+
+    Arrays de objetos (strings, tipos mistos) são hasheados pelos valores.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for parte in parts:
+        if isinstance(parte, (pd.Series, pd.DataFrame)):
+            h.update(repr(list(getattr(parte, 'columns', [parte.name]))).encode())
+            parte = parte.to_numpy()
+        if isinstance(parte, np.ndarray):
+            h.update(f"{parte.dtype}{parte.shape}".encode())
+            if parte.dtype == object:
+                # tobytes() daria os endereços dos objetos, não o conteúdo
+                parte = pd.util.hash_array(parte.ravel())
+            h.update(np.ascontiguousarray(parte).tobytes())
+        else:
+            h.update(repr(parte).encode())
+    return h.hexdigest()
+
+
+def estimate_size(valor):
+    """Bytes aproximados ocupados por um valor guardado no cache"""
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes + 128
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(index=True, deep=True).sum())
+    if isinstance(valor, pd.Series):
+        return int(valor.memory_usage(index=True, deep=True))
+    if isinstance(valor, (str, bytes)):
+        return len(valor) + 64
+    if isinstance(valor, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in valor.items())
+    if isinstance(valor, (list, tuple)):
+        return 64 + sum(estimate_size(v) for v in valor)
+    return sys.getsizeof(valor)
+
+
+def _namespace_stats(namespace):
+    return _stats.setdefault(namespace, {'hits': 0, 'misses': 0, 'entradas': 0, 'bytes': 0})
+
+
+def _discard(chave):
+    """Remove uma entrada (com o lock adquirido) e desconta seu tamanho"""
+    _, tamanho = _store.pop(chave)
+    contagem = _stats[chave[0]]
+    contagem['entradas'] -= 1
+    contagem['bytes'] -= tamanho
+    _total['bytes'] -= tamanho
+
+
+def count_context(contagem):
+    """Soma os acertos e falhas do contexto atual em `contagem` ({'hits', 'misses'}; None desliga)"""
+    _contexto.set(contagem)
+
+
+def cache_get(namespace, key):
+    """Busca um valor no cache; retorna (encontrado, valor)"""
+    chave = (namespace, key)
+    with _lock:
+        contagem = _namespace_stats(namespace)
+        encontrado = chave in _store
+        if encontrado:
+            contagem['hits'] += 1
+            _store.move_to_end(chave)
+            valor = _store[chave][0]
+        else:
+            contagem['misses'] += 1
+            valor = None
+    local = _contexto.get()
+    if local is not None:
+        local['hits' if encontrado else 'misses'] += 1
+    return encontrado, valor
+
+
+def cache_set(namespace, key, value):
+    """Guarda um valor no cache, descartando os menos usados acima do orçamento
+
+    Valores maiores que o orçamento inteiro não são guardados.
+    """
+    chave = (namespace, key)
+    tamanho = estimate_size(value)
+    if tamanho > LIMITE_BYTES:
+        return
+    with _lock:
+        if chave in _store:
+            _discard(chave)
+        _store[chave] = (value, tamanho)
+        contagem = _namespace_stats(namespace)
+        contagem['entradas'] += 1
+        contagem['bytes'] += tamanho
+        _total['bytes'] += tamanho
+        while _total['bytes'] > LIMITE_BYTES:
+            _discard(next(iter(_store)))
+
+
+def cache_clear(namespace):
+    """Remove as entradas de um namespace e zera suas estatísticas"""
+    with _lock:
+        for chave in [c for c in _store if c[0] == namespace]:
+            _discard(chave)
+        _stats.pop(namespace, None)
+
+
+def memoize(namespace):
+    """Decorador: memoriza o resultado pela função e pelo hash dos argumentos
+
+    O resultado é compartilhado entre chamadas e deve ser tratado como somente leitura.
+    """
+    def decorador(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            chave = content_key(func.__qualname__, *args, *sorted(kwargs.items()))
+            encontrado, resultado = cache_get(namespace, chave)
+            if not encontrado:
+                resultado = func(*args, **kwargs)
+                cache_set(namespace, chave, resultado)
+            return resultado
+        return wrapper
+    return decorador
+
+
+def cache_stats():
+    """Acertos, falhas, entradas e bytes por namespace"""
+    with _lock:
+        return {ns: dict(c) for ns, c in _stats.items()}
+
+
+def memory_usage():
+    """Bytes ocupados pelo cache e orçamento configurado"""
+    with _lock:
+        return {'bytes': _total['bytes'], 'limite': LIMITE_BYTES}
+
+
+def clear_cache():
+    """Esvazia o cache e zera as estatísticas"""
+    with _lock:
+        _store.clear()
+        _stats.clear()
+        _total['bytes'] = 0
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Grade pré-calculada de comissões: plano × combinação de extensões × percentual × meses
+
+O espaço de pacotes é finito (planos × 2^extensões) e as faixas de comissão
+vêm de config.GRADE_COMISSAO, então todos os valores são calculados uma única
+vez em um array estruturado. Consultas pontuais são O(1) por aritmética de
+índices, e rankings de pacotes operam sobre fatias da grade.
+"""
+import functools
+
+import numpy as np
+
+from config import CUSTOS_LEAD, EXTENSOES, GRADE_COMISSAO, PLANOS
+
+# Valores em R$ (e o percentual) em float64: totais em reais sem perder centavos
+# e rankings sem empates espúrios; a razão comissão/custo do lead em float32
+CAMPOS = np.dtype([
+    ('plano', 'u1'),
+    ('extensoes', 'u2'),
+    ('percentual', 'f8'),
+    ('meses', 'u1'),
+    ('valor_mensal', 'f8'),
+    ('comissao_mensal', 'f8'),
+    ('comissao_total', 'f8'),
+    ('lucro_total', 'f8'),
+    ('comissao_custo_lead', 'f4')
+])
+
+CRITERIOS = ['valor_mensal', 'comissao_mensal', 'comissao_total', 'lucro_total', 'comissao_custo_lead']
+
+
+def _axes():
+    """Eixos da grade: percentuais (fração) e meses de comissão"""
+    g = GRADE_COMISSAO
+    passos = int(round((g['percentual_max'] - g['percentual_min']) / g['passo_percentual']))
+    percentuais = (g['percentual_min'] + g['passo_percentual'] * np.arange(passos + 1)) / 100
+    meses = np.arange(g['meses_min'], g['meses_max'] + 1)
+    return percentuais, meses
+
+
+def extension_mask(extensoes):
+    """Máscara de bits de uma lista de nomes de extensões"""
+    nomes = list(EXTENSOES)
+    return sum(1 << nomes.index(ext) for ext in extensoes)
+
+
+@functools.lru_cache(maxsize=None)
+def extension_names(mascara):
+    """Nomes das extensões presentes na máscara"""
+    return tuple(ext for i, ext in enumerate(EXTENSOES) if mascara >> i & 1)
+
+
+@functools.lru_cache(maxsize=1)
+def commission_grid():
+    """Grade completa (array estruturado 4-D: plano × extensões × percentual × meses)"""
+    valores_planos = np.array(list(PLANOS.values()), dtype=float)
+    valores_ext = np.array(list(EXTENSOES.values()), dtype=float)
+    mascaras = np.arange(1 << len(valores_ext))
+    bits = (mascaras[:, None] >> np.arange(len(valores_ext))) & 1
+    percentuais, meses = _axes()
+
+    valor = valores_planos[:, None] + (bits @ valores_ext)[None, :]
+    comissao = valor[:, :, None] * percentuais[None, None, :]
+
+    forma = (len(valores_planos), len(mascaras), len(percentuais), len(meses))
+    grade = np.empty(forma, dtype=CAMPOS)
+    grade['plano'] = np.arange(forma[0])[:, None, None, None]
+    grade['extensoes'] = mascaras[None, :, None, None]
+    grade['percentual'] = percentuais[None, None, :, None]
+    grade['meses'] = meses
+    grade['valor_mensal'] = valor[:, :, None, None]
+    grade['comissao_mensal'] = comissao[..., None]
+    grade['comissao_total'] = comissao[..., None] * meses
+    grade['lucro_total'] = (valor[:, :, None, None] - comissao[..., None]) * meses
+    grade['comissao_custo_lead'] = comissao[..., None] / CUSTOS_LEAD['medio'] * 100
+    grade.flags.writeable = False
+    return grade
+
+
+def _position(percentual, meses):
+    """Índices (percentual, meses) na grade; ValueError fora das faixas configuradas"""
+    g = GRADE_COMISSAO
+    passo = (percentual * 100 - g['percentual_min']) / g['passo_percentual']
+    i_percentual = int(round(passo))
+    i_meses = int(meses) - g['meses_min']
+    grade = commission_grid()
+    if abs(passo - i_percentual) > 1e-6 or not 0 <= i_percentual < grade.shape[2]:
+        raise ValueError(f"Percentual de comissão fora da grade: {percentual * 100:.2f}%")
+    if not 0 <= i_meses < grade.shape[3]:
+        raise ValueError(f"Período de comissão fora da grade: {meses} meses")
+    return i_percentual, i_meses
+
+
+def lookup_commission(plano, extensoes, percentual, meses):
+    """Linha da grade para um pacote (nome do plano e lista de extensões)"""
+    i_percentual, i_meses = _position(percentual, meses)
+    return commission_grid()[list(PLANOS).index(plano), extension_mask(extensoes),
+                             i_percentual, i_meses]
+
+
+def bundle_table(percentual, meses):
+    """Todos os pacotes (plano × extensões) para um percentual e período: array 1-D"""
+    i_percentual, i_meses = _position(percentual, meses)
+    return commission_grid()[:, :, i_percentual, i_meses].ravel()
+
+
+def rank_bundles(percentual, meses, criterio='valor_mensal', n=10, maior=False,
+                 plano=None, incluir=()):
+    """Os n pacotes com menor (ou maior) valor do critério
+
+    `plano` restringe a um plano e `incluir` exige que as extensões listadas
+    estejam no pacote. Ex.: o pacote mais barato com PDV, ou os pacotes que mais
+    remuneram o contador.
+    """
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Critério desconhecido: {criterio}")
+    pacotes = bundle_table(percentual, meses)
+    filtro = np.ones(len(pacotes), dtype=bool)
+    if plano is not None:
+        filtro &= pacotes['plano'] == list(PLANOS).index(plano)
+    if incluir:
+        obrigatorias = extension_mask(incluir)
+        filtro &= (pacotes['extensoes'] & obrigatorias) == obrigatorias
+    pacotes = pacotes[filtro]
+    ordem = np.argsort(-pacotes[criterio] if maior else pacotes[criterio], kind='stable')
+    return pacotes[ordem[:n]]
+
+
+def describe_bundles(pacotes):
+    """Colunas legíveis (nome do plano e extensões) de um array de pacotes"""
+    nomes_planos = list(PLANOS)
+    return {
+        'Plano': [nomes_planos[p] for p in pacotes['plano']],
+        'Extensões': [', '.join(extension_names(int(m))) or '-' for m in pacotes['extensoes']]
+    }
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Redução de pontos de séries temporais para gráficos (LTTB e mín./máx. por bucket)
+
+Os dois métodos devolvem índices ordenados dos pontos mantidos, de modo que o
+mesmo recorte pode ser aplicado aos rótulos do eixo x e às demais colunas.
+Séries com até `n_out` pontos são mantidas inteiras.
+"""
+import numpy as np
+
+
+def _fill_gaps(y):
+    """Interpola valores ausentes (só para escolher pontos; os dados não mudam)"""
+    y = np.asarray(y, dtype=float)
+    validos = np.isfinite(y)
+    if validos.all() or not validos.any():
+        return np.nan_to_num(y)
+    posicoes = np.arange(len(y))
+    return np.interp(posicoes, posicoes[validos], y[validos])
+
+
+def lttb_indices(y, n_out, x=None):
+    """Índices escolhidos pelo Largest-Triangle-Three-Buckets
+
+    Mantém o primeiro e o último ponto e, em cada bucket intermediário, o ponto
+    que forma o maior triângulo com o ponto anterior escolhido e a média do
+    bucket seguinte. As médias dos buckets são calculadas de uma vez por somas
+    acumuladas; apenas a escolha encadeada percorre os buckets.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n) if n_out >= n else np.unique([0, n - 1])
+    y = _fill_gaps(y)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    # Limites dos buckets intermediários (o primeiro e o último ponto ficam sozinhos)
+    limites = (np.floor(np.arange(n_out - 1) * (n - 2) / (n_out - 2)) + 1).astype(int)
+    limites[-1] = n - 1
+    soma_x = np.concatenate([[0.0], np.cumsum(x)])
+    soma_y = np.concatenate([[0.0], np.cumsum(y)])
+
+    # Média do bucket seguinte a cada bucket (o último usa o ponto final)
+    inicio_prox = np.append(limites[1:-1], n - 1)
+    fim_prox = np.append(limites[2:], n)
+    contagem = fim_prox - inicio_prox
+    media_x = (soma_x[fim_prox] - soma_x[inicio_prox]) / contagem
+    media_y = (soma_y[fim_prox] - soma_y[inicio_prox]) / contagem
+
+    escolhidos = np.empty(n_out, dtype=int)
+    escolhidos[0], escolhidos[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        ini, fim = limites[i], limites[i + 1]
+        area = np.abs((x[a] - media_x[i]) * (y[ini:fim] - y[a])
+                      - (x[a] - x[ini:fim]) * (media_y[i] - y[a]))
+        a = ini + int(np.argmax(area))
+        escolhidos[i + 1] = a
+    return escolhidos
+
+
+def minmax_indices(Y, n_out):
+    """Índices dos mínimos e máximos de cada bucket, para uma ou várias séries
+
+    `Y` tem forma (pontos,) ou (pontos, séries). O número de buckets é ajustado
+    para que o total de pontos mantidos não passe de `n_out`.
+    """
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    n, k = Y.shape
+    if n_out >= n:
+        return np.arange(n)
+    buckets = max(1, (n_out - 2) // (2 * k))
+    inicios = np.linspace(0, n, buckets + 1).astype(int)[:-1]
+    preenchido = np.column_stack([_fill_gaps(Y[:, j]) for j in range(k)])
+
+    # Posição do mínimo/máximo de cada bucket: compara o valor com o extremo do bucket
+    bucket = np.repeat(np.arange(buckets), np.diff(np.append(inicios, n)))
+    escolhidos = [np.array([0, n - 1])]
+    for reduzir in (np.minimum, np.maximum):
+        extremos = reduzir.reduceat(preenchido, inicios, axis=0)[bucket]
+        linha, coluna = np.nonzero(preenchido == extremos)
+        primeiro = np.unique(bucket[linha] * k + coluna, return_index=True)[1]
+        escolhidos.append(linha[primeiro])
+    return np.unique(np.concatenate(escolhidos))
+
+
+def downsample_frame(df, columns, n_out, method='lttb'):
+    """Recorte de `df` com no máximo ~n_out linhas, preservando a forma das colunas
+
+    O orçamento de pontos é dividido entre as colunas: com 'lttb' cada coluna
+    escolhe seus pontos e os índices são unidos; 'minmax' mantém os extremos
+    de todas as colunas em cada bucket.
+    """
+    if len(df) <= n_out:
+        return df
+    valores = df[columns].to_numpy(dtype=float)
+    if method == 'minmax':
+        indices = minmax_indices(valores, n_out)
+    else:
+        por_coluna = max(3, n_out // len(columns))
+        indices = np.unique(np.concatenate(
+            [lttb_indices(valores[:, j], por_coluna) for j in range(len(columns))]))
+    return df.iloc[indices]
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Forecast em lote: tendência linear para vários KPIs em uma única solução
+
+Todos os KPIs são ajustados juntos por mínimos quadrados sobre a matriz
+(meses × KPIs). Resíduos, R², RMSE, MAPE e o teste de tendência de Kendall são
+calculados de forma vetorizada, e o resultado fica em cache pelo hash das séries.
+"""
+import functools
+import math
+
+import numpy as np
+
+from .cache import memoize
+
+Z_95 = 1.96
+
+METRICAS = ['R²', 'RMSE', 'MAPE', 'Erro Padrão', 'Tendência (tau)', 'P-valor tendência']
+
+# Acima deste tamanho (ou com empates) o p-valor de Kendall usa a aproximação normal,
+# como em scipy.stats.kendalltau(method='auto')
+_KENDALL_EXATO_MAX = 33
+
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _kendall_cdf(n):
+    """Distribuição acumulada do número de inversões de uma permutação de n elementos"""
+    pmf = np.ones(1)
+    for j in range(2, n + 1):
+        pmf = np.convolve(pmf, np.ones(j)) / j
+    return np.cumsum(pmf)
+
+
+def _tie_stats(Y):
+    """Pares empatados e termo de variância sum t(t-1)(2t+5), por coluna"""
+    n, k = Y.shape
+    ordenado = np.sort(Y, axis=0)
+    novo_grupo = np.vstack([np.ones((1, k), bool), ordenado[1:] != ordenado[:-1]])
+    grupo = np.cumsum(novo_grupo, axis=0) - 1 + np.arange(k) * n
+    t = np.bincount(grupo.ravel(order='F'), minlength=n * k).reshape(k, n).astype(float)
+    pares = (t * (t - 1) / 2).sum(axis=1)
+    termo_var = (t * (t - 1) * (2 * t + 5)).sum(axis=1)
+    return pares, termo_var
+
+
+def kendall_trend(Y):
+    """Tau-b de Kendall entre o tempo e cada coluna de Y, com p-valor bilateral"""
+    Y = np.asarray(Y, dtype=float)
+    n, k = Y.shape
+    total = n * (n - 1) // 2
+    if n < 2:
+        return np.full(k, np.nan), np.full(k, np.nan)
+
+    # S = concordantes - discordantes, somando sign(y_j - y_i) defasagem a defasagem
+    S = np.zeros(k)
+    for d in range(1, n):
+        S += np.sign(Y[d:] - Y[:-d]).sum(axis=0)
+
+    empates, termo_var = _tie_stats(Y)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        tau = np.clip(S / np.sqrt(total * (total - empates)), -1.0, 1.0)
+
+        var = (n * (n - 1) * (2 * n + 5) - termo_var) / 18
+        z = np.abs(S) / np.sqrt(var)
+        p = _erfc(z / math.sqrt(2)).astype(float)
+
+    exato = empates == 0
+    if n <= _KENDALL_EXATO_MAX and exato.any():
+        discordantes = (total - S[exato]) / 2
+        c = np.minimum(discordantes, total - discordantes).astype(int)
+        p[exato] = np.minimum(2 * _kendall_cdf(n)[c], 1.0)
+
+    sem_variacao = empates == total
+    tau[sem_variacao] = np.nan
+    p[sem_variacao] = np.nan
+    return tau, p
+
+
+def _fit(Y, horizon, z):
+    """Ajuste linear conjunto de todas as colunas de Y (sem valores ausentes)"""
+    n, k = Y.shape
+    t = np.arange(n, dtype=float)
+    X = np.column_stack([np.ones(n), t])
+    beta, *_ = np.linalg.lstsq(X, Y, rcond=None)
+
+    ajustado = X @ beta
+    X_futuro = np.column_stack([np.ones(horizon), np.arange(n, n + horizon, dtype=float)])
+    previsao = X_futuro @ beta
+
+    residuos = Y - ajustado
+    erro_padrao = residuos.std(axis=0)
+    ss_res = (residuos ** 2).sum(axis=0)
+    ss_tot = ((Y - Y.mean(axis=0)) ** 2).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.where(ss_res > 0, 0.0, 1.0))
+        mape = np.mean(np.abs(residuos / Y), axis=0) * 100
+    tau, p_valor = kendall_trend(Y)
+
+    return {
+        'coeficientes': beta,
+        'ajustado': ajustado,
+        'previsao': previsao,
+        'otimista': previsao + z * erro_padrao,
+        'conservador': previsao - z * erro_padrao,
+        'R²': r2,
+        'RMSE': np.sqrt(ss_res / n),
+        'MAPE': mape,
+        'Erro Padrão': erro_padrao,
+        'Tendência (tau)': tau,
+        'P-valor tendência': p_valor
+    }
+
+
+@memoize('forecast')
+def forecast_batch(Y, horizon, z=Z_95):
+    """Forecast linear de todas as colunas de Y (meses × séries) de uma vez
+
+    Retorna um dict de arrays: séries temporais com forma (horizonte, séries)
+    e métricas com forma (séries,). Colunas com valores ausentes resultam em NaN.
+    """
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    validas = np.isfinite(Y).all(axis=0)
+    parcial = _fit(Y[:, validas], horizon, z)
+
+    resultado = {}
+    for nome, valores in parcial.items():
+        completo = np.full(valores.shape[:-1] + (Y.shape[1],), np.nan)
+        completo[..., validas] = valores
+        resultado[nome] = completo
+    return resultado
+
+
+def forecast_kpis(df, kpis, horizon, z=Z_95):
+    """Forecast de cada KPI no formato usado pela aba de Forecast"""
+    lote = forecast_batch(df[kpis].to_numpy(dtype=float), horizon, z)
+    resultados = {}
+    for j, kpi in enumerate(kpis):
+        if not np.isfinite(lote['previsao'][:, j]).all():
+            resultados[kpi] = None
+            continue
+        resultados[kpi] = {
+            'previsao': lote['previsao'][:, j],
+            'otimista': lote['otimista'][:, j],
+            'conservador': lote['conservador'][:, j],
+            'metricas': {m: float(lote[m][j]) for m in METRICAS}
+        }
+    return resultados
\ No newline at end of file
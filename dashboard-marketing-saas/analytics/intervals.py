@@ -0,0 +1,146 @@
+"""
+Intervalos de predição por bootstrap de resíduos, vetorizados sobre as reamostragens
+
+Para cada série, os resíduos do modelo ajustado são reamostrados para gerar
+n_boot séries sintéticas (matriz n_boot × n). O modelo é reajustado em todas de
+uma vez e cada reamostragem projeta um caminho futuro com ruído também
+reamostrado (matriz n_boot × horizonte). Os quantis desses caminhos incorporam
+a incerteza dos parâmetros e crescem com o horizonte.
+
+No Theil-Sen, as inclinações de cada reamostragem são calculadas em blocos de
+caminhos com no máximo ELEMENTOS_BLOCO diferenças, sobre todos os pares de
+pontos ou, em séries longas, uma amostra fixa de MAX_PARES pares: a memória não
+cresce com o quadrado do tamanho da série.
+"""
+import numpy as np
+
+from .cache import memoize
+from .profiling import profiled
+from .models import (
+    MODELOS,
+    PERIODO_SAZONAL,
+    _holt_winters_run,
+    _holt_winters_step,
+    holt_winters_params,
+    seasonal_fit
+)
+
+N_BOOT = 2000
+NIVEL_CONFIANCA = 0.95
+SEMENTE = 42
+
+# Theil-Sen no bootstrap: pares de pontos por caminho (acima disso, amostra fixa;
+# séries de até 64 períodos usam todos) e diferenças por bloco de caminhos
+MAX_PARES = 2048
+ELEMENTOS_BLOCO = 1 << 20
+
+
+def confidence_quantiles(nivel=NIVEL_CONFIANCA):
+    """Quantis (conservador, mediana, otimista) de um intervalo central"""
+    cauda = (1 - nivel) / 2
+    return (cauda, 0.5, 1 - cauda)
+
+
+def _warmup(modelo, n, periodo):
+    """Pontos iniciais cujo ajuste é a própria observação (fora da amostra de resíduos)
+
+    Ajustes sazonais começam com um ciclo; o Holt sem sazonalidade, com os dois
+    pontos que definem nível e tendência; o ingênuo sem ciclo, com o primeiro.
+    """
+    if seasonal_fit(modelo, n, periodo):
+        return periodo
+    return {'Holt-Winters': min(2, n), 'Sazonal Ingênuo': 1}.get(modelo, 0)
+
+
+def _paths_linear(y, Y, horizon, periodo, ruido):
+    n = Y.shape[1]
+    X = np.column_stack([np.ones(n), np.arange(n, dtype=float)])
+    X_futuro = np.column_stack([np.ones(horizon), np.arange(n, n + horizon, dtype=float)])
+    beta, *_ = np.linalg.lstsq(X, Y.T, rcond=None)
+    return (X_futuro @ beta).T + ruido
+
+
+def _slope_pairs(n, seed=SEMENTE):
+    """Pares (i < j) das inclinações: todos, ou uma amostra fixa de MAX_PARES pares distintos"""
+    if n * (n - 1) // 2 <= MAX_PARES:
+        return np.triu_indices(n, k=1)
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, n, MAX_PARES)
+    b = rng.integers(0, n - 1, MAX_PARES)
+    b += b >= a
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def _paths_theil_sen(y, Y, horizon, periodo, ruido):
+    n = Y.shape[1]
+    if n < 2:
+        return Y[:, -1:] + ruido
+    t = np.arange(n, dtype=float)
+    i, j = _slope_pairs(n)
+    inclinacao = np.empty((len(Y), 1))
+    bloco = max(1, ELEMENTOS_BLOCO // len(i))
+    for inicio in range(0, len(Y), bloco):
+        parte = Y[inicio:inicio + bloco]
+        inclinacao[inicio:inicio + bloco, 0] = np.median((parte[:, j] - parte[:, i]) / (j - i), axis=1)
+    intercepto = np.median(Y - inclinacao * t, axis=1)[:, None]
+    return intercepto + inclinacao * np.arange(n, n + horizon) + ruido
+
+
+def _paths_seasonal_naive(y, Y, horizon, periodo, ruido):
+    # Sem parâmetros a estimar: os caminhos partem da série observada
+    defasagem = periodo if len(y) > periodo else 1
+    caminhos = np.empty((len(ruido), defasagem + horizon))
+    caminhos[:, :defasagem] = y[-defasagem:]
+    for h in range(horizon):
+        caminhos[:, defasagem + h] = caminhos[:, h] + ruido[:, h]
+    return caminhos[:, defasagem:]
+
+
+def _paths_holt_winters(y, Y, horizon, periodo, ruido):
+    # Suavização fixada no ajuste original; estados reestimados em cada reamostragem
+    alfa, beta, gama, sazonal = holt_winters_params(y, periodo)
+    b = len(Y)
+    parametros = [np.full(b, p) for p in (alfa, beta, gama)]
+    estado = _holt_winters_run(Y.T, *parametros, periodo, sazonal)[2:]
+    n = Y.shape[1]
+    caminhos = np.empty((b, horizon))
+    for h in range(horizon):
+        previsto = estado[0] + estado[1] + estado[2][:, (n + h) % periodo]
+        caminhos[:, h] = previsto + ruido[:, h]
+        _holt_winters_step(caminhos[:, h], n + h, estado, *parametros, periodo, sazonal)
+    return caminhos
+
+
+CAMINHOS = {
+    'Linear': _paths_linear,
+    'Holt-Winters': _paths_holt_winters,
+    'Theil-Sen': _paths_theil_sen,
+    'Sazonal Ingênuo': _paths_seasonal_naive
+}
+
+
+@profiled('bootstrap')
+@memoize('intervalos')
+def bootstrap_intervals(y, modelo, horizon, quantis=confidence_quantiles(),
+                        n_boot=N_BOOT, periodo=PERIODO_SAZONAL, seed=SEMENTE):
+    """Quantis dos caminhos simulados para cada passo do horizonte
+
+    Retorna um dict com a previsão pontual do modelo, a matriz de quantis
+    (len(quantis) × horizonte) e os próprios quantis. O resultado é
+    determinístico para a mesma semente e fica em cache pelo hash da série.
+    """
+    y = np.asarray(y, dtype=float)
+    ajustado, previsao = MODELOS[modelo](y, horizon, periodo)
+    residuos = (y - ajustado)[_warmup(modelo, len(y), periodo):]
+    quantis = np.asarray(quantis, dtype=float)
+    if len(residuos) < 2:
+        valores = np.tile(previsao, (len(quantis), 1))
+        return {'previsao': previsao, 'quantis': quantis, 'valores': valores}
+
+    residuos = residuos - residuos.mean()
+    rng = np.random.default_rng(seed)
+    Y = ajustado + residuos[rng.integers(0, len(residuos), (n_boot, len(y)))]
+    ruido = residuos[rng.integers(0, len(residuos), (n_boot, horizon))]
+    caminhos = CAMINHOS[modelo](y, Y, horizon, periodo, ruido)
+    valores = np.quantile(caminhos, quantis, axis=0)
+    return {'previsao': previsao, 'quantis': quantis, 'valores': valores}
\ No newline at end of file
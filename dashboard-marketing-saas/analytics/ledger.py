@@ -0,0 +1,102 @@
+"""
+Ledger de coortes da parceria: receita e comissão por (coorte × mês)
+
+A coorte c reúne os clientes indicados no mês c. Sua receita no mês t é
+novos[c] × valor × sobrevivência^(t - c), e a comissão é paga enquanto
+t - c < meses de comissão. As matrizes de sobrevivência e de vigência da
+comissão dependem só de (horizonte, churn) e (horizonte, meses de comissão) e
+ficam em cache, de modo que mudar um controle recalcula apenas a etapa afetada.
+"""
+import functools
+
+import numpy as np
+
+from .cache import memoize
+
+
+@functools.lru_cache(maxsize=64)
+def survival_kernel(horizonte, churn):
+    """Matriz (coorte × mês) com a fração de clientes da coorte ainda ativa no mês"""
+    defasagem = np.arange(horizonte)[None, :] - np.arange(horizonte)[:, None]
+    kernel = np.where(defasagem >= 0, (1 - churn) ** np.maximum(defasagem, 0), 0.0)
+    kernel.flags.writeable = False
+    return kernel
+
+
+@functools.lru_cache(maxsize=64)
+def commission_window(horizonte, meses_comissao):
+    """Máscara (coorte × mês) dos meses em que a coorte ainda gera comissão"""
+    defasagem = np.arange(horizonte)[None, :] - np.arange(horizonte)[:, None]
+    janela = (defasagem >= 0) & (defasagem < meses_comissao)
+    janela.flags.writeable = False
+    return janela
+
+
+@functools.lru_cache(maxsize=64)
+def _commission_kernel(horizonte, churn, meses_comissao):
+    kernel = survival_kernel(horizonte, churn) * commission_window(horizonte, meses_comissao)
+    kernel.flags.writeable = False
+    return kernel
+
+
+@memoize('ledger')
+def _active_clients(novos, horizonte, churn):
+    """Clientes ativos por (coorte × mês) para o total de indicações de cada mês"""
+    return novos[:, None] * survival_kernel(horizonte, churn)
+
+
+def _monthly_inflow(novos, horizonte):
+    """Indicações por mês no horizonte (escalar repetido ou vetor completado com zeros)"""
+    novos = np.asarray(novos, dtype=float)
+    if novos.ndim == 0:
+        return np.full(horizonte, float(novos))
+    saida = np.zeros(novos.shape[:-1] + (horizonte,))
+    saida[..., :min(horizonte, novos.shape[-1])] = novos[..., :horizonte]
+    return saida
+
+
+def cohort_ledger(novos, horizonte, valor_mensal, percentual_comissao, meses_comissao, churn=0.0):
+    """Ledger de coortes: matrizes (coorte × mês) e totais mensais
+
+    `novos` é o número de clientes indicados por mês (escalar ou vetor). Retorna
+    um dict de arrays numéricos: 'clientes', 'receita' e 'comissao' (coorte ×
+    mês), os totais por mês e o 'passivo' de comissões (valor ainda a pagar às
+    coortes já adquiridas ao fim de cada mês).
+    """
+    fluxo = _monthly_inflow(novos, horizonte)
+    clientes = _active_clients(fluxo, horizonte, churn)
+    receita = clientes * valor_mensal
+
+    # Comissões calculadas além do horizonte, para o passivo das últimas coortes
+    estendido = horizonte + meses_comissao
+    comissao_total = (np.pad(fluxo, (0, meses_comissao))[:, None] * valor_mensal
+                      * percentual_comissao * _commission_kernel(estendido, churn, meses_comissao))
+    comissao = comissao_total[:horizonte, :horizonte]
+
+    # Passivo no mês t: comissões futuras das coortes que já entraram (c <= t)
+    a_pagar = comissao_total[:, ::-1].cumsum(axis=1)[:, ::-1] - comissao_total
+    passivo = np.triu(a_pagar)[:horizonte, :horizonte].sum(axis=0)
+    return {
+        'clientes': clientes,
+        'receita': receita,
+        'comissao': comissao,
+        'clientes_ativos': clientes.sum(axis=0),
+        'receita_mes': receita.sum(axis=0),
+        'comissao_mes': comissao.sum(axis=0),
+        'lucro_mes': receita.sum(axis=0) - comissao.sum(axis=0),
+        'passivo': passivo
+    }
+
+
+def partner_ledger(novos_por_parceiro, horizonte, valor_mensal, percentual_comissao,
+                   meses_comissao, churn=0.0):
+    """Receita e comissão mensais de cada parceiro (parceiros × mês)
+
+    `novos_por_parceiro` tem forma (parceiros × meses). As coortes de todos os
+    parceiros são somadas por produto matricial com as matrizes de sobrevivência
+    e de comissão, sem materializar o cubo parceiro × coorte × mês.
+    """
+    fluxo = _monthly_inflow(novos_por_parceiro, horizonte) * valor_mensal
+    receita = fluxo @ survival_kernel(horizonte, churn)
+    comissao = fluxo @ _commission_kernel(horizonte, churn, meses_comissao) * percentual_comissao
+    return {'receita': receita, 'comissao': comissao}
\ No newline at end of file
@@ -0,0 +1,280 @@
+"""
+Modelos de forecast (linear, Holt-Winters, Theil-Sen, sazonal ingênuo) com seleção automática
+
+Cada par (série, modelo) é ajustado uma única vez por versão dos dados: o
+resultado fica em cache pelo hash da série. Pares pendentes são distribuídos
+em um pool de processos quando o volume justifica o custo de enviá-los.
+"""
+import numpy as np
+
+from .cache import cache_get, cache_set, content_key
+from .forecast import kendall_trend
+from .profiling import profiled, span
+from .pool import cpu_count, get_pool
+
+PERIODO_SAZONAL = 12
+
+AUTOMATICO = 'Automático'
+
+# Pontos (séries pendentes × tamanho) a partir dos quais o ajuste vai para o pool
+LIMIAR_PARALELO = 50_000
+
+# Grade de suavização do Holt-Winters (avaliada de uma vez, vetorizada)
+_GRADE_HW = np.linspace(0.1, 0.9, 5)
+
+
+def seasonal_fit(modelo, n, periodo=PERIODO_SAZONAL):
+    """Se o ajuste de `modelo` a n pontos usa o ciclo sazonal
+
+    Holt-Winters a partir de dois ciclos completos; sazonal ingênuo a partir de um.
+    """
+    if modelo == 'Holt-Winters':
+        return n >= 2 * periodo
+    return modelo == 'Sazonal Ingênuo' and n > periodo
+
+
+def fit_linear(y, horizon, periodo=PERIODO_SAZONAL):
+    """Tendência linear por mínimos quadrados"""
+    t = np.arange(len(y), dtype=float)
+    inclinacao, intercepto = np.polyfit(t, y, 1) if len(y) > 1 else (0.0, y[0])
+    futuro = np.arange(len(y), len(y) + horizon, dtype=float)
+    return intercepto + inclinacao * t, intercepto + inclinacao * futuro
+
+
+def fit_theil_sen(y, horizon, periodo=PERIODO_SAZONAL):
+    """Tendência robusta: mediana das inclinações entre todos os pares de pontos"""
+    n = len(y)
+    t = np.arange(n, dtype=float)
+    if n < 2:
+        return y.copy(), np.full(horizon, y[0])
+    i, j = np.triu_indices(n, k=1)
+    inclinacao = np.median((y[j] - y[i]) / (j - i))
+    intercepto = np.median(y - inclinacao * t)
+    futuro = np.arange(n, n + horizon, dtype=float)
+    return intercepto + inclinacao * t, intercepto + inclinacao * futuro
+
+
+def fit_seasonal_naive(y, horizon, periodo=PERIODO_SAZONAL):
+    """Repete o valor do mesmo período no ciclo anterior (ou o último valor, sem um ciclo completo)"""
+    n = len(y)
+    if n <= periodo:
+        ajustado = np.concatenate([y[:1], y[:-1]])
+        return ajustado, np.full(horizon, y[-1])
+    ajustado = np.concatenate([y[:periodo], y[:-periodo]])
+    ultimo_ciclo = y[-periodo:]
+    return ajustado, ultimo_ciclo[np.arange(horizon) % periodo]
+
+
+def _holt_winters_init(y, g, periodo, sazonal):
+    """Estado inicial (nível, tendência, sazonalidade) para g conjuntos de parâmetros
+
+    `y` tem forma (n,) ou (n, g): uma série para toda a grade ou uma série por coluna.
+    """
+    y = y.reshape(len(y), -1)
+    if sazonal:
+        # Estado inicial pelos dois primeiros ciclos
+        media_1, media_2 = y[:periodo].mean(axis=0), y[periodo:2 * periodo].mean(axis=0)
+        b0 = (media_2 - media_1) / periodo
+        centro = np.arange(periodo)[:, None] - (periodo - 1) / 2
+        nivel = media_1 - b0 * (periodo + 1) / 2
+        sazon = (y[:periodo] - (media_1 + b0 * centro)).T
+    else:
+        nivel = y[0]
+        b0 = y[1] - y[0] if len(y) > 1 else np.zeros_like(y[0])
+        sazon = np.zeros((1, periodo))
+    return (np.broadcast_to(nivel, (g,)).copy(), np.broadcast_to(b0, (g,)).copy(),
+            np.broadcast_to(sazon, (g, periodo)).copy())
+
+
+def _holt_winters_step(valor, t, estado, alfa, beta, gama, periodo, sazonal):
+    """Atualiza o estado com a observação do instante t; retorna o valor previsto para t"""
+    nivel, tendencia, sazon = estado
+    s = sazon[:, t % periodo]
+    previsto = nivel + tendencia + s
+    novo_nivel = alfa * (valor - s) + (1 - alfa) * (nivel + tendencia)
+    tendencia[:] = beta * (novo_nivel - nivel) + (1 - beta) * tendencia
+    if sazonal:
+        sazon[:, t % periodo] = gama * (valor - novo_nivel) + (1 - gama) * s
+    nivel[:] = novo_nivel
+    return previsto
+
+
+def _holt_winters_run(y, alfa, beta, gama, periodo, sazonal):
+    """Executa a recursão aditiva para vetores de parâmetros; retorna SSE, ajustado e estado
+
+    `y` tem forma (n,) ou (n, g), como em _holt_winters_init.
+    """
+    n, g = len(y), len(alfa)
+    estado = _holt_winters_init(y, g, periodo, sazonal)
+    inicio = 0 if sazonal else 1
+
+    ajustado = np.empty((n, g))
+    ajustado[0] = y[0]
+    sse = np.zeros(g)
+    for t in range(inicio, n):
+        ajustado[t] = _holt_winters_step(y[t], t, estado, alfa, beta, gama, periodo, sazonal)
+        sse += (y[t] - ajustado[t]) ** 2
+    return (sse, ajustado) + estado
+
+
+def holt_winters_params(y, periodo=PERIODO_SAZONAL):
+    """Parâmetros (alfa, beta, gama) de menor SSE na grade e se há sazonalidade"""
+    sazonal = seasonal_fit('Holt-Winters', len(y), periodo)
+    gamas = _GRADE_HW if sazonal else np.zeros(1)
+    alfa, beta, gama = (m.ravel() for m in np.meshgrid(_GRADE_HW, _GRADE_HW, gamas, indexing='ij'))
+    sse = _holt_winters_run(y, alfa, beta, gama, periodo, sazonal)[0]
+    melhor = int(np.argmin(sse))
+    return alfa[melhor], beta[melhor], gama[melhor], sazonal
+
+
+def fit_holt_winters(y, horizon, periodo=PERIODO_SAZONAL):
+    """Suavização exponencial aditiva (Holt; com sazonalidade a partir de dois ciclos)"""
+    n = len(y)
+    alfa, beta, gama, sazonal = holt_winters_params(y, periodo)
+    _, ajustado, nivel, tendencia, sazon = _holt_winters_run(
+        y, np.array([alfa]), np.array([beta]), np.array([gama]), periodo, sazonal)
+    passos = np.arange(1, horizon + 1)
+    indices = (n + passos - 1) % periodo
+    previsao = nivel[0] + passos * tendencia[0] + sazon[0, indices]
+    return ajustado[:, 0], previsao
+
+
+MODELOS = {
+    'Linear': fit_linear,
+    'Holt-Winters': fit_holt_winters,
+    'Theil-Sen': fit_theil_sen,
+    'Sazonal Ingênuo': fit_seasonal_naive
+}
+
+
+def _mape(real, previsto):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return float(np.mean(np.abs((real - previsto) / real)) * 100)
+
+
+def evaluate_model(y, modelo, horizon, periodo=PERIODO_SAZONAL):
+    """Ajusta um modelo: MAPE no holdout (últimos pontos) e previsão com a série completa"""
+    y = np.asarray(y, dtype=float)
+    fit = MODELOS[modelo]
+    holdout = min(horizon, max(1, len(y) // 4))
+    mape_holdout = np.nan
+    if len(y) - holdout >= 2:
+        _, previsto = fit(y[:-holdout], holdout, periodo)
+        mape_holdout = _mape(y[-holdout:], previsto)
+    ajustado, previsao = fit(y, horizon, periodo)
+    residuos = y - ajustado
+    ss_tot = ((y - y.mean()) ** 2).sum()
+    r2 = 1 - (residuos ** 2).sum() / ss_tot if ss_tot > 0 else np.nan
+    return {
+        'modelo': modelo,
+        'ajustado': ajustado,
+        'previsao': previsao,
+        'erro_padrao': float(np.std(residuos)),
+        'r2': float(r2),
+        'rmse': float(np.sqrt(np.mean(residuos ** 2))),
+        'mape': _mape(y, ajustado),
+        'mape_holdout': mape_holdout
+    }
+
+
+def _evaluate_task(args):
+    with span(f"ajuste: {args[1]}", pontos=len(args[0])):
+        return evaluate_model(*args)
+
+
+@profiled('ajuste de modelos')
+def fit_models(series, horizon, modelos=None, periodo=PERIODO_SAZONAL, paralelo=None):
+    """Ajusta cada modelo em cada série, reaproveitando pares já ajustados
+
+    `series` é um dict nome -> array. `paralelo=None` decide pelo volume de
+    dados pendentes; True/False força o pool de processos ou a execução serial.
+    Retorna dict série -> dict modelo -> resultado de evaluate_model.
+    """
+    modelos = list(modelos or MODELOS)
+    resultados = {nome: {} for nome in series}
+    pendentes = []
+    for nome, y in series.items():
+        y = np.asarray(y, dtype=float)
+        for modelo in modelos:
+            chave = content_key(y, modelo, horizon, periodo)
+            encontrado, valor = cache_get('modelos', chave)
+            if encontrado:
+                resultados[nome][modelo] = valor
+            else:
+                pendentes.append((nome, modelo, chave, y))
+
+    if paralelo is None:
+        paralelo = cpu_count() > 1 and sum(len(p[3]) for p in pendentes) >= LIMIAR_PARALELO
+
+    tarefas = [(y, modelo, horizon, periodo) for _, modelo, _, y in pendentes]
+    if paralelo and len(tarefas) > 1:
+        avaliados = list(get_pool().map(_evaluate_task, tarefas, chunksize=max(1, len(tarefas) // 32)))
+    else:
+        avaliados = [_evaluate_task(t) for t in tarefas]
+
+    for (nome, modelo, chave, _), valor in zip(pendentes, avaliados):
+        cache_set('modelos', chave, valor)
+        resultados[nome][modelo] = valor
+    return resultados
+
+
+def select_best(ajustes):
+    """Escolhe, para cada série, o modelo com menor MAPE no holdout"""
+    escolhidos = {}
+    for nome, por_modelo in ajustes.items():
+        validos = [r for r in por_modelo.values() if np.isfinite(r['mape_holdout'])]
+        if validos:
+            escolhidos[nome] = min(validos, key=lambda r: r['mape_holdout'])
+        else:
+            escolhidos[nome] = next(iter(por_modelo.values()))
+    return escolhidos
+
+
+@profiled('forecast')
+def forecast_with_models(df, kpis, horizon, modelo=AUTOMATICO, nivel=0.95, paralelo=None):
+    """Forecast de cada KPI com o modelo pedido (ou o de menor MAPE no holdout)
+
+    Os cenários otimista e conservador são os quantis do intervalo de predição
+    por bootstrap no `nivel` de confiança pedido. Retorna (resultados, comparacao):
+    resultados no formato da aba de Forecast e um dict KPI -> {modelo: MAPE no
+    holdout} para comparar os modelos.
+    """
+    from .intervals import bootstrap_intervals, confidence_quantiles
+
+    Y = df[kpis].to_numpy(dtype=float)
+    validas = np.isfinite(Y).all(axis=0)
+    series = {kpi: Y[:, j] for j, kpi in enumerate(kpis) if validas[j]}
+    ajustes = fit_models(series, horizon, periodo=PERIODO_SAZONAL, paralelo=paralelo)
+    if modelo == AUTOMATICO:
+        escolhidos = select_best(ajustes)
+    else:
+        escolhidos = {nome: por_modelo[modelo] for nome, por_modelo in ajustes.items()}
+    tau, p_valor = kendall_trend(Y)
+
+    resultados = {}
+    for j, kpi in enumerate(kpis):
+        if kpi not in escolhidos:
+            resultados[kpi] = None
+            continue
+        r = escolhidos[kpi]
+        intervalo = bootstrap_intervals(series[kpi], r['modelo'], horizon,
+                                        confidence_quantiles(nivel))
+        conservador, _, otimista = intervalo['valores']
+        resultados[kpi] = {
+            'modelo': r['modelo'],
+            'previsao': r['previsao'],
+            'otimista': otimista,
+            'conservador': conservador,
+            'metricas': {
+                'R²': r['r2'],
+                'RMSE': r['rmse'],
+                'MAPE': r['mape'],
+                'MAPE Holdout': r['mape_holdout'],
+                'Erro Padrão': r['erro_padrao'],
+                'Tendência (tau)': float(tau[j]),
+                'P-valor tendência': float(p_valor[j])
+            }
+        }
+    comparacao = {nome: {m: r['mape_holdout'] for m, r in por_modelo.items()}
+                  for nome, por_modelo in ajustes.items()}
+    return resultados, comparacao
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Simulação Monte Carlo do canal de parceria com contadores
+
+Cada caminho sorteia suas próprias taxas (volume de indicações, conversão,
+churn e adesão às extensões) e os clientes novos de cada mês. Todos os caminhos
+avançam juntos mês a mês como vetores NumPy; a receita e a comissão de cada
+coorte decaem com a sobrevivência do caminho, e a comissão de uma coorte
+deixa de ser paga após o período de comissão.
+"""
+import numpy as np
+
+from config import PARCERIA
+
+from .cache import memoize
+from .pool import cpu_count, get_pool
+from .profiling import profiled
+
+PERCENTIS = (10, 50, 90)
+
+SEMENTE = 7
+
+# Caminhos × meses a partir dos quais a simulação é dividida no pool de processos.
+# Medido: ~200 ns por célula no bloco e ~50 ns por célula para devolver as
+# matrizes do processo filho; com 2+ processadores o pool compensa a partir de
+# ~1 milhão de células (ex.: 100 mil caminhos × 12 meses)
+LIMIAR_PARALELO = 1_000_000
+
+
+def _beta(rng, media, concentracao, tamanho):
+    """Sorteia taxas em torno de `media` (quanto maior a concentração, menor a dispersão)"""
+    media = min(max(media, 1e-6), 1 - 1e-6)
+    return rng.beta(media * concentracao, (1 - media) * concentracao, tamanho)
+
+
+def _simulate_chunk(args):
+    """Simula um bloco de caminhos; retorna receita e comissão acumuladas (meses × caminhos)"""
+    (semente, caminhos, clientes_mes, meses, valor_plano, valor_extensoes,
+     percentual_comissao, meses_comissao, premissas) = args
+    rng = np.random.default_rng(semente)
+    concentracao = premissas['concentracao']
+
+    # Taxas por caminho: incerteza sobre as premissas do programa
+    conversao = _beta(rng, premissas['conversao_indicacao'], concentracao, caminhos)
+    churn = _beta(rng, premissas['churn_mensal'], concentracao, caminhos)
+    adesao = _beta(rng, premissas['adesao_extensoes'], concentracao, caminhos)
+    cv = premissas['dispersao_indicacoes']
+    forma = 1 / cv ** 2 if cv > 0 else np.inf
+    media_indicacoes = clientes_mes / premissas['conversao_indicacao']
+    taxa = (rng.gamma(forma, media_indicacoes / forma, caminhos) if np.isfinite(forma)
+            else np.full(caminhos, media_indicacoes))
+
+    # Indicações binomial-negativas (Poisson com taxa gama). Converter e aderir às
+    # extensões são sorteios binomiais sobre uma contagem Poisson, o que equivale a
+    # duas contagens Poisson independentes com as taxas já multiplicadas
+    # (matrizes meses × caminhos: cada mês é uma linha contígua)
+    taxa_clientes = taxa * conversao
+    com_extensoes = rng.poisson(taxa_clientes * adesao, (meses, caminhos))
+    sem_extensoes = rng.poisson(taxa_clientes * (1 - adesao), (meses, caminhos))
+    mrr_novo = (com_extensoes + sem_extensoes) * valor_plano + com_extensoes * valor_extensoes
+
+    # Receita e comissão recorrentes: cada coorte decai com a sobrevivência do caminho
+    sobrevivencia = 1 - churn
+    saida_comissao = sobrevivencia ** meses_comissao
+    receita = np.empty((meses, caminhos))
+    comissionavel = np.empty((meses, caminhos))
+    receita_mes = np.zeros(caminhos)
+    base_comissao = np.zeros(caminhos)
+    for t in range(meses):
+        receita_mes *= sobrevivencia
+        receita_mes += mrr_novo[t]
+        base_comissao *= sobrevivencia
+        base_comissao += mrr_novo[t]
+        if t >= meses_comissao:
+            base_comissao -= mrr_novo[t - meses_comissao] * saida_comissao
+        receita[t] = receita_mes
+        comissionavel[t] = base_comissao
+
+    np.cumsum(receita, axis=0, out=receita)
+    np.cumsum(comissionavel, axis=0, out=comissionavel)
+    comissionavel *= percentual_comissao
+    return receita, comissionavel
+
+
+@profiled('monte carlo')
+@memoize('parceria')
+def simulate_partner(clientes_mes, meses, valor_plano, valor_extensoes, percentual_comissao,
+                     meses_comissao, premissas=None, caminhos=None, seed=SEMENTE, paralelo=None):
+    """Bandas de percentis (10/50/90) da receita, comissão e lucro acumulados e do payback
+
+    `premissas` sobrepõe as chaves de config.PARCERIA. Sem `caminhos`, usa
+    premissas['simulacoes'] caminhos, até premissas['celulas_max'] caminhos ×
+    meses (o número usado volta em 'caminhos'). Retorna um dict com
+    matrizes (percentis × meses) e a distribuição do mês de payback (primeiro
+    mês com lucro acumulado não negativo; NaN se não ocorrer no período).
+    """
+    premissas = {**PARCERIA, **(premissas or {})}
+    if not caminhos:
+        caminhos = min(premissas['simulacoes'], max(premissas['celulas_max'] // meses, 1))
+    caminhos = int(caminhos)
+    if paralelo is None:
+        paralelo = cpu_count() > 1 and caminhos * meses >= LIMIAR_PARALELO
+
+    blocos = cpu_count() if paralelo else 1
+    sementes = np.random.SeedSequence(seed).spawn(blocos)
+    tamanhos = [len(b) for b in np.array_split(np.arange(caminhos), blocos)]
+    tarefas = [(s, n, clientes_mes, meses, valor_plano, valor_extensoes,
+                percentual_comissao, meses_comissao, premissas)
+               for s, n in zip(sementes, tamanhos)]
+    if paralelo and blocos > 1:
+        partes = list(get_pool().map(_simulate_chunk, tarefas))
+    else:
+        partes = [_simulate_chunk(t) for t in tarefas]
+    receita, comissao = (np.concatenate(p, axis=1) for p in zip(*partes))
+
+    # Lucro acumulado: os custos do programa são os mesmos em todos os caminhos
+    custos = premissas['custo_implantacao'] + premissas['custo_fixo_mensal'] * np.arange(1, meses + 1)
+    lucro = receita - comissao - custos[:, None]
+
+    # Caminhos sem payback contam como infinito, para não otimizar os percentis
+    positivo = lucro >= 0
+    atingiu = positivo.any(axis=0)
+    payback = np.percentile(np.where(atingiu, positivo.argmax(axis=0) + 1, np.inf),
+                            PERCENTIS, method='inverted_cdf')
+    return {
+        'percentis': PERCENTIS,
+        'receita_acumulada': np.percentile(receita, PERCENTIS, axis=1),
+        'comissao_acumulada': np.percentile(comissao, PERCENTIS, axis=1),
+        'lucro_acumulado': np.percentile(lucro, PERCENTIS, axis=1),
+        'payback': np.where(np.isfinite(payback), payback, np.nan),
+        'prob_payback': float(atingiu.mean()),
+        'caminhos': caminhos
+    }
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Pool de processos compartilhado pelas rotinas que paralelizam trabalho pesado
+"""
+import atexit
+import os
+import threading
+
+_pool = None
+_lock = threading.Lock()
+
+
+def cpu_count():
+    """Número de processadores disponíveis (ao menos 1)"""
+    return os.cpu_count() or 1
+
+
+def get_pool():
+    """Pool de processos 'spawn' criado na primeira necessidade e fechado na saída"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            contexto = multiprocessing.get_context('spawn')
+            _pool = ProcessPoolExecutor(max_workers=cpu_count(), mp_context=contexto)
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
\ No newline at end of file
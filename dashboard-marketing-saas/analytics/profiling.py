@@ -0,0 +1,143 @@
+"""
+Instrumentação por execução: spans de tempo, acertos do cache e memória
+
+Um perfil reúne os spans de uma execução do script (rerun). Com um perfil
+ativo, span() e o decorador profiled registram a duração, os acertos e falhas
+do cache compartilhado feitos pela própria execução (contados no contexto dela,
+não os do processo) e a variação de memória do processo (RSS) de cada trecho,
+aninhados na ordem de execução. Sem perfil ativo o custo é a leitura de
+uma ContextVar. Os perfis podem ser exportados em JSON lines (um span por linha).
+"""
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import time
+
+from .cache import count_context
+
+_perfil = contextvars.ContextVar('perfil', default=None)
+_NULO = contextlib.nullcontext()
+
+try:
+    _PAGINA = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGINA = None
+
+
+def memory_rss():
+    """Memória residente do processo em bytes (0 onde /proc não existe)"""
+    if _PAGINA is None:
+        return 0
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGINA
+    except OSError:
+        return 0
+
+
+def _snapshot(perfil):
+    cache = perfil['_cache']
+    return time.perf_counter(), cache['hits'], cache['misses'], memory_rss()
+
+
+def start_profile(rotulo='execução'):
+    """Inicia o perfil da execução atual; spans passam a ser registrados nele"""
+    perfil = {'rotulo': rotulo, 'inicio': time.time(), 'spans': [], '_nivel': 0,
+              '_cache': {'hits': 0, 'misses': 0}}
+    count_context(perfil['_cache'])
+    perfil['_inicio'] = _snapshot(perfil)
+    perfil['_token'] = _perfil.set(perfil)
+    return perfil
+
+
+def stop_profile(perfil):
+    """Encerra o perfil: totais da execução e spans registrados"""
+    _perfil.reset(perfil.pop('_token'))
+    t0, hits0, misses0, rss0 = perfil.pop('_inicio')
+    t1, hits1, misses1, rss1 = _snapshot(perfil)
+    count_context(None)
+    perfil.pop('_nivel')
+    perfil.pop('_cache')
+    perfil.update(duracao_ms=(t1 - t0) * 1000, cache_hits=hits1 - hits0,
+                  cache_misses=misses1 - misses0, memoria_bytes=rss1 - rss0)
+    return perfil
+
+
+def discard_profile():
+    """Descarta um perfil deixado ativo por uma execução interrompida (st.stop, rerun)"""
+    _perfil.set(None)
+    count_context(None)
+
+
+def active_profile():
+    """Perfil ativo no contexto atual (None sem instrumentação)"""
+    return _perfil.get()
+
+
+@contextlib.contextmanager
+def _record(perfil, nome, atributos):
+    registro = {'nome': nome, 'nivel': perfil['_nivel'], **atributos}
+    perfil['spans'].append(registro)
+    perfil['_nivel'] += 1
+    t0, hits0, misses0, rss0 = _snapshot(perfil)
+    try:
+        yield registro
+    except BaseException as e:
+        registro['erro'] = type(e).__name__
+        raise
+    finally:
+        t1, hits1, misses1, rss1 = _snapshot(perfil)
+        perfil['_nivel'] -= 1
+        registro.update(
+            inicio_ms=(t0 - perfil['_inicio'][0]) * 1000,
+            duracao_ms=(t1 - t0) * 1000,
+            cache_hits=hits1 - hits0,
+            cache_misses=misses1 - misses0,
+            memoria_bytes=rss1 - rss0
+        )
+
+
+def span(nome, **atributos):
+    """Contexto que registra um trecho no perfil ativo (sem efeito sem perfil)"""
+    perfil = _perfil.get()
+    if perfil is None:
+        return _NULO
+    return _record(perfil, nome, atributos)
+
+
+def profiled(nome=None):
+    """Decorador: registra cada chamada como um span (nome padrão: nome da função)"""
+    def decorador(func):
+        rotulo = nome or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            perfil = _perfil.get()
+            if perfil is None:
+                return func(*args, **kwargs)
+            with _record(perfil, rotulo, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorador
+
+
+def profile_lines(perfil, **contexto):
+    """Linhas JSON (uma por span) de um perfil encerrado, com os totais da execução"""
+    execucao = {
+        'execucao': perfil['rotulo'],
+        'inicio': perfil['inicio'],
+        'execucao_ms': perfil['duracao_ms'],
+        **contexto
+    }
+    return [json.dumps({**execucao, **registro}, ensure_ascii=False, default=str)
+            for registro in perfil['spans']]
+
+
+def export_jsonl(perfis, caminho, **contexto):
+    """Acrescenta os spans dos perfis a um arquivo JSON lines"""
+    with open(caminho, 'a', encoding='utf-8') as f:
+        for perfil in perfis:
+            for linha in profile_lines(perfil, **contexto):
+                f.write(linha + '\n')
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Indicadores da parceria com contadores para um pacote configurado
+
+Mesmas contas da aba Parceria Contador, sem Streamlit: valores do pacote lidos
+da grade de comissões, comissão frente ao custo por lead, CAC e CAC:LTV da
+indicação contra os de mídia paga, e a projeção do programa pelo ledger de coortes.
+"""
+import math
+
+from config import CUSTOS_LEAD, LTV_MESES, PLANOS
+
+from .commissions import lookup_commission
+from .ledger import cohort_ledger
+
+
+def _ratio(numerador, denominador):
+    """numerador / denominador, ou NaN com denominador zero ou ausente"""
+    if not denominador or math.isnan(denominador):
+        return math.nan
+    return numerador / denominador
+
+
+def partner_economics(resumo, plano, extensoes, percentual_comissao, meses_comissao):
+    """Indicadores de um pacote (plano + extensões) frente às médias do resumo de KPIs
+
+    `resumo` é o resumo de data.kpis (média por KPI). Retorna um dict de floats
+    (NaN nas razões com denominador zero).
+    """
+    pacote = lookup_commission(plano, extensoes, percentual_comissao, meses_comissao)
+    valor_plano = PLANOS[plano]
+    valor_total = float(pacote['valor_mensal'])
+    comissao_mensal = float(pacote['comissao_mensal'])
+    comissao_total = comissao_mensal * meses_comissao
+    ltv_estimado = valor_total * LTV_MESES
+    cac_ads = float(resumo.loc['CAC', 'media'])
+    ltv_ads = float(resumo.loc['LTV', 'media'])
+
+    # CAC da indicação = total de comissões pagas por cliente
+    economia = cac_ads - comissao_total
+    return {
+        'valor_plano': valor_plano,
+        'valor_extensoes': valor_total - valor_plano,
+        'valor_total_mensal': valor_total,
+        'comissao_mensal': comissao_mensal,
+        'comissao_total': comissao_total,
+        'ltv_estimado': ltv_estimado,
+        'comissao_custo_lead_min': comissao_mensal / CUSTOS_LEAD['min'] * 100,
+        'comissao_custo_lead_max': comissao_mensal / CUSTOS_LEAD['max'] * 100,
+        'comissao_custo_lead_medio': comissao_mensal / CUSTOS_LEAD['medio'] * 100,
+        'cac_ads': cac_ads,
+        'cac_indicacao': comissao_total,
+        'economia_vs_ads': economia,
+        'economia_vs_ads_pct': _ratio(economia, cac_ads) * 100,
+        'cac_ltv_ads': _ratio(ltv_ads, cac_ads),
+        'cac_ltv_indicacao': _ratio(ltv_estimado, comissao_total)
+    }
+
+
+def referral_projection(economia, clientes_mes, meses, percentual_comissao, meses_comissao,
+                        churn=0.0):
+    """Projeção do programa com `clientes_mes` indicações por mês
+
+    `economia` é o resultado de partner_economics. Retorna o ledger de coortes
+    (em 'ledger') e os totais exibidos no simulador de impacto; ROI e margem
+    são NaN sem comissão ou sem receita (ex.: nenhum cliente indicado).
+    """
+    ledger = cohort_ledger(clientes_mes, meses, economia['valor_total_mensal'],
+                           percentual_comissao, meses_comissao, churn)
+    receita, comissao = ledger['receita_mes'], ledger['comissao_mes']
+    total_clientes = clientes_mes * meses
+    comissao_total = float(comissao.sum())
+    receita_total = float(receita.sum())
+    comissao_ultimo = float(comissao[-1]) if len(comissao) else 0.0
+    receita_ultimo = float(receita[-1]) if len(receita) else 0.0
+    return {
+        'ledger': ledger,
+        'total_clientes': total_clientes,
+        'comissao_ultimo_mes': comissao_ultimo,
+        'receita_ultimo_mes': receita_ultimo,
+        'comissao_total': comissao_total,
+        'receita_total': receita_total,
+        'roi_indicacao': _ratio(receita_total - comissao_total, comissao_total) * 100,
+        'economia_total': economia['economia_vs_ads'] * total_clientes,
+        'margem_ultimo_mes': _ratio(receita_ultimo - comissao_ultimo, receita_ultimo) * 100
+    }
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+Relatório headless: KPIs, benchmarks, forecasts e simulações sem Streamlit
+
+Reúne em um dict serializável em JSON os mesmos números das abas do dashboard,
+para jobs em lote (por exemplo, um relatório noturno por tenant) sem subir um
+servidor Streamlit.
+
+Uso (na raiz do projeto):
+    python -m analytics.report --months Mai/25,Set/25 --format json
+    python -m analytics.report --months Mai/25:Set/25 --all-tenants --output relatorio.json
+
+Com vários tenants, o erro de um tenant (fonte ausente, meses sem dados...) é
+informado em stderr e os demais entram no relatório; o código de saída é 1.
+"""
+import argparse
+import json
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+
+from config import PLANOS
+
+from .models import AUTOMATICO, MODELOS, forecast_with_models
+from .partner import simulate_partner
+from .referral import partner_economics, referral_projection
+
+KPIS_FORECAST = ["Leads", "Clientes Web", "Receita Web", "CAC", "LTV", "ROI (%)"]
+
+# Parâmetros padrão da parceria (os mesmos valores iniciais da aba Parceria Contador)
+PARCERIA_PADRAO = {
+    'plano': list(PLANOS)[1],
+    'extensoes': (),
+    'percentual_comissao': 0.15,
+    'meses_comissao': 6,
+    'clientes_mes': 10,
+    'meses': 6,
+    'churn': 0.0
+}
+
+
+def benchmark_status(resumo, benchmarks):
+    """Posição da média de cada KPI frente à faixa do benchmark ('abaixo', 'na faixa', 'acima')"""
+    status = {}
+    for kpi, faixa in benchmarks.items():
+        if kpi not in resumo.index:
+            continue
+        media = float(resumo.loc[kpi, 'media'])
+        if math.isnan(media):
+            posicao = None
+        elif media < faixa['min']:
+            posicao = 'abaixo'
+        elif media > faixa['max']:
+            posicao = 'acima'
+        else:
+            posicao = 'na faixa'
+        status[kpi] = {'media': media, **faixa, 'status': posicao}
+    return status
+
+
+def forecast_section(df, horizon, modelo=AUTOMATICO, nivel=0.95, kpis=KPIS_FORECAST):
+    """Forecast dos KPIs com cenários por bootstrap e comparação de modelos"""
+    from data.periods import next_labels
+
+    resultados, comparacao = forecast_with_models(df, list(kpis), horizon, modelo, nivel)
+    return {
+        'meses': next_labels(df['Mês'].iloc[-1], horizon),
+        'nivel': nivel,
+        'kpis': resultados,
+        'comparacao_modelos': comparacao
+    }
+
+
+def partner_section(resumo, parametros=None, monte_carlo=False, caminhos=None):
+    """Pacote, projeção por coortes e (opcional) Monte Carlo da parceria"""
+    p = {**PARCERIA_PADRAO, **(parametros or {})}
+    economia = partner_economics(resumo, p['plano'], list(p['extensoes']),
+                                 p['percentual_comissao'], p['meses_comissao'])
+    projecao = referral_projection(economia, p['clientes_mes'], p['meses'],
+                                   p['percentual_comissao'], p['meses_comissao'], p['churn'])
+    ledger = projecao.pop('ledger')
+    secao = {
+        'parametros': p,
+        'pacote': economia,
+        'projecao': {
+            **projecao,
+            'receita_mes': ledger['receita_mes'],
+            'comissao_mes': ledger['comissao_mes'],
+            'passivo': ledger['passivo']
+        }
+    }
+    if monte_carlo:
+        # Premissas incertas de config.PARCERIA, como os valores iniciais da aba
+        secao['monte_carlo'] = simulate_partner(
+            p['clientes_mes'], p['meses'], economia['valor_plano'], economia['valor_extensoes'],
+            p['percentual_comissao'], p['meses_comissao'], caminhos=caminhos
+        )
+    return secao
+
+
+def build_report(df, months=None, benchmarks=None, horizon=3, modelo=AUTOMATICO, nivel=0.95,
+                 parceria=None, monte_carlo=False, caminhos=None):
+    """Relatório completo de um conjunto de dados mensais
+
+    `months` restringe os KPIs, benchmarks e a parceria aos meses pedidos (None:
+    todos; lista vazia é ValueError). O forecast usa o histórico completo, como
+    na aba Forecast; `parceria` sobrepõe chaves de PARCERIA_PADRAO. Os valores podem conter arrays NumPy e
+    NaN: use to_jsonable antes de serializar.
+    """
+    from data.kpis import summary_for
+    from data.tenants import tenant_benchmarks
+
+    selecionados = df['Mês'].tolist() if months is None else list(months)
+    if not selecionados:
+        raise ValueError("Nenhum mês selecionado")
+    desconhecidos = [m for m in selecionados if m not in set(df['Mês'])]
+    if desconhecidos:
+        raise ValueError(f"Meses sem dados: {', '.join(desconhecidos)}")
+    resumo = summary_for(df, selecionados)
+    return {
+        'meses': selecionados,
+        'kpis': resumo.to_dict(orient='index'),
+        'benchmarks': benchmark_status(resumo, benchmarks or tenant_benchmarks()),
+        'forecast': forecast_section(df, horizon, modelo, nivel),
+        'parceria': partner_section(resumo, parceria, monte_carlo, caminhos)
+    }
+
+
+def to_jsonable(valor):
+    """Converte arrays e escalares NumPy em tipos JSON; NaN e infinito viram None
+
+    Escalares float32 (ex.: a razão comissão/custo do lead da grade de comissões)
+    saem com os dígitos mínimos que os identificam (4.3, não 4.300000190734863).
+    """
+    if isinstance(valor, dict):
+        return {str(k): to_jsonable(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple, np.ndarray)):
+        return [to_jsonable(v) for v in valor]
+    if isinstance(valor, (np.integer, np.bool_)):
+        return valor.item()
+    if isinstance(valor, np.floating) and valor.dtype.itemsize < 8:
+        valor = float(np.format_float_scientific(valor, unique=True))
+    if isinstance(valor, (float, np.floating)):
+        valor = float(valor)
+        return valor if math.isfinite(valor) else None
+    return valor
+
+
+def expand_months(texto, disponiveis):
+    """Meses de '--months': lista separada por vírgulas, com intervalos 'Mai/25:Set/25'
+
+    Um intervalo sem nenhum mês em `disponiveis`, ou um texto sem meses, é ValueError.
+    """
+    from data.periods import label_to_ordinal
+
+    ordinais = {label_to_ordinal(m): m for m in disponiveis}
+    meses = []
+    for parte in filter(None, (p.strip() for p in texto.split(','))):
+        if ':' in parte:
+            inicio, fim = (label_to_ordinal(x.strip()) for x in parte.split(':'))
+            intervalo = [ordinais[o] for o in sorted(ordinais) if inicio <= o <= fim]
+            if not intervalo:
+                raise ValueError(f"Meses sem dados: {parte}")
+            meses.extend(intervalo)
+        else:
+            meses.append(parte)
+    if not meses:
+        raise ValueError(f"Nenhum mês em '{texto}'")
+    return list(dict.fromkeys(meses))
+
+
+def _summary_csv(relatorio):
+    """Tabela de KPIs (resumo + status do benchmark) em CSV"""
+    linhas = pd.DataFrame(relatorio['kpis']).T
+    status = {kpi: b['status'] for kpi, b in relatorio['benchmarks'].items()}
+    linhas['status_benchmark'] = pd.Series(status)
+    return linhas.rename_axis('kpi').to_csv()
+
+
+def main(argv=None):
+    from data.loader import load_data
+    from data.tenants import get_tenant, load_tenants
+
+    parser = argparse.ArgumentParser(description="Relatório de KPIs, forecasts e simulações sem Streamlit")
+    parser.add_argument('--months', help="meses: 'Mai/25,Set/25' ou intervalo 'Mai/25:Set/25' (padrão: todos)")
+    parser.add_argument('--tenant', action='append', help="tenant (pode repetir)")
+    parser.add_argument('--all-tenants', action='store_true', help="todos os tenants configurados")
+    parser.add_argument('--source', help="arquivo/diretório de dados (sobrepõe a fonte configurada)")
+    parser.add_argument('--format', choices=['json', 'csv'], default='json',
+                        help="json: relatório completo; csv: tabela de KPIs")
+    parser.add_argument('--horizon', type=int, default=3, help="meses de forecast")
+    parser.add_argument('--model', default=AUTOMATICO, choices=[AUTOMATICO] + list(MODELOS))
+    parser.add_argument('--level', type=float, default=0.95, help="nível de confiança do forecast")
+    parser.add_argument('--monte-carlo', action='store_true', help="inclui a simulação Monte Carlo da parceria")
+    parser.add_argument('--paths', type=int, help="caminhos da simulação Monte Carlo")
+    parser.add_argument('--output', help="arquivo de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    tenants = list(load_tenants()) if args.all_tenants else (args.tenant or [None])
+    relatorios = {}
+    erros = {}
+    for chave in tenants:
+        try:
+            tenant = get_tenant(chave)
+            df = load_data(args.source, tenant=chave)
+            meses = expand_months(args.months, df['Mês']) if args.months is not None else None
+            relatorios[chave] = build_report(
+                df, meses, tenant['benchmarks'], args.horizon, args.model, args.level,
+                monte_carlo=args.monte_carlo, caminhos=args.paths
+            )
+        except (ValueError, OSError) as e:
+            # Um tenant com problema (inclusive fonte ausente) não interrompe os demais
+            erros[chave] = f"{chave}: {e}" if chave else str(e)
+    if not relatorios:
+        parser.error('; '.join(erros.values()))
+    for erro in erros.values():
+        print(f"erro: {erro}", file=sys.stderr)
+
+    if args.format == 'csv':
+        saida = ''.join(
+            (f"# tenant: {chave}\n" if chave is not None else '') + _summary_csv(r)
+            for chave, r in relatorios.items()
+        )
+    else:
+        unico = len(relatorios) == 1 and not args.all_tenants
+        conteudo = next(iter(relatorios.values())) if unico else relatorios
+        saida = json.dumps(to_jsonable(conteudo), ensure_ascii=False, indent=2) + '\n'
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(saida)
+    else:
+        sys.stdout.write(saida)
+    return 1 if erros else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
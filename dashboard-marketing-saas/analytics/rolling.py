@@ -0,0 +1,207 @@
+"""
+Janelas móveis dos KPIs: média, soma, volatilidade e taxa de variação
+
+Para uma janela de `janela` períodos (config.JANELAS: 3, 6 e 12), cada KPI tem:
+    média          média móvel; nos KPIs de razão (CAC, taxas, ROI...) a razão
+                   das somas da janela, como nos cards (data.aggregation)
+    soma           soma móvel (apenas colunas aditivas)
+    volatilidade   desvio padrão amostral dos valores da janela
+    variação       taxa de variação (%) contra o valor de `janela` períodos antes
+Janelas incompletas (início da série) resultam em NaN; valores ausentes ficam
+fora da volatilidade e contam zero nas somas.
+
+O cálculo em lote usa somas acumuladas (range_queries para médias e somas):
+cada ponto custa O(1), sem refazer a janela, inclusive em séries diárias de
+vários anos. Para séries que recebem períodos novos, rolling_start e
+rolling_push mantêm o estado da janela e calculam as estatísticas de cada novo
+período em O(1), com os resultados do cálculo em lote (a menos de arredondamento).
+"""
+import numpy as np
+import pandas as pd
+
+from .cache import cache_get, cache_set
+
+NAMESPACE = 'janelas'
+
+ESTATISTICAS = {
+    'media': 'média móvel',
+    'soma': 'soma móvel',
+    'volatilidade': 'volatilidade',
+    'variacao': 'variação (%)'
+}
+
+# Colunas aditivas (somas fazem sentido): as colunas base e o total de ads
+ADITIVAS = [
+    'Sessões', 'Primeira Visita', 'Leads', 'Clientes Web',
+    'Receita Web', 'Custo Meta', 'Custo Google', 'Total Ads'
+]
+
+
+def rolling_column(kpi, estatistica):
+    """Nome da coluna de uma estatística móvel: 'CAC · média móvel'"""
+    return f"{kpi} · {ESTATISTICAS[estatistica]}"
+
+
+def _window_sums(valores, janela):
+    """Somas de cada janela terminada em cada linha, por somas acumuladas (NaN nas incompletas)"""
+    acumulado = np.zeros((len(valores) + 1,) + valores.shape[1:])
+    np.cumsum(valores, axis=0, out=acumulado[1:])
+    somas = np.full(valores.shape, np.nan)
+    if len(valores) >= janela:
+        somas[janela - 1:] = acumulado[janela:] - acumulado[:-janela]
+    return somas
+
+
+def _first_valid(valores):
+    """Primeiro valor não ausente de cada coluna (referência que estabiliza as somas de quadrados)"""
+    validos = ~np.isnan(valores)
+    primeiro = validos.argmax(axis=0)
+    referencia = valores[primeiro, np.arange(valores.shape[1])]
+    return np.where(validos.any(axis=0), referencia, 0.0)
+
+
+def _std(soma, quadrados, contagem):
+    """Desvio padrão amostral a partir de somas (deslocadas) e contagens de valores"""
+    variancia = np.divide(quadrados - soma * soma / np.maximum(contagem, 1), contagem - 1,
+                          out=np.full(np.shape(soma), np.nan), where=contagem > 1)
+    return np.sqrt(np.maximum(variancia, 0.0))
+
+
+def _change(atual, anterior):
+    """Variação (%) de `anterior` para `atual`; base zero ou ausente resulta em NaN"""
+    return np.divide(atual - anterior, anterior, out=np.full(np.shape(atual), np.nan),
+                     where=anterior != 0) * 100
+
+
+def _compute(df, janela, kpis):
+    from data.aggregation import range_queries
+
+    n = len(df)
+    fim = np.arange(1, n + 1)
+    inicio = np.maximum(fim - janela, 0)
+    incompleta = fim < janela
+    medias = range_queries(df, inicio, fim)
+    totais = range_queries(df, inicio, fim, totais=True)
+    valores = df[kpis].to_numpy(dtype=float)
+
+    validos = ~np.isnan(valores)
+    deslocados = np.where(validos, valores - _first_valid(valores), 0.0)
+    volatilidade = _std(_window_sums(deslocados, janela), _window_sums(deslocados ** 2, janela),
+                        _window_sums(validos.astype(float), janela))
+    anteriores = np.full(valores.shape, np.nan)
+    anteriores[janela:] = valores[:-janela]
+    variacao = _change(valores, anteriores)
+
+    colunas = {}
+    for j, kpi in enumerate(kpis):
+        if kpi in medias.columns:
+            media = medias[kpi].to_numpy(dtype=float)
+        else:
+            media = _window_sums(np.where(validos[:, j], valores[:, j], 0.0), janela) / janela
+        colunas[rolling_column(kpi, 'media')] = np.where(incompleta, np.nan, media)
+        if kpi in ADITIVAS and kpi in totais.columns:
+            colunas[rolling_column(kpi, 'soma')] = np.where(incompleta, np.nan, totais[kpi].to_numpy())
+        colunas[rolling_column(kpi, 'volatilidade')] = volatilidade[:, j]
+        colunas[rolling_column(kpi, 'variacao')] = variacao[:, j]
+    return pd.DataFrame(colunas, index=df.index)
+
+
+def rolling_stats(df, janela, kpis=None):
+    """Estatísticas móveis de `janela` períodos de cada KPI (colunas de rolling_column)
+
+    `kpis` padrão: todas as colunas numéricas de `df`. O resultado tem o índice
+    de `df`, fica em cache pela versão dos dados e não deve ser alterado.
+    """
+    from data.kpis import data_version
+
+    kpis = [c for c in (kpis or df.columns) if c != 'Mês' and c in df.columns]
+    chave = (data_version(df), janela, tuple(kpis))
+    encontrado, resultado = cache_get(NAMESPACE, chave)
+    if not encontrado:
+        resultado = _compute(df, janela, kpis)
+        cache_set(NAMESPACE, chave, resultado)
+    return resultado
+
+
+def rolling_overlay(historico, recorte, janela, kpis=None):
+    """Estatísticas móveis das linhas de `recorte`, calculadas sobre a série completa `historico`
+
+    As janelas do início do recorte usam os períodos anteriores a ele. Retorna
+    um DataFrame com a coluna 'Mês' do recorte e as colunas de rolling_stats.
+    """
+    from data.kpis import data_version
+
+    chave = ('recorte', data_version(historico), data_version(recorte), janela,
+             tuple(kpis) if kpis else None)
+    encontrado, resultado = cache_get(NAMESPACE, chave)
+    if not encontrado:
+        estatisticas = rolling_stats(historico, janela, kpis)
+        posicoes = historico.index.get_indexer(recorte.index)
+        resultado = estatisticas.iloc[np.maximum(posicoes, 0)].set_axis(recorte.index)
+        resultado.loc[posicoes < 0] = np.nan
+        resultado.insert(0, 'Mês', recorte['Mês'].to_numpy())
+        cache_set(NAMESPACE, chave, resultado)
+    return resultado
+
+
+def rolling_start(janela, colunas):
+    """Estado vazio de uma janela móvel sobre `colunas` (na ordem dos valores de rolling_push)"""
+    k = len(colunas)
+    return {
+        'janela': janela,
+        'colunas': list(colunas),
+        'n': 0,
+        'anel': np.full((janela + 1, k), np.nan),  # últimos janela + 1 períodos
+        'referencia': np.full(k, np.nan),
+        'totais': np.zeros(k),
+        'soma': np.zeros(k),
+        'quadrados': np.zeros(k),
+        'validos': np.zeros(k)
+    }
+
+
+def rolling_push(estado, valores):
+    """Acrescenta um período (valores na ordem de `colunas`) e retorna suas estatísticas em O(1)
+
+    Retorna um dict rolling_column(kpi, estatistica) -> valor, como uma linha
+    de rolling_stats.
+    """
+    from data.kpis import compute_kpis
+    from data.sources import COLUNAS_BASE
+
+    janela, colunas, anel = estado['janela'], estado['colunas'], estado['anel']
+    x = np.asarray(valores, dtype=float)
+    valido = ~np.isnan(x)
+    referencia = estado['referencia']
+    np.copyto(referencia, x, where=np.isnan(referencia) & valido)
+
+    # Entra o período novo; sai o de `janela` períodos atrás, base da taxa de variação
+    anterior = anel[(estado['n'] - janela) % (janela + 1)].copy() if estado['n'] >= janela else None
+    for sinal, v in ((1, x), (-1, anterior)):
+        if v is None:
+            continue
+        ok = ~np.isnan(v)
+        d = np.where(ok, v - referencia, 0.0)
+        estado['totais'] += sinal * np.where(ok, v, 0.0)
+        estado['soma'] += sinal * d
+        estado['quadrados'] += sinal * d * d
+        estado['validos'] += sinal * ok
+    anel[estado['n'] % (janela + 1)] = x
+    estado['n'] += 1
+
+    completa = estado['n'] >= janela
+    medias = dict(zip(colunas, estado['totais'] / janela))
+    if all(c in medias for c in COLUNAS_BASE):
+        derivados = compute_kpis({c: np.array([medias[c]]) for c in COLUNAS_BASE})
+        medias.update({c: float(v[0]) for c, v in derivados.items() if c in medias})
+    volatilidade = _std(estado['soma'], estado['quadrados'], estado['validos'])
+    variacao = _change(x, anterior) if anterior is not None else np.full(len(colunas), np.nan)
+
+    linha = {}
+    for j, kpi in enumerate(colunas):
+        linha[rolling_column(kpi, 'media')] = medias[kpi] if completa else np.nan
+        if kpi in ADITIVAS:
+            linha[rolling_column(kpi, 'soma')] = estado['totais'][j] if completa else np.nan
+        linha[rolling_column(kpi, 'volatilidade')] = volatilidade[j] if completa else np.nan
+        linha[rolling_column(kpi, 'variacao')] = variacao[j]
+    return linha
\ No newline at end of file
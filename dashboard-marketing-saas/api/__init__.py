@@ -0,0 +1,9 @@
+"""
+API HTTP dos KPIs, benchmarks, forecasts e simulação da parceria
+"""
+
+from .app import app
+
+__all__ = [
+    'app'
+]
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""
+Servidor da API: python -m api [--host 0.0.0.0] [--port 8000] [--workers 1]
+"""
+import argparse
+
+import uvicorn
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API HTTP do Dashboard Marketing SaaS ERP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processos (cada um com seu próprio cache)")
+    args = parser.parse_args(argv)
+    uvicorn.run('api:app', host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
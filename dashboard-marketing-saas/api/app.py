@@ -0,0 +1,255 @@
+"""
+API HTTP (ASGI/Starlette) com os KPIs, benchmarks, forecasts e a simulação da parceria
+
+As respostas usam as mesmas funções do dashboard e do relatório headless
+(analytics.report). Cada resposta tem um ETag derivado da rota, do tenant, da
+versão dos dados e dos parâmetros: um GET com If-None-Match igual recebe 304
+sem recálculo. O JSON já serializado fica no cache compartilhado do processo
+(namespace 'api'), e requisições simultâneas pelo mesmo recurso esperam um
+único cálculo, feito no pool de threads para não bloquear o event loop.
+
+Uso:
+    python -m api --port 8000
+    uvicorn api:app --workers 4
+"""
+import asyncio
+import json
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from analytics.cache import cache_get, cache_set, content_key
+from analytics.models import AUTOMATICO, MODELOS
+from analytics.report import (
+    PARCERIA_PADRAO,
+    benchmark_status,
+    expand_months,
+    forecast_section,
+    partner_section,
+    to_jsonable
+)
+from config import API, EXTENSOES, GRADE_COMISSAO, MULTI_TENANT, PLANOS, SIMULADOR
+from data.kpis import data_version, summary_for
+from data.loader import load_data
+from data.tenants import get_tenant
+
+NAMESPACE = 'api'
+
+# KPIs dos cards principais do dashboard (render_main_metrics)
+METRICAS_PRINCIPAIS = ['CAC', 'LTV', 'ROI (%)', 'TC Leads (%)']
+
+_em_andamento = {}
+
+
+def _tenant_data(chave):
+    """Configuração do tenant, dados e versão dos dados"""
+    tenant = get_tenant(chave)
+    df = load_data(tenant=chave)
+    return tenant, df, data_version(df)
+
+
+def _months(request, df):
+    texto = request.query_params.get('months')
+    meses = expand_months(texto, df['Mês']) if texto is not None else df['Mês'].tolist()
+    desconhecidos = [m for m in meses if m not in set(df['Mês'])]
+    if desconhecidos:
+        raise ValueError(f"Meses sem dados: {', '.join(desconhecidos)}")
+    return meses
+
+
+def _value(nome, valor, tipo, minimo, maximo):
+    """`valor` convertido para `tipo` e dentro de [minimo, maximo] (senão ValueError)"""
+    try:
+        convertido = tipo(valor)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Parâmetro '{nome}' inválido") from None
+    # Booleanos e números fracionários não são aceitos como inteiros
+    if isinstance(valor, bool) or (isinstance(valor, float) and convertido != valor):
+        raise ValueError(f"Parâmetro '{nome}' inválido")
+    if not minimo <= convertido <= maximo:
+        raise ValueError(f"Parâmetro '{nome}' fora da faixa [{minimo}, {maximo}]")
+    return convertido
+
+
+def _number(request, nome, tipo, padrao, minimo, maximo):
+    return _value(nome, request.query_params.get(nome, padrao), tipo, minimo, maximo)
+
+
+# Faixas dos parâmetros numéricos da simulação, as mesmas dos sliders da aba Parceria
+FAIXAS_SIMULACAO = {
+    'percentual_comissao': (float, GRADE_COMISSAO['percentual_min'] / 100,
+                            GRADE_COMISSAO['percentual_max'] / 100),
+    'meses_comissao': (int, GRADE_COMISSAO['meses_min'], GRADE_COMISSAO['meses_max']),
+    'clientes_mes': (int, SIMULADOR['clientes_min'], SIMULADOR['clientes_max']),
+    'meses': (int, SIMULADOR['meses_min'], SIMULADOR['meses_max']),
+    'churn': (float, 0.0, SIMULADOR['churn_max'] / 100),
+    'caminhos': (int, 1, API['max_caminhos'])
+}
+
+
+def _simulation(corpo):
+    """Parâmetros da simulação validados a partir do corpo JSON (chaves de PARCERIA_PADRAO)"""
+    desconhecidas = set(corpo) - set(PARCERIA_PADRAO) - {'monte_carlo', 'caminhos'}
+    if desconhecidas:
+        raise ValueError(f"Parâmetros desconhecidos: {', '.join(sorted(desconhecidas))}")
+    params = {nome: _value(nome, corpo[nome], *faixa)
+              for nome, faixa in FAIXAS_SIMULACAO.items() if corpo.get(nome) is not None}
+
+    plano = corpo.get('plano', PARCERIA_PADRAO['plano'])
+    if not isinstance(plano, str):
+        raise ValueError("'plano' deve ser o nome de um plano")
+    if plano not in PLANOS:
+        raise ValueError(f"Plano desconhecido: {plano}")
+    extensoes = corpo.get('extensoes', [])
+    if not isinstance(extensoes, list) or not all(isinstance(e, str) for e in extensoes):
+        raise ValueError("'extensoes' deve ser uma lista de nomes de extensões")
+    desconhecidas = [e for e in extensoes if e not in EXTENSOES]
+    if desconhecidas:
+        raise ValueError(f"Extensões desconhecidas: {', '.join(desconhecidas)}")
+    monte_carlo = corpo.get('monte_carlo', False)
+    if not isinstance(monte_carlo, bool):
+        raise ValueError("'monte_carlo' deve ser true ou false")
+    return {**params, 'plano': plano, 'extensoes': extensoes, 'monte_carlo': monte_carlo,
+            'caminhos': params.get('caminhos')}
+
+
+def _etag_matches(cabecalho, etag):
+    """If-None-Match contém o ETag (comparação fraca, como pede a RFC 9110 para GET)"""
+    if not cabecalho:
+        return False
+    candidatos = [c.strip().removeprefix('W/') for c in cabecalho.split(',')]
+    return '*' in candidatos or etag in candidatos
+
+
+async def _single_flight(chave, calcular):
+    """Executa `calcular` no pool de threads uma única vez por chave em andamento"""
+    tarefa = _em_andamento.get(chave)
+    if tarefa is None:
+        tarefa = asyncio.ensure_future(run_in_threadpool(calcular))
+        _em_andamento[chave] = tarefa
+        tarefa.add_done_callback(lambda _: _em_andamento.pop(chave, None))
+    return await asyncio.shield(tarefa)
+
+
+async def _respond(request, parametros, calcular):
+    """Resposta JSON com ETag, 304 condicional e cache do corpo serializado
+
+    `parametros(df)` valida a requisição e devolve os parâmetros que entram na
+    chave; `calcular(tenant, df, params)` produz o conteúdo da resposta.
+    """
+    chave_tenant = request.query_params.get(MULTI_TENANT['parametro'])
+    try:
+        tenant, df, versao = await run_in_threadpool(_tenant_data, chave_tenant)
+    except ValueError as e:
+        return JSONResponse({'erro': str(e)}, status_code=404)
+    except OSError as e:
+        # Fonte do tenant ausente ou ilegível
+        return JSONResponse({'erro': f"Dados indisponíveis: {e}"}, status_code=503)
+    try:
+        params = parametros(df)
+    except (ValueError, TypeError) as e:
+        return JSONResponse({'erro': str(e)}, status_code=400)
+
+    chave = content_key(request.url.path, chave_tenant, versao, sorted(params.items()))
+    cabecalhos = {
+        'ETag': f'"{chave}"',
+        'Cache-Control': f"private, max-age={API['max_age']}",
+        'Vary': 'If-None-Match'
+    }
+    if request.method == 'GET' and _etag_matches(request.headers.get('if-none-match'), cabecalhos['ETag']):
+        return Response(status_code=304, headers=cabecalhos)
+
+    encontrado, corpo = cache_get(NAMESPACE, chave)
+    if not encontrado:
+        def serializar():
+            conteudo = {'tenant': chave_tenant, 'versao_dados': versao,
+                        **calcular(tenant, df, params)}
+            corpo = json.dumps(to_jsonable(conteudo), ensure_ascii=False).encode('utf-8')
+            cache_set(NAMESPACE, chave, corpo)
+            return corpo
+        try:
+            corpo = await _single_flight(chave, serializar)
+        except (ValueError, TypeError) as e:
+            return JSONResponse({'erro': str(e)}, status_code=400)
+        except KeyError as e:
+            return JSONResponse({'erro': f"Valor desconhecido: {e.args[0]}"}, status_code=400)
+    return Response(corpo, media_type='application/json', headers=cabecalhos)
+
+
+async def kpis(request):
+    """Resumo dos KPIs dos meses pedidos e os cards principais"""
+    def calcular(tenant, df, params):
+        resumo = summary_for(df, params['meses'])
+        return {
+            'meses': params['meses'],
+            'principais': resumo.loc[METRICAS_PRINCIPAIS, ['media', 'variacao']].to_dict(orient='index'),
+            'kpis': resumo.to_dict(orient='index')
+        }
+    return await _respond(request, lambda df: {'meses': _months(request, df)}, calcular)
+
+
+async def benchmarks(request):
+    """Status de cada KPI frente ao perfil de benchmark do tenant"""
+    def calcular(tenant, df, params):
+        resumo = summary_for(df, params['meses'])
+        return {'meses': params['meses'], 'benchmarks': benchmark_status(resumo, tenant['benchmarks'])}
+    return await _respond(request, lambda df: {'meses': _months(request, df)}, calcular)
+
+
+async def forecast(request):
+    """Forecast de um KPI com cenários otimista/conservador (histórico completo)"""
+    kpi = request.path_params['kpi']
+
+    def parametros(df):
+        if kpi == 'Mês' or kpi not in df.columns:
+            raise ValueError(f"KPI desconhecido: {kpi}")
+        modelo = request.query_params.get('model', AUTOMATICO)
+        if modelo != AUTOMATICO and modelo not in MODELOS:
+            raise ValueError(f"Modelo desconhecido: {modelo}")
+        return {
+            'horizon': _number(request, 'horizon', int, 3, 1, API['max_horizonte']),
+            'level': _number(request, 'level', float, 0.95, 0.5, 0.999),
+            'model': modelo
+        }
+
+    def calcular(tenant, df, params):
+        secao = forecast_section(df, params['horizon'], params['model'], params['level'], kpis=[kpi])
+        if secao['kpis'][kpi] is None:
+            raise ValueError(f"Série de {kpi} com valores ausentes")
+        return {'kpi': kpi, 'meses': secao['meses'], 'nivel': secao['nivel'],
+                **secao['kpis'][kpi], 'comparacao_modelos': secao['comparacao_modelos'][kpi]}
+    return await _respond(request, parametros, calcular)
+
+
+async def partner_simulate(request):
+    """Simulação da parceria (corpo JSON com as chaves de PARCERIA_PADRAO, monte_carlo e caminhos)"""
+    try:
+        corpo = await request.json() if await request.body() else {}
+    except json.JSONDecodeError:
+        return JSONResponse({'erro': "Corpo JSON inválido"}, status_code=400)
+    if not isinstance(corpo, dict):
+        return JSONResponse({'erro': "Corpo JSON deve ser um objeto"}, status_code=400)
+
+    def parametros(df):
+        return {**_simulation(corpo), 'selecao': _months(request, df)}
+
+    def calcular(tenant, df, params):
+        simulacao = {k: v for k, v in params.items() if k in PARCERIA_PADRAO}
+        resumo = summary_for(df, params['selecao'])
+        return partner_section(resumo, simulacao, params['monte_carlo'], params['caminhos'])
+    return await _respond(request, parametros, calcular)
+
+
+async def health(request):
+    return JSONResponse({'status': 'ok'})
+
+
+app = Starlette(routes=[
+    Route('/health', health),
+    Route('/kpis', kpis),
+    Route('/benchmarks', benchmarks),
+    Route('/forecast/{kpi}', forecast),
+    Route('/partner/simulate', partner_simulate, methods=['POST'])
+])
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Benchmark de inicialização do dashboard baseado em `python -X importtime`
+
+Importa, em processos Python novos, os mesmos módulos que o app.py importa na
+inicialização e mede o tempo cumulativo dos pacotes do projeto (config, data,
+analytics, components), descontando streamlit e pandas, que são pagos de
+qualquer forma. O resultado é comparado com o orçamento versionado em
+import_budget.json, que também lista módulos que não podem ser carregados na
+inicialização (dependências pesadas que devem ser importadas sob demanda).
+
+Uso (na raiz do projeto):
+    python benchmarks/importtime.py [--repeticoes 5] [--json]
+
+Retorna código 1 quando o orçamento é excedido.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ORCAMENTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_budget.json')
+
+# Importados antes dos pacotes do projeto: custo fixo do Streamlit/pandas
+BASE = ['streamlit', 'pandas']
+PACOTES = ['config', 'data', 'analytics', 'components']
+
+
+def parse_importtime(saida):
+    """Linhas do -X importtime: lista de (módulo, próprio µs, cumulativo µs, nível)"""
+    linhas = []
+    for linha in saida.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, cumulativo, nome = linha[len('import time:'):].split('|')
+        nivel = (len(nome) - len(nome.lstrip())) // 2
+        linhas.append((nome.strip(), int(proprio), int(cumulativo), nivel))
+    return linhas
+
+
+def measure_once():
+    """Uma inicialização em processo novo: tempos (ms) por pacote e módulos carregados"""
+    codigo = f"import {', '.join(BASE)}; import {', '.join(PACOTES)}"
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+    linhas = parse_importtime(resultado.stderr)
+    # Cada pacote aparece no nível 0 quando importado pelo comando; um pacote já
+    # carregado por outro do projeto aparece aninhado e entra no custo deste
+    topo = {nome: cumulativo / 1000 for nome, _, cumulativo, nivel in linhas if nivel == 0}
+    return {
+        'base_ms': sum(topo.get(p, 0.0) for p in BASE),
+        'pacotes_ms': {p: topo.get(p, 0.0) for p in PACOTES},
+        'projeto_ms': sum(topo.get(p, 0.0) for p in PACOTES),
+        'total_ms': sum(topo.values()),
+        'modulos': {nome for nome, _, _, _ in linhas}
+    }
+
+
+def run(repeticoes=5):
+    """Mediana de várias inicializações e verificação do orçamento"""
+    medidas = [measure_once() for _ in range(repeticoes)]
+    with open(ORCAMENTO, encoding='utf-8') as f:
+        orcamento = json.load(f)
+
+    resumo = {
+        'base_ms': statistics.median(m['base_ms'] for m in medidas),
+        'projeto_ms': statistics.median(m['projeto_ms'] for m in medidas),
+        'total_ms': statistics.median(m['total_ms'] for m in medidas),
+        'pacotes_ms': {p: statistics.median(m['pacotes_ms'][p] for m in medidas) for p in PACOTES}
+    }
+    carregados = set().union(*(m['modulos'] for m in medidas))
+    proibidos = [
+        p for p in orcamento['proibidos']
+        if any(m == p or m.startswith(p + '.') for m in carregados)
+    ]
+    violacoes = []
+    if resumo['projeto_ms'] > orcamento['projeto_ms']:
+        violacoes.append(f"pacotes do projeto: {resumo['projeto_ms']:.0f} ms "
+                         f"(orçamento {orcamento['projeto_ms']} ms)")
+    if proibidos:
+        violacoes.append(f"módulos carregados na inicialização: {', '.join(proibidos)}")
+    return {**resumo, 'orcamento': orcamento, 'violacoes': violacoes}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo de importação na inicialização do dashboard")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help="saída em JSON")
+    args = parser.parse_args(argv)
+
+    resultado = run(args.repeticoes)
+    if args.json:
+        print(json.dumps(resultado, ensure_ascii=False, indent=2))
+    else:
+        print(f"streamlit + pandas: {resultado['base_ms']:.0f} ms")
+        for pacote, ms in resultado['pacotes_ms'].items():
+            print(f"  {pacote:<12} {ms:6.1f} ms")
+        print(f"projeto: {resultado['projeto_ms']:.0f} ms "
+              f"(orçamento {resultado['orcamento']['projeto_ms']} ms)")
+        for violacao in resultado['violacoes']:
+            print(f"❌ {violacao}")
+    return 1 if resultado['violacoes'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
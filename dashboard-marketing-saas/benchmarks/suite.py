@@ -0,0 +1,359 @@
+"""
+Suíte de benchmarks dos caminhos quentes do dashboard, com histórico e comparação
+
+Mede, em dados sintéticos de 5, 1 mil, 100 mil e 10 milhões de linhas:
+    load_data       agregação mensal de uma fonte Parquet diária de data.synthetic (cache frio)
+
+e, no frame mensal do dashboard com min(linhas, MESES_MAX) meses (100 anos: os
+rótulos 'Mmm/AA' só se repetem a cada século; o número de meses fica no
+resultado de cada escala):
+    filter_data     filtro dos meses selecionados (metade do período)
+    resumo          resumo dos KPIs dos cards (render_main_metrics)
+    intervalos      10 mil consultas de intervalos em lote (data.aggregation.range_queries)
+    janelas         estatísticas móveis de 3, 6 e 12 períodos de todos os KPIs (analytics.rolling)
+    forecast        forecast_with_models de todos os KPIs (aba Forecast)
+    correlacao      matriz de correlação da aba Forecast
+    comissoes       cálculos da aba Parceria Contador (pacote, projeção e rankings)
+
+Cada execução é acrescentada ao histórico JSON; `compare` aponta os casos que
+ficaram mais lentos que o limiar entre duas execuções do histórico.
+
+Uso (na raiz do projeto):
+    python benchmarks/suite.py run --rotulo antes
+    python benchmarks/suite.py run --escalas 5,1000 --casos resumo,filter_data
+    python benchmarks/suite.py compare [--base -2 --atual -1 --limiar 0.2]
+
+`compare` retorna código 1 quando há regressão.
+"""
+import argparse
+import datetime
+import functools
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from analytics.cache import cache_clear  # noqa: E402
+from analytics.models import forecast_with_models  # noqa: E402
+from analytics.commissions import bundle_table, rank_bundles  # noqa: E402
+from analytics.rolling import rolling_stats  # noqa: E402
+from analytics.referral import partner_economics, referral_projection  # noqa: E402
+from analytics.report import KPIS_FORECAST, PARCERIA_PADRAO  # noqa: E402
+from data.aggregation import range_index, range_queries  # noqa: E402
+from data.kpis import summarize  # noqa: E402
+from data.loader import filter_data, load_data  # noqa: E402
+from data.schema import build_monthly_frame, compact_frame  # noqa: E402
+from data.synthetic import write_synthetic  # noqa: E402
+
+HISTORICO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.json')
+DIRETORIO_DADOS = os.path.join(tempfile.gettempdir(), 'dashboard-benchmarks')
+
+ESCALAS = [5, 1_000, 100_000, 10_000_000]
+
+# Diferença relativa (e absoluta, para não acusar ruído em tempos de microssegundos)
+# a partir da qual um caso é considerado regressão
+LIMIAR = 0.2
+LIMIAR_MINIMO_MS = 0.5
+
+# Teto de tempo por caso e escala: repetições extras só enquanto couberem nele
+ORCAMENTO_S = 2.0
+
+_INICIO = np.datetime64('2021-01-01')
+_DIAS_MAX = 5 * 365
+
+# Maior frame mensal medido: acima disso os rótulos de meses se repetiriam
+MESES_MAX = 1200
+
+
+def _base_columns(n, rng):
+    """Colunas aditivas com tendência e sazonalidade anual, no funil sessões → clientes"""
+    t = np.arange(n)
+    sazonal = 1 + 0.15 * np.sin(2 * np.pi * t / 12)
+    sessoes = 5000 * sazonal * (1 + 0.01 * (t % 60)) * rng.uniform(0.9, 1.1, n)
+    primeira = sessoes * rng.uniform(0.5, 0.7, n)
+    leads = primeira * rng.uniform(0.07, 0.12, n)
+    clientes = leads * rng.uniform(0.03, 0.06, n)
+    return {
+        'Sessões': sessoes.round(),
+        'Primeira Visita': primeira.round(),
+        'Leads': leads.round(),
+        'Clientes Web': np.maximum(clientes.round(), 1),
+        'Receita Web': clientes * rng.uniform(120, 160, n),
+        'Custo Meta': sessoes * rng.uniform(0.4, 0.5, n),
+        'Custo Google': sessoes * rng.uniform(0.55, 0.75, n)
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def monthly_frame(n, seed=0):
+    """Frame do dashboard com n meses sintéticos (a partir de Jan/21), reaproveitado entre os casos"""
+    rng = np.random.default_rng(seed)
+    ordinais = np.arange(n) + int(_INICIO.astype('datetime64[M]').astype(np.int64))
+    return compact_frame(build_monthly_frame(pd.DataFrame(_base_columns(n, rng), index=ordinais)), ordinais)
+
+
+def case_months(n):
+    """Meses do frame dos casos mensais na escala de n linhas"""
+    return min(n, MESES_MAX)
+
+
+def daily_source(n, seed=0):
+    """Diretório Parquet com n linhas diárias por campanha (até 5 anos de datas)
+
+    Gerado por data.synthetic e reaproveitado entre execuções em DIRETORIO_DADOS.
+    """
+    caminho = os.path.join(DIRETORIO_DADOS, f'diario_{n}_{seed}')
+    if os.path.exists(caminho):
+        return caminho
+    dias = min(n, _DIAS_MAX)
+    temporario = caminho + '.tmp'
+    shutil.rmtree(temporario, ignore_errors=True)
+    write_synthetic(temporario, inicio=str(_INICIO), dias=dias,
+                    campanhas=math.ceil(n / dias), seed=seed, linhas=n)
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def _selection(df):
+    """Metade final do período, como uma seleção típica de meses no filtro"""
+    meses = df['Mês'].unique()
+    return list(meses[len(meses) // 2:])
+
+
+def _case_load_data(n):
+    caminho = daily_source(n)
+
+    def executar():
+        cache_clear('dados')
+        load_data(source=caminho)
+    return executar
+
+
+def _case_filter_data(n):
+    df = monthly_frame(case_months(n))
+    meses = _selection(df)
+    return lambda: filter_data(df, meses)
+
+
+def _case_resumo(n):
+    df = monthly_frame(case_months(n))
+    meses = _selection(df)
+    return lambda: summarize(filter_data(df, meses))
+
+
+def _case_intervalos(n):
+    df = monthly_frame(case_months(n))
+    range_index(df)
+    rng = np.random.default_rng(0)
+    lo = rng.integers(0, len(df), 10_000)
+    hi = np.minimum(lo + rng.integers(1, 13, 10_000), len(df))
+    return lambda: range_queries(df, lo, hi)
+
+
+def _case_janelas(n):
+    df = monthly_frame(case_months(n))
+    range_index(df)
+
+    def executar():
+        cache_clear('janelas')
+        for janela in (3, 6, 12):
+            rolling_stats(df, janela)
+    return executar
+
+
+def _case_forecast(n):
+    df = monthly_frame(case_months(n))
+    kpis = [c for c in df.columns if c != 'Mês']
+
+    def executar():
+        cache_clear('modelos')
+        cache_clear('intervalos')
+        forecast_with_models(df, kpis, 3)
+    return executar
+
+
+def _case_correlacao(n):
+    df = monthly_frame(case_months(n))
+    return lambda: df[KPIS_FORECAST].corr()
+
+
+def _case_comissoes(n):
+    df = monthly_frame(case_months(n))
+    meses = _selection(df)
+    p = PARCERIA_PADRAO
+
+    def executar():
+        cache_clear('ledger')
+        resumo = summarize(filter_data(df, meses))
+        economia = partner_economics(resumo, p['plano'], list(p['extensoes']),
+                                     p['percentual_comissao'], p['meses_comissao'])
+        referral_projection(economia, p['clientes_mes'], p['meses'],
+                            p['percentual_comissao'], p['meses_comissao'], p['churn'])
+        rank_bundles(p['percentual_comissao'], p['meses_comissao'], 'valor_mensal', n=1)
+        rank_bundles(p['percentual_comissao'], p['meses_comissao'], 'comissao_total', n=1, maior=True)
+        bundle_table(p['percentual_comissao'], p['meses_comissao'])
+    return executar
+
+
+# Caso -> (preparação, usa o frame mensal de case_months)
+CASOS = {
+    'load_data': (_case_load_data, False),
+    'filter_data': (_case_filter_data, True),
+    'resumo': (_case_resumo, True),
+    'intervalos': (_case_intervalos, True),
+    'janelas': (_case_janelas, True),
+    'forecast': (_case_forecast, True),
+    'correlacao': (_case_correlacao, True),
+    'comissoes': (_case_comissoes, True)
+}
+
+
+def time_case(executar, repeticoes):
+    """Mediana e mínimo (ms) de até `repeticoes` execuções dentro de ORCAMENTO_S"""
+    tempos = []
+    inicio = time.perf_counter()
+    while len(tempos) < repeticoes and (not tempos or time.perf_counter() - inicio < ORCAMENTO_S):
+        t0 = time.perf_counter()
+        executar()
+        tempos.append((time.perf_counter() - t0) * 1000)
+    return {'mediana_ms': statistics.median(tempos), 'min_ms': min(tempos), 'execucoes': len(tempos)}
+
+
+def _commit():
+    try:
+        resultado = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ,
+                                   capture_output=True, text=True, check=True)
+        return resultado.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(escalas=ESCALAS, casos=None, repeticoes=5, rotulo=None, progresso=None):
+    """Executa a suíte: dict com metadados e {caso: {escala: tempos}}"""
+    resultados = {}
+    for nome in casos or CASOS:
+        preparar, mensal = CASOS[nome]
+        resultados[nome] = {}
+        for n in escalas:
+            executar = preparar(n)
+            executar()  # aquecimento (imports, caches de módulo, grade de comissões)
+            resultados[nome][str(n)] = time_case(executar, repeticoes)
+            if mensal:
+                resultados[nome][str(n)]['meses'] = case_months(n)
+            if progresso:
+                progresso(nome, n, resultados[nome][str(n)])
+    return {
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'rotulo': rotulo,
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'resultados': resultados
+    }
+
+
+def load_history(caminho=HISTORICO):
+    if not os.path.exists(caminho):
+        return []
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_run(execucao, caminho=HISTORICO):
+    historico = load_history(caminho) + [execucao]
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(historico, f, ensure_ascii=False, indent=2)
+    return len(historico) - 1
+
+
+def compare(base, atual, limiar=LIMIAR, limiar_minimo_ms=LIMIAR_MINIMO_MS):
+    """Linhas (caso, escala, base ms, atual ms, variação, regressão) dos casos comuns às execuções"""
+    linhas = []
+    for nome, escalas in atual['resultados'].items():
+        for n, tempos in escalas.items():
+            anterior = base['resultados'].get(nome, {}).get(n)
+            # Execuções antigas podem ter casos pulados ou outro número de meses na escala
+            if anterior is None or 'pulado' in anterior or 'pulado' in tempos:
+                continue
+            if anterior.get('meses') != tempos.get('meses'):
+                continue
+            antes, depois = anterior['mediana_ms'], tempos['mediana_ms']
+            variacao = (depois - antes) / antes if antes else 0.0
+            regressao = variacao > limiar and depois - antes > limiar_minimo_ms
+            linhas.append((nome, int(n), antes, depois, variacao, regressao))
+    return linhas
+
+
+def _describe(execucao, indice):
+    rotulo = f" '{execucao['rotulo']}'" if execucao.get('rotulo') else ''
+    return f"#{indice}{rotulo} ({execucao['data']}, commit {execucao.get('commit') or '?'})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos quentes do dashboard")
+    parser.add_argument('--historico', default=HISTORICO, help="arquivo JSON do histórico")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_run = sub.add_parser('run', help="executa a suíte e acrescenta o resultado ao histórico")
+    p_run.add_argument('--escalas', default=','.join(map(str, ESCALAS)),
+                       help="linhas sintéticas, separadas por vírgula")
+    p_run.add_argument('--casos', help=f"casos, separados por vírgula ({', '.join(CASOS)})")
+    p_run.add_argument('--repeticoes', type=int, default=5)
+    p_run.add_argument('--rotulo', help="identificação da execução (ex.: 'antes', 'depois')")
+    p_run.add_argument('--nao-salvar', action='store_true', help="não grava no histórico")
+
+    p_cmp = sub.add_parser('compare', help="compara duas execuções do histórico")
+    p_cmp.add_argument('--base', type=int, default=-2, help="índice da execução base (padrão: penúltima)")
+    p_cmp.add_argument('--atual', type=int, default=-1, help="índice da execução atual (padrão: última)")
+    p_cmp.add_argument('--limiar', type=float, default=LIMIAR, help="piora relativa tolerada (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.comando == 'run':
+        casos = args.casos.split(',') if args.casos else None
+        desconhecidos = [c for c in casos or () if c not in CASOS]
+        if desconhecidos:
+            parser.error(f"casos desconhecidos: {', '.join(desconhecidos)}")
+        escalas = [int(e) for e in args.escalas.split(',')]
+
+        def progresso(nome, n, tempos):
+            meses = f", {tempos['meses']:,} meses" if 'meses' in tempos else ''
+            print(f"{nome:<12} {n:>12,} linhas  {tempos['mediana_ms']:12.3f} ms "
+                  f"(mín {tempos['min_ms']:.3f}, {tempos['execucoes']}x{meses})", flush=True)
+
+        execucao = run(escalas, casos, args.repeticoes, args.rotulo, progresso)
+        if not args.nao_salvar:
+            indice = save_run(execucao, args.historico)
+            print(f"gravado em {args.historico} como #{indice}")
+        return 0
+
+    historico = load_history(args.historico)
+    try:
+        base, atual = historico[args.base], historico[args.atual]
+    except IndexError:
+        parser.error(f"o histórico tem {len(historico)} execuções")
+    indices = [i % len(historico) for i in (args.base, args.atual)]
+    print(f"base:  {_describe(base, indices[0])}\natual: {_describe(atual, indices[1])}")
+    linhas = compare(base, atual, args.limiar)
+    for nome, n, antes, depois, variacao, regressao in linhas:
+        marca = '❌' if regressao else '  '
+        print(f"{marca} {nome:<12} {n:>12,} linhas  {antes:12.3f} → {depois:12.3f} ms  {variacao:+7.1%}")
+    regressoes = sum(r[-1] for r in linhas)
+    print(f"{regressoes} regressões acima de {args.limiar:.0%}" if regressoes else "sem regressões")
+    return 1 if regressoes else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
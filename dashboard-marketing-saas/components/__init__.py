@@ -2,13 +2,35 @@
 Módulo de componentes reutilizáveis do dashboard
 """
 
-from .header import render_header, render_sidebar
+from .header import render_header, render_sidebar, render_period_filter, render_window_selector
 from .metrics import render_main_metrics
 from .alerts import render_main_alerts
+from .evolution import render_evolution_tab
+from .financial import render_financial_tab
+from .conversion import render_conversion_tab
+from .benchmarks import render_benchmarks_tab
+from .recommendations import render_recommendations_tab
+from .forecast import render_forecast_tab
+from .partner import render_partner_tab
+from .charts import figure_cache_stats, clear_figure_cache
+from .performance import begin_rerun, render_performance_panel
 
 __all__ = [
     'render_header',
     'render_sidebar',
+    'render_period_filter',
+    'render_window_selector',
     'render_main_metrics',
-    'render_main_alerts'
+    'render_main_alerts',
+    'render_evolution_tab',
+    'render_financial_tab',
+    'render_conversion_tab',
+    'render_benchmarks_tab',
+    'render_recommendations_tab',
+    'render_forecast_tab',
+    'render_partner_tab',
+    'figure_cache_stats',
+    'clear_figure_cache',
+    'begin_rerun',
+    'render_performance_panel'
 ]
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Aba de comparação com benchmarks do setor
+"""
+import streamlit as st
+import pandas as pd
+
+from analytics.report import benchmark_status
+
+from .performance import profiled_tab
+
+KPIS_TABELA = ['TC Usuários (%)', 'TC Leads (%)', 'CAC', 'CAC:LTV', 'ROI (%)', 'Ticket Médio']
+
+# KPIs de custo: ficar abaixo da faixa é bom
+MENOR_MELHOR = {'CAC'}
+
+def _faixa(b, prefixo='', sufixo=''):
+    return f"{prefixo}{b['min']:g}-{b['max']:g}{sufixo}"
+
+
+def _status(kpi, status):
+    """Rótulo da coluna Status a partir de benchmark_status (posição da média na faixa)"""
+    posicao = status['status'] if status else None
+    if posicao is None:
+        return "— Sem dados"
+    if posicao == 'na faixa':
+        return "✅ Na faixa"
+    texto = "Abaixo da faixa" if posicao == 'abaixo' else "Acima da faixa"
+    if (posicao == 'abaixo') == (kpi in MENOR_MELHOR):
+        return f"✅ {texto}"
+    if 'critico' in status and status['media'] < status['critico']:
+        return "🔴 Abaixo do crítico"
+    return f"⚠️ {texto}"
+
+
+@st.fragment
+@profiled_tab("Benchmarks")
+def render_benchmarks_tab(resumo, benchmarks):
+    """Renderiza a aba Benchmarks (faixas do perfil de benchmark do tenant)"""
+    razao = benchmarks['CAC:LTV']
+    status = benchmark_status(resumo, benchmarks)
+    st.subheader("Comparação com Benchmarks SaaS ERP")
+    
+    benchmark_data = pd.DataFrame({
+        'Métrica': ['TC Usuários → Leads', 'TC Leads → Vendas', 'CAC', 'CAC:LTV', 'ROI', 'Ticket Médio'],
+        'Sua Média': [
+            f"{resumo.loc['TC Usuários (%)', 'media']:.2f}%",
+            f"{resumo.loc['TC Leads (%)', 'media']:.2f}%",
+            f"R$ {resumo.loc['CAC', 'media']:.2f}",
+            f"{resumo.loc['CAC:LTV', 'media']:.1f}:1",
+            f"{resumo.loc['ROI (%)', 'media']:.1f}%",
+            f"R$ {resumo.loc['Ticket Médio', 'media']:.2f}"
+        ],
+        'Benchmark': [
+            _faixa(benchmarks['TC Usuários (%)'], sufixo='%'),
+            _faixa(benchmarks['TC Leads (%)'], sufixo='%'),
+            _faixa(benchmarks['CAC'], prefixo='R$ '),
+            f"≥{razao.get('critico', razao['min']):g}:1 (ideal {razao['ideal']:g}-{razao['max']:g}:1)",
+            _faixa(benchmarks['ROI (%)'], sufixo='%'),
+            _faixa(benchmarks['Ticket Médio'], prefixo='R$ ')
+        ],
+        'Status': [_status(kpi, status.get(kpi)) for kpi in KPIS_TABELA]
+    })
+    
+    st.dataframe(benchmark_data, use_container_width=True, hide_index=True)
\ No newline at end of file
@@ -0,0 +1,573 @@
+"""
+Construção dos gráficos Plotly com cache de figuras serializadas
+
+Cada gráfico é uma função pura dos dados e parâmetros recebidos. O JSON da
+figura fica no cache compartilhado do processo (namespace 'figuras', dentro do
+orçamento de memória de config.CACHE), com chave pela versão dos dados (hash
+do DataFrame já filtrado) e pelos parâmetros dos widgets; em uma nova execução
+sem mudanças a figura é apenas desserializada.
+
+Os gráficos de linha mensais reduzem a série à resolução da largura do
+gráfico (config.GRAFICOS) antes de montar os traces. plotly.express e
+plotly.subplots são importados só pelos gráficos que os usam.
+
+Os gráficos das abas Evolução e Financeiro aceitam `movel`, as estatísticas
+móveis do recorte (analytics.rolling_overlay), e sobrepõem a média móvel de
+`janela` períodos, com a faixa de ± uma volatilidade nas séries de valor.
+"""
+import functools
+import json
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from analytics import content_key, downsample_frame, rolling_column
+from analytics.cache import cache_clear, cache_get, cache_set, cache_stats
+from analytics.profiling import span
+from config import GRAFICOS
+from data.kpis import data_version
+
+NAMESPACE = 'figuras'
+
+
+def _key_part(valor):
+    """DataFrames entram na chave pela versão do conteúdo; demais valores como estão"""
+    if isinstance(valor, pd.DataFrame):
+        return ('df', data_version(valor))
+    return valor
+
+
+def figure_builder(func):
+    """Decorador: serve a figura do cache quando dados e parâmetros não mudaram
+
+    A figura retornada é sempre um objeto novo e pode ser alterada pelo chamador.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with span(f"figura: {func.__name__}"):
+            chave = content_key(func.__qualname__, *map(_key_part, args),
+                                *((k, _key_part(v)) for k, v in sorted(kwargs.items())))
+            encontrado, serializada = cache_get(NAMESPACE, chave)
+            if encontrado:
+                # Já validada na construção: recriar sem validar é só desserializar
+                return go.Figure(json.loads(serializada), _validate=False)
+
+            fig = func(*args, **kwargs)
+            cache_set(NAMESPACE, chave, fig.to_json())
+            return fig
+    return wrapper
+
+
+def figure_cache_stats():
+    """Acertos, falhas, entradas e bytes ocupados pelo cache de figuras"""
+    return cache_stats().get(NAMESPACE, {'hits': 0, 'misses': 0, 'entradas': 0, 'bytes': 0})
+
+
+def clear_figure_cache():
+    """Esvazia o cache de figuras"""
+    cache_clear(NAMESPACE)
+
+
+def _downsample(df, colunas, largura):
+    """Recorte de df para a largura do gráfico (fração da página); inteiro se couber"""
+    pontos = int(GRAFICOS['largura_px'] * largura / GRAFICOS['pixels_por_ponto'])
+    return downsample_frame(df, colunas, pontos, GRAFICOS['metodo'])
+
+
+def _line_mode(df, reduzido):
+    """Marcadores só quando todos os pontos são exibidos"""
+    return 'lines+markers' if len(reduzido) == len(df) else 'lines'
+
+
+def _rgba(cor, opacidade):
+    """Cor '#rrggbb' como 'rgba(r, g, b, opacidade)'"""
+    return f"rgba({int(cor[1:3], 16)}, {int(cor[3:5], 16)}, {int(cor[5:7], 16)}, {opacidade})"
+
+
+def _add_rolling(fig, movel, janela, kpi, nome, cor, largura, faixa=False):
+    """Sobrepõe a média móvel de `kpi` (tracejada) e, com `faixa`, ± uma volatilidade"""
+    media, volatilidade = rolling_column(kpi, 'media'), rolling_column(kpi, 'volatilidade')
+    serie = _downsample(movel, [media], largura)
+    if faixa:
+        fig.add_trace(go.Scatter(x=serie['Mês'], y=serie[media] + serie[volatilidade], mode='lines',
+                                 line=dict(width=0), showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(x=serie['Mês'], y=serie[media] - serie[volatilidade], mode='lines',
+                                 line=dict(width=0), fill='tonexty', fillcolor=_rgba(cor, 0.15),
+                                 name=f'{nome} ± volatilidade ({janela})', hoverinfo='skip'))
+    fig.add_trace(go.Scatter(
+        x=serie['Mês'],
+        y=serie[media],
+        mode='lines',
+        name=f'{nome} (média móvel {janela})',
+        line=dict(color=cor, width=2, dash='dash')
+    ))
+
+
+# --- Evolução -----------------------------------------------------------------
+
+@figure_builder
+def leads_clients_figure(df, largura=1.0, movel=None, janela=None):
+    """Evolução de leads e clientes"""
+    serie = _downsample(df, ['Leads', 'Clientes Web'], largura)
+    modo = _line_mode(df, serie)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=serie['Mês'],
+        y=serie['Leads'],
+        mode=modo,
+        name='Leads',
+        line=dict(color='#3b82f6', width=3),
+        marker=dict(size=10)
+    ))
+    fig.add_trace(go.Scatter(
+        x=serie['Mês'],
+        y=serie['Clientes Web'],
+        mode=modo,
+        name='Clientes',
+        line=dict(color='#10b981', width=3),
+        marker=dict(size=10)
+    ))
+    if movel is not None:
+        _add_rolling(fig, movel, janela, 'Leads', 'Leads', '#3b82f6', largura)
+        _add_rolling(fig, movel, janela, 'Clientes Web', 'Clientes', '#10b981', largura)
+    fig.update_layout(
+        height=400,
+        hovermode='x unified',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+@figure_builder
+def traffic_figure(df, movel=None, janela=None):
+    """Sessões e primeiras visitas por mês"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df['Mês'],
+        y=df['Sessões'],
+        name='Total Sessões',
+        marker_color='#073763'
+    ))
+    fig.add_trace(go.Bar(
+        x=df['Mês'],
+        y=df['Primeira Visita'],
+        name='Primeira Visita',
+        marker_color='#3b82f6'
+    ))
+    if movel is not None:
+        _add_rolling(fig, movel, janela, 'Sessões', 'Sessões', '#f59e0b', 0.5)
+    fig.update_layout(height=350, barmode='group')
+    return fig
+
+
+@figure_builder
+def revenue_figure(df, movel=None, janela=None):
+    """Receita web mensal"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df['Mês'],
+        y=df['Receita Web'],
+        marker_color='#10b981',
+        texttemplate='R$ %{y:.0f}',
+        textposition='outside',
+        name='Receita Web',
+        showlegend=movel is not None
+    ))
+    if movel is not None:
+        _add_rolling(fig, movel, janela, 'Receita Web', 'Receita', '#065f46', 0.5, faixa=True)
+    fig.update_layout(height=350)
+    return fig
+
+
+# --- Financeiro ---------------------------------------------------------------
+
+@figure_builder
+def cac_ltv_figure(df, movel=None, janela=None):
+    """CAC e LTV por mês"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df['Mês'],
+        y=df['CAC'],
+        name='CAC',
+        marker_color='#ef4444'
+    ))
+    fig.add_trace(go.Bar(
+        x=df['Mês'],
+        y=df['LTV'],
+        name='LTV',
+        marker_color='#10b981'
+    ))
+    if movel is not None:
+        _add_rolling(fig, movel, janela, 'CAC', 'CAC', '#991b1b', 0.5)
+        _add_rolling(fig, movel, janela, 'LTV', 'LTV', '#065f46', 0.5)
+    fig.update_layout(height=350, barmode='group')
+    return fig
+
+
+@figure_builder
+def ads_investment_figure(df, movel=None, janela=None):
+    """Investimento em Meta Ads e Google Ads (empilhado)"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df['Mês'],
+        y=df['Custo Meta'],
+        name='Meta Ads',
+        marker_color='#1877f2'
+    ))
+    fig.add_trace(go.Bar(
+        x=df['Mês'],
+        y=df['Custo Google'],
+        name='Google Ads',
+        marker_color='#ea4335'
+    ))
+    if movel is not None:
+        _add_rolling(fig, movel, janela, 'Total Ads', 'Total Ads', '#374151', 0.5, faixa=True)
+    fig.update_layout(height=350, barmode='stack')
+    return fig
+
+
+@figure_builder
+def roi_figure(df, roi_ideal, largura=1.0, movel=None, janela=None):
+    """Evolução do ROI com a linha do benchmark ideal"""
+    serie = _downsample(df, ['ROI (%)'], largura)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=serie['Mês'],
+        y=serie['ROI (%)'],
+        mode=_line_mode(df, serie),
+        fill='tozeroy',
+        line=dict(color='#8b5cf6', width=3),
+        marker=dict(size=12),
+        name='ROI (%)',
+        showlegend=movel is not None
+    ))
+    if movel is not None:
+        _add_rolling(fig, movel, janela, 'ROI (%)', 'ROI', '#4c1d95', largura, faixa=True)
+    fig.add_hline(y=roi_ideal, line_dash="dash",
+                  line_color="green", annotation_text="Benchmark Ideal")
+    fig.update_layout(height=350)
+    return fig
+
+
+# --- Conversão ----------------------------------------------------------------
+
+@figure_builder
+def funnel_figure(valores):
+    """Funil sessões → primeira visita → leads → clientes"""
+    fig = go.Figure(go.Funnel(
+        y=['Sessões', 'Primeira Visita', 'Leads', 'Clientes'],
+        x=valores,
+        textinfo="value+percent initial",
+        marker=dict(color=['#073763', '#3b82f6', '#8b5cf6', '#10b981'])
+    ))
+    fig.update_layout(height=400)
+    return fig
+
+
+@figure_builder
+def conversion_rate_figure(df, coluna, cor, faixa_min, faixa_max, largura=0.5):
+    """Taxa de conversão mensal com a faixa de benchmark"""
+    serie = _downsample(df, [coluna], largura)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=serie['Mês'],
+        y=serie[coluna],
+        mode=_line_mode(df, serie),
+        line=dict(color=cor, width=3),
+        marker=dict(size=10)
+    ))
+    fig.add_hrect(y0=faixa_min,
+                  y1=faixa_max,
+                  fillcolor="green", opacity=0.1,
+                  annotation_text="Benchmark", annotation_position="top left")
+    fig.update_layout(height=300)
+    return fig
+
+
+# --- Forecast -----------------------------------------------------------------
+
+@figure_builder
+def forecast_figure(kpi, meses, historico, previsao_meses, previsao, otimista, conservador, nivel):
+    """Histórico, previsão e intervalo de predição de um KPI"""
+    fig = go.Figure()
+
+    # Dados históricos
+    fig.add_trace(go.Scatter(
+        x=meses,
+        y=historico,
+        name="Histórico",
+        mode="lines+markers",
+        line=dict(color='#3b82f6', width=3)
+    ))
+
+    # Previsão
+    fig.add_trace(go.Scatter(
+        x=previsao_meses,
+        y=previsao,
+        name="Previsão",
+        mode="lines+markers",
+        line=dict(color='#10b981', width=3, dash='dot')
+    ))
+
+    # Intervalos de confiança
+    fig.add_trace(go.Scatter(
+        x=previsao_meses,
+        y=otimista,
+        name=f"IC Superior ({nivel}%)",
+        mode="lines",
+        line=dict(color='rgba(16, 185, 129, 0.3)', dash='dash')
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=previsao_meses,
+        y=conservador,
+        name=f"IC Inferior ({nivel}%)",
+        mode="lines",
+        line=dict(color='rgba(239, 68, 68, 0.3)', dash='dash'),
+        fill='tonexty'
+    ))
+
+    fig.update_layout(
+        title=f"Previsão: {kpi}",
+        xaxis_title="Mês",
+        yaxis_title=kpi,
+        height=400
+    )
+    return fig
+
+
+@figure_builder
+def correlation_figure(df):
+    """Matriz de correlação entre as colunas de `df`"""
+    import plotly.express as px
+
+    fig = px.imshow(
+        df.corr(),
+        labels=dict(color="Correlação"),
+        color_continuous_scale="RdBu",
+        aspect="auto"
+    )
+    fig.update_layout(
+        title="Matriz de Correlação",
+        height=500
+    )
+    return fig
+
+
+# --- Parceria -----------------------------------------------------------------
+
+@figure_builder
+def lead_cost_figure(custo_min, custo_max, custo_medio, comissao_mensal):
+    """Custo por lead (mín., máx., médio) contra a comissão mensal do contador"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['Custo Lead Mín', 'Custo Lead Máx', 'Custo Lead Médio', 'Comissão Mensal'],
+        y=[custo_min, custo_max, custo_medio, comissao_mensal],
+        marker_color=['#fbbf24', '#f59e0b', '#d97706', '#10b981'],
+        texttemplate='R$ %{y:.2f}',
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title="Comparação: Custo Lead vs Comissão Contador",
+        height=350,
+        showlegend=False,
+        yaxis_title="Valor (R$)"
+    )
+    return fig
+
+
+@figure_builder
+def client_monthly_figure(meses, receita, comissao, titulo):
+    """Receita da empresa e comissão do contador, mês a mês, para um cliente"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=meses,
+        y=receita,
+        name='Receita Empresa',
+        marker_color='#10b981',
+        texttemplate='R$ %{y:.2f}',
+        textposition='outside'
+    ))
+
+    fig.add_trace(go.Bar(
+        x=meses,
+        y=comissao,
+        name='Comissão Contador',
+        marker_color='#3b82f6',
+        texttemplate='R$ %{y:.2f}',
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        title=titulo,
+        xaxis_title="Período",
+        yaxis_title="Valor (R$)",
+        height=400,
+        barmode='group'
+    )
+    return fig
+
+
+@figure_builder
+def cac_comparison_figure(cac_ads, cac_indicacao):
+    """CAC via anúncios contra CAC via indicação"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['CAC Google Ads', 'CAC Indicação'],
+        y=[cac_ads, cac_indicacao],
+        marker_color=['#ea4335', '#10b981'],
+        texttemplate='R$ %{y:.2f}',
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title="Comparação de CAC",
+        height=350,
+        showlegend=False
+    )
+    return fig
+
+
+@figure_builder
+def cac_ltv_ratio_figure(razao_ads, razao_indicacao):
+    """Relação CAC:LTV dos dois canais com o benchmark ideal"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['CAC:LTV Ads', 'CAC:LTV Indicação'],
+        y=[razao_ads, razao_indicacao],
+        marker_color=['#ea4335', '#10b981'],
+        texttemplate='%{y:.1f}:1',
+        textposition='outside'
+    ))
+    fig.add_hline(
+        y=4,
+        line_dash="dash",
+        line_color="orange",
+        annotation_text="Benchmark Ideal (4:1)"
+    )
+    fig.update_layout(
+        title="Relação CAC:LTV",
+        height=350,
+        showlegend=False
+    )
+    return fig
+
+
+@figure_builder
+def projection_figure(meses, receita, comissao, num_clientes):
+    """Receita e comissão mensais projetadas (dois painéis)"""
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Receita Mensal da Empresa', 'Comissão Mensal aos Contadores'),
+        vertical_spacing=0.15
+    )
+
+    # Gráfico 1: Receita
+    fig.add_trace(
+        go.Bar(
+            x=meses,
+            y=receita,
+            name='Receita Mensal',
+            marker_color='#10b981',
+            texttemplate='R$ %{y:,.0f}',
+            textposition='outside'
+        ),
+        row=1, col=1
+    )
+
+    # Gráfico 2: Comissão
+    fig.add_trace(
+        go.Bar(
+            x=meses,
+            y=comissao,
+            name='Comissão Mensal',
+            marker_color='#3b82f6',
+            texttemplate='R$ %{y:,.0f}',
+            textposition='outside'
+        ),
+        row=2, col=1
+    )
+
+    fig.update_layout(
+        title=f"Projeção com {num_clientes} novas indicações/mês",
+        height=600,
+        showlegend=False
+    )
+
+    fig.update_xaxes(title_text="Período", row=2, col=1)
+    fig.update_yaxes(title_text="Receita (R$)", row=1, col=1)
+    fig.update_yaxes(title_text="Comissão (R$)", row=2, col=1)
+    return fig
+
+
+@figure_builder
+def monte_carlo_figure(meses, receita, comissao, lucro, percentis, caminhos):
+    """Bandas de percentis (matrizes percentis × meses) da simulação Monte Carlo"""
+    p10, p50, p90 = percentis
+    fig = go.Figure()
+    for bandas, nome, cor in [(receita, 'Receita acumulada', '16, 185, 129'),
+                              (comissao, 'Comissão acumulada', '59, 130, 246'),
+                              (lucro, 'Lucro acumulado', '139, 92, 246')]:
+        baixo, mediana, alto = bandas
+        fig.add_trace(go.Scatter(x=meses, y=alto, mode='lines', line=dict(width=0),
+                                 showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(x=meses, y=baixo, mode='lines', line=dict(width=0),
+                                 fill='tonexty', fillcolor=f'rgba({cor}, 0.2)',
+                                 name=f'{nome} (P{p10}-P{p90})'))
+        fig.add_trace(go.Scatter(x=meses, y=mediana, mode='lines+markers',
+                                 line=dict(color=f'rgb({cor})', width=3),
+                                 name=f'{nome} (P{p50})'))
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    fig.update_layout(
+        title=f"Monte Carlo: {caminhos:,} caminhos simulados",
+        xaxis_title="Período",
+        yaxis_title="Valor acumulado (R$)",
+        height=450
+    )
+    return fig
+
+
+@figure_builder
+def liability_figure(meses, passivo):
+    """Passivo de comissões ao fim de cada mês"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=meses,
+        y=passivo,
+        name='Passivo de comissões',
+        mode='lines+markers',
+        line=dict(color='#f59e0b', width=3),
+        fill='tozeroy'
+    ))
+    fig.update_layout(
+        title="Comissões a pagar às coortes já adquiridas (fim do mês)",
+        xaxis_title="Período",
+        yaxis_title="Passivo (R$)",
+        height=350
+    )
+    return fig
+
+
+@figure_builder
+def plan_commission_figure(planos, comissoes, percentual_comissao):
+    """Comissão mensal de cada plano base"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=planos,
+        y=comissoes,
+        marker_color=['#10b981', '#3b82f6', '#8b5cf6'],
+        texttemplate='R$ %{y:.2f}',
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        title=f"Comissão Mensal por Plano ({percentual_comissao*100:.1f}%)",
+        xaxis_title="Tipo de Plano",
+        yaxis_title="Comissão (R$)",
+        height=400,
+        showlegend=False
+    )
+    return fig
\ No newline at end of file
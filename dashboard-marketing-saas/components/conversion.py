@@ -0,0 +1,47 @@
+"""
+Aba do funil e das taxas de conversão
+"""
+import streamlit as st
+
+from .charts import conversion_rate_figure, funnel_figure
+from .performance import profiled_tab
+
+@st.fragment
+@profiled_tab("Conversão")
+def render_conversion_tab(df_filtered, benchmarks):
+    """Renderiza a aba Conversão"""
+    st.subheader("Funil de Conversão")
+    
+    # Métricas do último mês
+    ultimo_mes = df_filtered.iloc[-1]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Sessões", f"{ultimo_mes['Sessões']:,.0f}")
+    with col2:
+        st.metric("Leads", f"{ultimo_mes['Leads']:,.0f}")
+    with col3:
+        st.metric("Clientes", f"{ultimo_mes['Clientes Web']:,.0f}")
+    with col4:
+        st.metric("Receita", f"R$ {ultimo_mes['Receita Web']:,.2f}")
+    
+    # Gráfico de funil
+    valores_funil = [ultimo_mes['Sessões'], ultimo_mes['Primeira Visita'],
+                     ultimo_mes['Leads'], ultimo_mes['Clientes Web']]
+    st.plotly_chart(funnel_figure(valores_funil), use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Taxa de Conversão: Usuários → Leads")
+        faixa = benchmarks['TC Usuários (%)']
+        fig8 = conversion_rate_figure(df_filtered, 'TC Usuários (%)', '#3b82f6',
+                                      faixa['min'], faixa['max'])
+        st.plotly_chart(fig8, use_container_width=True)
+    
+    with col2:
+        st.markdown("### Taxa de Conversão: Leads → Vendas")
+        faixa = benchmarks['TC Leads (%)']
+        fig9 = conversion_rate_figure(df_filtered, 'TC Leads (%)', '#10b981',
+                                      faixa['min'], faixa['max'])
+        st.plotly_chart(fig9, use_container_width=True)
\ No newline at end of file
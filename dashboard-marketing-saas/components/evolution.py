@@ -0,0 +1,49 @@
+"""
+Aba de evolução de leads, clientes, tráfego e receita
+"""
+import streamlit as st
+
+from analytics import rolling_column, rolling_overlay
+
+from .charts import leads_clients_figure, revenue_figure, traffic_figure
+from .header import render_window_selector
+from .performance import profiled_tab
+
+
+def render_rolling_changes(movel, janela, kpis):
+    """Legenda com a taxa de variação mais recente de cada KPI contra `janela` períodos antes"""
+    if movel.empty:
+        return
+    partes = []
+    for kpi in kpis:
+        variacao = movel[rolling_column(kpi, 'variacao')].iloc[-1]
+        partes.append(f"{kpi} {variacao:+.1f}%" if variacao == variacao else f"{kpi} —")
+    st.caption(f"Variação em {janela} períodos (último período): " + " · ".join(partes))
+
+@st.fragment
+@profiled_tab("Evolução")
+def render_evolution_tab(df_filtered, historico=None):
+    """Renderiza a aba Evolução
+
+    `historico` é a série completa da granularidade e canal escolhidos: as
+    janelas móveis do início do recorte usam os períodos anteriores a ele.
+    """
+    st.subheader("Evolução de Leads e Clientes")
+    
+    janela = render_window_selector('evolucao')
+    movel = None
+    if janela:
+        movel = rolling_overlay(df_filtered if historico is None else historico, df_filtered, janela)
+        render_rolling_changes(movel, janela, ['Leads', 'Clientes Web', 'Sessões', 'Receita Web'])
+    
+    st.plotly_chart(leads_clients_figure(df_filtered, movel=movel, janela=janela), use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Tráfego do Site")
+        st.plotly_chart(traffic_figure(df_filtered, movel=movel, janela=janela), use_container_width=True)
+    
+    with col2:
+        st.subheader("Receita Web Mensal")
+        st.plotly_chart(revenue_figure(df_filtered, movel=movel, janela=janela), use_container_width=True)
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Aba de análise financeira (CAC, LTV, investimento e ROI)
+"""
+import streamlit as st
+
+from analytics import rolling_overlay
+
+from .charts import ads_investment_figure, cac_ltv_figure, roi_figure
+from .evolution import render_rolling_changes
+from .header import render_window_selector
+from .performance import profiled_tab
+
+@st.fragment
+@profiled_tab("Financeiro")
+def render_financial_tab(df_filtered, benchmarks, historico=None):
+    """Renderiza a aba Financeiro (`historico`: série completa para as janelas móveis)"""
+    st.subheader("Análise Financeira")
+    
+    janela = render_window_selector('financeiro')
+    movel = None
+    if janela:
+        movel = rolling_overlay(df_filtered if historico is None else historico, df_filtered, janela)
+        render_rolling_changes(movel, janela, ['CAC', 'LTV', 'Total Ads', 'ROI (%)'])
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### CAC vs LTV")
+        st.plotly_chart(cac_ltv_figure(df_filtered, movel=movel, janela=janela), use_container_width=True)
+    
+    with col2:
+        st.markdown("### Investimento em Ads")
+        st.plotly_chart(ads_investment_figure(df_filtered, movel=movel, janela=janela),
+                        use_container_width=True)
+    
+    st.markdown("### Evolução do ROI")
+    st.plotly_chart(roi_figure(df_filtered, benchmarks['ROI (%)']['ideal'], movel=movel, janela=janela),
+                    use_container_width=True)
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Aba de forecast com validação estatística
+"""
+import streamlit as st
+import pandas as pd
+
+from analytics import AUTOMATICO, MODELOS, N_BOOT, forecast_with_models
+from data.periods import next_labels
+
+from .charts import correlation_figure, forecast_figure
+from .performance import profiled_tab
+
+@st.fragment
+@profiled_tab("Forecast")
+def render_forecast_tab(df):
+    """Renderiza a aba Forecast (usa o histórico completo, não o filtro)"""
+    st.subheader("🔮 Forecast: Cenários para Projeção e Estratégia")
+    
+    try:
+        # Preparação dos dados para forecast
+        meses = df['Mês'].tolist()
+        previsao_meses = next_labels(meses[-1], 3)
+
+        # KPIs para previsão
+        kpis = ["Leads", "Clientes Web", "Receita Web", "CAC", "LTV", "ROI (%)"]
+        
+        col_modelo, col_nivel = st.columns([2, 1])
+        with col_modelo:
+            modelo = st.selectbox(
+                "Modelo de previsão:",
+                options=[AUTOMATICO] + list(MODELOS),
+                help="Automático escolhe, para cada KPI, o modelo com menor MAPE nos últimos meses (holdout)"
+            )
+        with col_nivel:
+            nivel = st.select_slider(
+                "Nível de confiança:",
+                options=[80, 90, 95, 99],
+                value=95,
+                format_func=lambda v: f"{v}%",
+                help=f"Cenários otimista/conservador: quantis de {N_BOOT} simulações por bootstrap dos resíduos"
+            )
+        
+        # Cada par (KPI, modelo) é ajustado uma vez por versão dos dados (em cache)
+        resultados, comparacao = forecast_with_models(df, kpis, len(previsao_meses), modelo, nivel / 100)
+        for kpi in kpis:
+            if resultados[kpi] is None:
+                st.error(f"Erro ao calcular previsões para {kpi}: série com valores ausentes")
+
+        # Exibir resultados
+        st.markdown("### Previsões com Validação Estatística")
+        
+        for kpi in kpis:
+            if resultados[kpi]:
+                st.markdown(f"#### {kpi}")
+                
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    # Gráfico com previsões e intervalos de confiança
+                    fig = forecast_figure(
+                        kpi, meses, df[kpi].to_numpy(), previsao_meses,
+                        resultados[kpi]['previsao'],
+                        resultados[kpi]['otimista'],
+                        resultados[kpi]['conservador'],
+                        nivel
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                with col2:
+                    # Métricas de qualidade
+                    st.markdown("**Métricas de Qualidade**")
+                    metricas = resultados[kpi]['metricas']
+                    
+                    # Avaliação da qualidade
+                    if metricas['R²'] > 0.8:
+                        r2_status = "✅ Excelente"
+                    elif metricas['R²'] > 0.6:
+                        r2_status = "⚠️ Moderado"
+                    else:
+                        r2_status = "❌ Baixo"
+                        
+                    if metricas['MAPE'] < 10:
+                        mape_status = "✅ Baixo"
+                    elif metricas['MAPE'] < 20:
+                        mape_status = "⚠️ Moderado"
+                    else:
+                        mape_status = "❌ Alto"
+                        
+                    if metricas['P-valor tendência'] < 0.05:
+                        tend_status = "📈 Significativa" if metricas['Tendência (tau)'] > 0 else "📉 Significativa"
+                    else:
+                        tend_status = "➖ Não significativa"
+                    
+                    st.caption(f"Modelo: {resultados[kpi]['modelo']} · "
+                               f"MAPE no holdout: {metricas['MAPE Holdout']:.1f}%")
+                    st.metric("R² (Ajuste do Modelo)", f"{metricas['R²']:.3f}", r2_status)
+                    st.metric("MAPE (Erro %)", f"{metricas['MAPE']:.1f}%", mape_status)
+                    st.metric("Tendência", f"{metricas['Tendência (tau)']:.3f}", tend_status)
+                
+                st.markdown("---")
+
+        with st.expander("📋 Comparação de modelos (MAPE no holdout)"):
+            df_comparacao = pd.DataFrame(comparacao).T
+            st.dataframe(df_comparacao.style.format("{:.1f}%", na_rep="-"),
+                         use_container_width=True)
+
+        # Análise de correlação entre KPIs
+        st.markdown("### Análise de Correlação entre KPIs")
+        st.plotly_chart(correlation_figure(df[kpis]), use_container_width=True)
+        
+        # Insights baseados nas correlações
+        st.markdown("### Insights das Análises")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            **Qualidade das Previsões:**
+            - Modelos com R² > 0.8 são altamente confiáveis
+            - MAPE < 10% indica previsões precisas
+            - Tendências significativas sugerem padrões consistentes
+            """)
+            
+            st.markdown("""
+            **Recomendações para Uso:**
+            1. Priorize KPIs com maior R² e menor MAPE
+            2. Use intervalos de confiança para planejamento
+            3. Considere tendências significativas nas decisões
+            """)
+        
+        with col2:
+            st.markdown("""
+            **Limitações do Modelo:**
+            - Modelos disponíveis: linear, Holt-Winters, Theil-Sen e sazonal ingênuo
+            - Sazonalidade só é estimada com pelo menos 24 meses de histórico
+            - Intervalos por bootstrap assumem resíduos sem autocorrelação
+            - Sensível a mudanças bruscas
+            - Requer monitoramento contínuo
+            """)
+            
+            st.markdown("""
+            **Próximos Passos:**
+            1. Atualizar dados mensalmente
+            2. Validar previsões vs. realizado
+            3. Ajustar modelos conforme necessário
+            """)
+
+    except Exception as e:
+        st.error(f"""
+        ❌ Erro ao gerar previsões e análises estatísticas.
+        
+        Erro: {str(e)}
+        
+        Verifique:
+        1. Formato dos dados
+        2. Quantidade de dados históricos
+        3. Dependências instaladas
+        """)
\ No newline at end of file
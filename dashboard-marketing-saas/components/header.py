@@ -3,6 +3,9 @@ Componentes de header e sidebar
 """
 import streamlit as st
 
+from config import CUBOS, JANELAS
+from data import TOTAL, cube_dates
+
 def render_header():
     """Renderiza o header principal"""
     st.markdown('<div class="main-header">📊 Dashboard de Marketing - SaaS ERP</div>', 
@@ -10,19 +13,46 @@ def render_header():
     st.markdown('<div class="sub-header">Análise de Performance: Maio - Setembro 2025</div>', 
                 unsafe_allow_html=True)
 
-def render_sidebar(df):
-    """Renderiza a sidebar com filtros"""
+def render_period_filter(cubos):
+    """Seletores de granularidade, período (datas) e canal sobre os cubos de data.cubes
+
+    Retorna (granularidade, inicio, fim, canal); datas None deixam o período aberto.
+    """
+    granularidades = cubos['granularidades']
+    padrao = CUBOS['padrao'] if CUBOS['padrao'] in granularidades else granularidades[-1]
+    granularidade = st.radio("Granularidade:", granularidades,
+                             index=granularidades.index(padrao), horizontal=True)
+
+    inicio = fim = None
+    limites = cube_dates(cubos)
+    if limites:
+        intervalo = st.date_input("Período:", value=limites, min_value=limites[0],
+                                  max_value=limites[1], format="DD/MM/YYYY")
+        # Enquanto o intervalo é escolhido, o widget devolve apenas a data inicial
+        inicio, fim = (tuple(intervalo) + (None, None))[:2]
+
+    canal = TOTAL
+    if len(cubos['canais']) > 1:
+        canal = st.radio("Canal:", cubos['canais'], horizontal=True)
+    return granularidade, inicio, fim, canal
+
+def render_window_selector(chave):
+    """Seletor da janela móvel sobreposta aos gráficos (períodos de config.JANELAS; 0 desliga)"""
+    opcoes = [0] + JANELAS['periodos']
+    janela = st.radio("Janela móvel:", opcoes, index=opcoes.index(JANELAS['padrao']),
+                      horizontal=True, key=f"janela_{chave}",
+                      format_func=lambda j: f"{j} períodos" if j else "Desligada")
+    return janela
+
+def render_sidebar(cubos):
+    """Renderiza a sidebar com filtros (granularidade, período e canal)"""
     with st.sidebar:
         st.image("https://via.placeholder.com/150x50/073763/ffffff?text=SaaS+ERP", 
                  use_container_width=True)
         st.markdown("---")
         
         st.subheader("Filtros")
-        selected_months = st.multiselect(
-            "Selecione os meses:",
-            options=df['Mês'].tolist(),
-            default=df['Mês'].tolist()
-        )
+        selecao = render_period_filter(cubos)
         
         st.markdown("---")
         st.subheader("Sobre")
@@ -34,4 +64,4 @@ def render_sidebar(df):
         st.markdown("---")
         st.caption("Desenvolvido para análise estratégica de marketing")
         
-        return selected_months
\ No newline at end of file
+        return selecao
\ No newline at end of file
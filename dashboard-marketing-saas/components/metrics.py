@@ -1,51 +1,46 @@
 """
 Cards de métricas principais
 """
+import math
+
 import streamlit as st
 
-def render_main_metrics(df_filtered):
-    """Renderiza as 4 métricas principais"""
+def _delta(resumo, kpi):
+    """Variação do KPI no período ('+12.3%'), ou None quando não está definida"""
+    variacao = resumo.loc[kpi, 'variacao']
+    return f"{variacao:+.1f}%" if math.isfinite(variacao) else None
+
+def render_main_metrics(resumo):
+    """Renderiza as 4 métricas principais a partir do resumo de KPIs (data.kpis)"""
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        cac_medio = df_filtered['CAC'].mean()
-        cac_variacao = ((df_filtered['CAC'].iloc[-1] - df_filtered['CAC'].iloc[0]) / 
-                        df_filtered['CAC'].iloc[0] * 100)
         st.metric(
             "CAC Médio",
-            f"R$ {cac_medio:.2f}",
-            f"{cac_variacao:+.1f}%",
+            f"R$ {resumo.loc['CAC', 'media']:.2f}",
+            _delta(resumo, 'CAC'),
             delta_color="inverse"
         )
     
     with col2:
-        ltv_medio = df_filtered['LTV'].mean()
-        ltv_variacao = ((df_filtered['LTV'].iloc[-1] - df_filtered['LTV'].iloc[0]) / 
-                        df_filtered['LTV'].iloc[0] * 100)
         st.metric(
             "LTV Médio",
-            f"R$ {ltv_medio:.2f}",
-            f"{ltv_variacao:+.1f}%"
+            f"R$ {resumo.loc['LTV', 'media']:.2f}",
+            _delta(resumo, 'LTV')
         )
     
     with col3:
-        roi_medio = df_filtered['ROI (%)'].mean()
-        roi_variacao = ((df_filtered['ROI (%)'].iloc[-1] - df_filtered['ROI (%)'].iloc[0]) / 
-                        df_filtered['ROI (%)'].iloc[0] * 100)
         st.metric(
             "ROI Médio",
-            f"{roi_medio:.1f}%",
-            f"{roi_variacao:+.1f}%",
+            f"{resumo.loc['ROI (%)', 'media']:.1f}%",
+            _delta(resumo, 'ROI (%)'),
             delta_color="inverse"
         )
     
     with col4:
-        tc_leads_medio = df_filtered['TC Leads (%)'].mean()
-        tc_variacao = ((df_filtered['TC Leads (%)'].iloc[-1] - df_filtered['TC Leads (%)'].iloc[0]) / 
-                       df_filtered['TC Leads (%)'].iloc[0] * 100)
         st.metric(
             "TC Leads → Vendas",
-            f"{tc_leads_medio:.2f}%",
-            f"{tc_variacao:+.1f}%",
+            f"{resumo.loc['TC Leads (%)', 'media']:.2f}%",
+            _delta(resumo, 'TC Leads (%)'),
             delta_color="inverse"
         )
\ No newline at end of file
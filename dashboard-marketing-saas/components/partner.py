@@ -0,0 +1,652 @@
+"""
+Aba de simulação da parceria com contadores
+"""
+import streamlit as st
+import pandas as pd
+
+from analytics import (
+    bundle_table,
+    cohort_ledger,
+    describe_bundles,
+    partner_economics,
+    rank_bundles,
+    referral_projection,
+    simulate_partner
+)
+from config import PLANOS, EXTENSOES, CUSTOS_LEAD, GRADE_COMISSAO, PARCERIA, SIMULADOR
+
+from .charts import (
+    cac_comparison_figure,
+    cac_ltv_ratio_figure,
+    client_monthly_figure,
+    lead_cost_figure,
+    liability_figure,
+    monte_carlo_figure,
+    plan_commission_figure,
+    projection_figure
+)
+from .performance import profiled_tab
+
+COLUNA_REAIS = st.column_config.NumberColumn(format="R$ %.2f")
+
+def render_monte_carlo(num_clientes, meses_simulacao, valor_plano, valor_extensoes,
+                       percentual_comissao, meses_comissao):
+    """Premissas, bandas de percentis e payback da simulação Monte Carlo"""
+    col_p1, col_p2, col_p3 = st.columns(3)
+    with col_p1:
+        conversao = st.slider("Conversão das indicações (%)", 5, 95,
+                              int(PARCERIA['conversao_indicacao'] * 100)) / 100
+        churn = st.slider("Churn mensal (%)", 0.0, SIMULADOR['churn_max'], PARCERIA['churn_mensal'] * 100,
+                          SIMULADOR['passo_churn']) / 100
+    with col_p2:
+        adesao = st.slider("Adesão às extensões (%)", 0, 100,
+                           int(PARCERIA['adesao_extensoes'] * 100)) / 100
+        dispersao = st.slider("Variação do volume de indicações (%)", 0, 100,
+                              int(PARCERIA['dispersao_indicacoes'] * 100)) / 100
+    with col_p3:
+        custo_implantacao = st.number_input("Custo de implantação (R$)", min_value=0.0,
+                                            value=PARCERIA['custo_implantacao'], step=500.0)
+        custo_fixo = st.number_input("Custo fixo mensal (R$)", min_value=0.0,
+                                     value=PARCERIA['custo_fixo_mensal'], step=100.0)
+    
+    sim = simulate_partner(
+        num_clientes, meses_simulacao, valor_plano, valor_extensoes,
+        percentual_comissao, meses_comissao,
+        premissas={
+            'conversao_indicacao': conversao,
+            'churn_mensal': churn,
+            'adesao_extensoes': adesao,
+            'dispersao_indicacoes': dispersao,
+            'custo_implantacao': custo_implantacao,
+            'custo_fixo_mensal': custo_fixo
+        }
+    )
+    p10, p50, p90 = sim['percentis']
+    meses = [f"Mês {i+1}" for i in range(meses_simulacao)]
+    
+    fig_mc = monte_carlo_figure(meses, sim['receita_acumulada'], sim['comissao_acumulada'],
+                                sim['lucro_acumulado'], sim['percentis'], sim['caminhos'])
+    st.plotly_chart(fig_mc, use_container_width=True)
+    
+    def mes_payback(valor):
+        return f"Mês {valor:.0f}" if pd.notna(valor) else f"> {meses_simulacao} meses"
+    
+    receita_final = sim['receita_acumulada'][:, -1]
+    col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+    with col_m1:
+        st.metric(f"Receita acumulada (P{p50})", f"R$ {receita_final[1]:,.2f}")
+        st.caption(f"P{p10}: R$ {receita_final[0]:,.2f} · P{p90}: R$ {receita_final[2]:,.2f}")
+    with col_m2:
+        comissao_final = sim['comissao_acumulada'][:, -1]
+        st.metric(f"Comissão acumulada (P{p50})", f"R$ {comissao_final[1]:,.2f}")
+        st.caption(f"P{p10}: R$ {comissao_final[0]:,.2f} · P{p90}: R$ {comissao_final[2]:,.2f}")
+    with col_m3:
+        st.metric(f"Payback (P{p50})", mes_payback(sim['payback'][1]))
+        st.caption(f"P{p10}: {mes_payback(sim['payback'][0])} · P{p90}: {mes_payback(sim['payback'][2])}")
+    with col_m4:
+        st.metric("Chance de payback no período", f"{sim['prob_payback']*100:.1f}%")
+
+def render_cohort_ledger(ledger, meses):
+    """Matriz coorte × mês da comissão e evolução do passivo de comissões"""
+    coortes = [f"Coorte {m}" for m in meses]
+    visao = st.radio("Valores por coorte:", ["Comissão", "Receita", "Clientes ativos"],
+                     horizontal=True)
+    matriz = {'Comissão': 'comissao', 'Receita': 'receita', 'Clientes ativos': 'clientes'}[visao]
+    formato = "%.1f" if matriz == 'clientes' else "R$ %.2f"
+    df_coortes = pd.DataFrame(ledger[matriz], index=coortes, columns=meses)
+    st.dataframe(
+        df_coortes,
+        use_container_width=True,
+        column_config={m: st.column_config.NumberColumn(format=formato) for m in meses}
+    )
+    
+    st.plotly_chart(liability_figure(meses, ledger['passivo']), use_container_width=True)
+
+def render_bundle_explorer(pacotes, percentual_comissao, meses_comissao, extensoes_selecionadas):
+    """Destaques e tabela de todos os pacotes (plano × extensões) da grade"""
+    st.markdown(f"#### 🧮 Todos os Pacotes ({len(pacotes)} combinações)")
+    
+    mais_barato = rank_bundles(percentual_comissao, meses_comissao, 'valor_mensal', n=1,
+                               incluir=extensoes_selecionadas)[0]
+    maior_comissao = rank_bundles(percentual_comissao, meses_comissao, 'comissao_total', n=1,
+                                  maior=True)[0]
+    col1, col2 = st.columns(2)
+    with col1:
+        descricao = describe_bundles(mais_barato[None])
+        st.metric("Pacote mais barato com as extensões selecionadas",
+                  f"R$ {mais_barato['valor_mensal']:.2f}/mês")
+        st.caption(f"{descricao['Plano'][0]} · {descricao['Extensões'][0]}")
+    with col2:
+        descricao = describe_bundles(maior_comissao[None])
+        st.metric(f"Maior comissão total ({meses_comissao}m)",
+                  f"R$ {maior_comissao['comissao_total']:.2f}")
+        st.caption(f"{descricao['Plano'][0]} · {descricao['Extensões'][0]}")
+    
+    with st.expander("📋 Tabela de pacotes"):
+        df_pacotes = pd.DataFrame({
+            **describe_bundles(pacotes),
+            'Valor Mensal': pacotes['valor_mensal'],
+            'Comissão Mensal': pacotes['comissao_mensal'],
+            f'Comissão Total ({meses_comissao}m)': pacotes['comissao_total'],
+            f'Lucro Empresa ({meses_comissao}m)': pacotes['lucro_total'],
+            'Comissão vs Custo Lead Médio': pacotes['comissao_custo_lead']
+        }).sort_values('Valor Mensal', kind='stable')
+        colunas_reais = [c for c in df_pacotes.columns if c not in ('Plano', 'Extensões')][:-1]
+        st.dataframe(
+            df_pacotes,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                **{c: COLUNA_REAIS for c in colunas_reais},
+                'Comissão vs Custo Lead Médio': st.column_config.NumberColumn(format="%.0f%%")
+            }
+        )
+
+@st.fragment
+@profiled_tab("Parceria Contador")
+def render_partner_tab(resumo):
+    """Renderiza a aba Parceria Contador"""
+    st.subheader("🤝 Parceria Contador: Simulação de Indicadores")
+    
+    # Controles de configuração da parceria
+    st.markdown("### ⚙️ Configuração do Modelo de Parceria")
+    
+    col_config1, col_config2 = st.columns(2)
+    
+    with col_config1:
+        percentual_comissao = st.slider(
+            "Percentual de Comissão (%)",
+            min_value=GRADE_COMISSAO['percentual_min'],
+            max_value=GRADE_COMISSAO['percentual_max'],
+            value=15.0,
+            step=GRADE_COMISSAO['passo_percentual'],
+            help="Ajuste o percentual de comissão mensal sobre o valor do plano + extensões"
+        ) / 100
+        
+        st.info(f"💡 Comissão selecionada: **{percentual_comissao*100:.1f}%**")
+    
+    with col_config2:
+        meses_comissao = st.slider(
+            "Período de Comissão (meses)",
+            min_value=GRADE_COMISSAO['meses_min'],
+            max_value=GRADE_COMISSAO['meses_max'],
+            value=6,
+            step=1,
+            help="Por quantos meses o contador receberá comissão"
+        )
+        
+        st.info(f"📅 Período: **{meses_comissao} meses**")
+    
+    st.markdown("---")
+    
+    # Seleção de Plano e Extensões
+    st.markdown("### 📦 Configuração do Plano do Cliente")
+    
+    col_plano1, col_plano2 = st.columns([1, 1])
+    
+    with col_plano1:
+        plano_selecionado = st.selectbox(
+            "Selecione o Plano:",
+            options=list(PLANOS.keys()),
+            index=1,  # Simples Nacional como padrão
+            help="Escolha o plano base do cliente"
+        )
+        
+        valor_plano = PLANOS[plano_selecionado]
+        st.metric("Valor do Plano", f"R$ {valor_plano:.2f}")
+    
+    with col_plano2:
+        extensoes_selecionadas = st.multiselect(
+            "Selecione as Extensões (opcional):",
+            options=list(EXTENSOES.keys()),
+            help="Adicione extensões ao plano base"
+        )
+        
+        # Indicadores do pacote (valores lidos da grade pré-calculada de comissões)
+        economia = partner_economics(resumo, plano_selecionado, extensoes_selecionadas,
+                                     percentual_comissao, meses_comissao)
+        valor_extensoes = economia['valor_extensoes']
+        st.metric("Valor das Extensões", f"R$ {valor_extensoes:.2f}")
+    
+    # Cálculo do valor total
+    valor_total_mensal = economia['valor_total_mensal']
+    comissao_mensal = economia['comissao_mensal']
+    
+    # Exibir resumo do plano configurado
+    st.markdown("#### 💰 Resumo do Plano Configurado")
+    
+    col_resumo1, col_resumo2, col_resumo3, col_resumo4 = st.columns(4)
+    
+    with col_resumo1:
+        st.metric("Plano Base", f"R$ {valor_plano:.2f}")
+    
+    with col_resumo2:
+        st.metric("Extensões", f"R$ {valor_extensoes:.2f}")
+    
+    with col_resumo3:
+        st.metric("Total Mensal", f"R$ {valor_total_mensal:.2f}", 
+                  delta=f"+R$ {valor_extensoes:.2f}" if valor_extensoes > 0 else None)
+    
+    with col_resumo4:
+        st.metric("Comissão Mensal", f"R$ {comissao_mensal:.2f}",
+                  delta=f"{percentual_comissao*100:.1f}%")
+    
+    # Detalhamento das extensões selecionadas
+    if extensoes_selecionadas:
+        with st.expander("📋 Detalhamento das Extensões Selecionadas"):
+            df_extensoes = pd.DataFrame({
+                'Extensão': extensoes_selecionadas,
+                'Valor Mensal': [f"R$ {EXTENSOES[ext]:.2f}" for ext in extensoes_selecionadas]
+            })
+            st.dataframe(df_extensoes, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Valores médios baseados nos dados filtrados
+    ticket_medio = resumo.loc['Ticket Médio', 'media']
+    roi_medio = resumo.loc['ROI (%)', 'media']
+    ltv_medio = resumo.loc['LTV', 'media']
+    cac_medio = resumo.loc['CAC', 'media']
+    
+    # Cálculo do custo por lead
+    custo_por_lead_min = CUSTOS_LEAD['min']
+    custo_por_lead_max = CUSTOS_LEAD['max']
+    custo_por_lead_medio = CUSTOS_LEAD['medio']
+    
+    # Informações do modelo de parceria
+    st.markdown(f"""
+    <div class="metric-card">
+        <h4>📋 Resumo do Modelo de Parceria</h4>
+        <ul>
+            <li><strong>Plano:</strong> {plano_selecionado} - R$ {valor_plano:.2f}/mês</li>
+            <li><strong>Extensões:</strong> {len(extensoes_selecionadas)} selecionada(s) - R$ {valor_extensoes:.2f}/mês</li>
+            <li><strong>Valor Total Mensal:</strong> R$ {valor_total_mensal:.2f}</li>
+            <li><strong>Comissão:</strong> {percentual_comissao*100:.1f}% sobre o valor total por {meses_comissao} meses</li>
+            <li><strong>Comissão mensal por cliente:</strong> R$ {comissao_mensal:.2f}</li>
+            <li><strong>Comissão total (6 meses):</strong> R$ {comissao_mensal * meses_comissao:.2f}</li>
+        </ul>
+        <hr>
+        <h5>Dados de Referência do Dashboard:</h5>
+        <ul>
+            <li>Ticket Médio histórico: R$ {ticket_medio:.2f}</li>
+            <li>ROI médio: {roi_medio:.1f}%</li>
+            <li>LTV médio: R$ {ltv_medio:.2f}</li>
+            <li>CAC médio (via ads): R$ {cac_medio:.2f}</li>
+            <li>Custo por Lead atual: R$ {custo_por_lead_min:.2f} - R$ {custo_por_lead_max:.2f}</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Análise: Comissão vs Custo por Lead
+    st.markdown("### 💡 Análise: Comissão vs Custo por Lead")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Comparativo visual
+        fig_comp = lead_cost_figure(custo_por_lead_min, custo_por_lead_max,
+                                    custo_por_lead_medio, comissao_mensal)
+        st.plotly_chart(fig_comp, use_container_width=True)
+    
+    with col2:
+        # Análise do percentual
+        ratio_min = economia['comissao_custo_lead_max']
+        ratio_max = economia['comissao_custo_lead_min']
+        ratio_medio = economia['comissao_custo_lead_medio']
+        
+        st.markdown("**Análise do Percentual de 15%:**")
+        st.metric("Comissão vs Custo Lead Mín", f"{ratio_max:.0f}%", 
+                  "✅ Saudável" if ratio_max <= 100 else "⚠️ Alto")
+        st.metric("Comissão vs Custo Lead Máx", f"{ratio_min:.0f}%", 
+                  "✅ Saudável" if ratio_min <= 100 else "⚠️ Alto")
+        st.metric("Comissão vs Custo Lead Médio", f"{ratio_medio:.0f}%", 
+                  "✅ Saudável" if ratio_medio <= 100 else "⚠️ Alto")
+        
+        if ratio_medio <= 100:
+            status_comissao = "success-box"
+            icone = "✅"
+            mensagem = f"O percentual de <strong>{percentual_comissao*100:.0f}%</strong> é <strong>saudável</strong>! A comissão mensal (R$ {comissao_mensal:.2f}) representa apenas <strong>{ratio_medio:.0f}%</strong> do custo médio por lead."
+        else:
+            status_comissao = "alert-box"
+            icone = "⚠️"
+            mensagem = f"O percentual de <strong>{percentual_comissao*100:.0f}%</strong> está <strong>alto</strong>. A comissão mensal (R$ {comissao_mensal:.2f}) representa <strong>{ratio_medio:.0f}%</strong> do custo médio por lead."
+        
+        st.markdown(f"""
+        <div class="{status_comissao}">
+            <h4>{icone} Conclusão</h4>
+            <p>{mensagem}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Simulação de receita do contador - MÊS A MÊS
+    st.markdown("### 💰 Simulação: Receita Mensal por Cliente Indicado")
+    
+    # Cálculos mensais (não acumulados)
+    comissao_total_6m = economia['comissao_total']  # Total que o contador recebe
+    receita_mensal_empresa = valor_total_mensal  # Receita mensal da empresa por cliente
+    receita_6m_empresa = receita_mensal_empresa * meses_comissao  # Receita empresa em 6 meses
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Comissão Mensal", f"R$ {comissao_mensal:,.2f}")
+    
+    with col2:
+        st.metric(f"Comissão Total ({meses_comissao}m)", f"R$ {comissao_total_6m:,.2f}")
+    
+    with col3:
+        st.metric("Receita Empresa/Mês", f"R$ {receita_mensal_empresa:,.2f}")
+    
+    with col4:
+        # LTV estimado com base no plano configurado
+        ltv_estimado = economia['ltv_estimado']  # Estimativa: LTV_MESES de retenção
+        st.metric("LTV Estimado (12m)", f"R$ {ltv_estimado:,.2f}")
+    
+    # Tabela detalhada mês a mês: ledger de uma única coorte de um cliente
+    st.markdown("#### 📅 Detalhamento Mês a Mês (Por Cliente)")
+    
+    meses_detalhe = [f"Mês {i+1}" for i in range(meses_comissao)]
+    ledger_cliente = cohort_ledger([1], meses_comissao, valor_total_mensal,
+                                   percentual_comissao, meses_comissao)
+    receita_cliente = ledger_cliente['receita_mes']
+    comissao_cliente = ledger_cliente['comissao_mes']
+    df_mensal = pd.DataFrame({
+        'Mês': meses_detalhe,
+        'Receita Empresa': receita_cliente,
+        'Comissão Contador': comissao_cliente,
+        '% Comissão': percentual_comissao * 100,
+        'Lucro Empresa': ledger_cliente['lucro_mes']
+    })
+    st.dataframe(
+        df_mensal,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Receita Empresa': COLUNA_REAIS,
+            'Comissão Contador': COLUNA_REAIS,
+            '% Comissão': st.column_config.NumberColumn(format="%.1f%%"),
+            'Lucro Empresa': COLUNA_REAIS
+        }
+    )
+    
+    # Gráfico mês a mês
+    fig_mensal = client_monthly_figure(
+        meses_detalhe, receita_cliente, comissao_cliente,
+        f"Distribuição Mensal: {plano_selecionado} + {len(extensoes_selecionadas)} extensão(ões)"
+    )
+    st.plotly_chart(fig_mensal, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Comparativo CAC
+    st.markdown("### 📊 Comparativo: CAC Ads vs CAC Indicação")
+    
+    # CAC da indicação = total de comissões pagas
+    cac_indicacao = economia['cac_indicacao']
+    economia_vs_ads = economia['economia_vs_ads']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(cac_comparison_figure(cac_medio, cac_indicacao), use_container_width=True)
+        
+        # Métricas de economia
+        st.metric(
+            "Economia vs Ads", 
+            f"R$ {economia_vs_ads:,.2f}",
+            f"{economia['economia_vs_ads_pct']:.1f}%"
+        )
+    
+    with col2:
+        # Relação CAC:LTV para indicação
+        cac_ltv_indicacao = economia['cac_ltv_indicacao']
+        cac_ltv_ads = economia['cac_ltv_ads']
+        
+        fig_ratio = cac_ltv_ratio_figure(cac_ltv_ads, cac_ltv_indicacao)
+        st.plotly_chart(fig_ratio, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Simulador interativo
+    st.markdown("### 🎯 Simulador de Impacto")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown("**Parâmetros da Simulação**")
+        num_clientes = st.slider(
+            "Número de clientes indicados/mês:",
+            min_value=SIMULADOR['clientes_min'],
+            max_value=SIMULADOR['clientes_max'],
+            value=10,
+            step=1
+        )
+        
+        meses_simulacao = st.slider(
+            "Período de simulação (meses):",
+            min_value=SIMULADOR['meses_min'],
+            max_value=SIMULADOR['meses_max'],
+            value=6,
+            step=1
+        )
+        
+        churn_mensal = st.slider(
+            "Churn mensal (%):",
+            min_value=0.0,
+            max_value=SIMULADOR['churn_max'],
+            value=0.0,
+            step=SIMULADOR['passo_churn'],
+            help="Percentual dos clientes indicados que cancela a cada mês"
+        ) / 100
+    
+    with col2:
+        # Ledger de coortes: uma coorte de num_clientes por mês, com churn e fim da comissão
+        projecao = referral_projection(economia, num_clientes, meses_simulacao,
+                                       percentual_comissao, meses_comissao, churn_mensal)
+        ledger = projecao['ledger']
+        total_clientes = projecao['total_clientes']
+        
+        # Valores do último mês simulado
+        comissao_mensal_total = projecao['comissao_ultimo_mes']
+        comissao_total_periodo = projecao['comissao_total']
+        
+        # Receita mensal da empresa
+        receita_mensal_total = projecao['receita_ultimo_mes']
+        
+        # Economia total
+        economia_total = projecao['economia_total']
+        
+        st.markdown("**Resultados da Simulação**")
+        
+        col_a, col_b, col_c = st.columns(3)
+        
+        with col_a:
+            st.metric("Total Clientes", f"{total_clientes}")
+            st.metric("Comissão/Mês", f"R$ {comissao_mensal_total:,.2f}")
+        
+        with col_b:
+            st.metric("Comissão Total", f"R$ {comissao_total_periodo:,.2f}")
+            st.metric("Receita/Mês", f"R$ {receita_mensal_total:,.2f}")
+        
+        with col_c:
+            roi_indicacao = projecao['roi_indicacao']
+            st.metric("ROI Indicação", f"{roi_indicacao:.1f}%")
+            st.metric("Economia Total", f"R$ {economia_total:,.2f}")
+    
+    # Modo Monte Carlo: premissas incertas sorteadas por caminho
+    if st.toggle("🎲 Modo Monte Carlo", help="Simula o programa com volume de indicações, "
+                 "conversão, churn e adesão às extensões sorteados de distribuições"):
+        render_monte_carlo(num_clientes, meses_simulacao, valor_plano, valor_extensoes,
+                           percentual_comissao, meses_comissao)
+    
+    st.markdown("---")
+    
+    # Projeção mensal
+    st.markdown("### 📈 Projeção Mensal de Crescimento")
+    
+    meses_proj = [f"Mês {i+1}" for i in range(meses_simulacao)]
+    
+    # Receita e comissão MENSAL (não acumulada) a partir do ledger de coortes:
+    # os clientes antigos continuam pagando, mas só geram comissão por meses_comissao
+    receita_mensal_proj = ledger['receita_mes']
+    comissao_mensal_proj = ledger['comissao_mes']
+    
+    fig_proj = projection_figure(meses_proj, receita_mensal_proj, comissao_mensal_proj, num_clientes)
+    st.plotly_chart(fig_proj, use_container_width=True)
+    
+    # Resumo da projeção
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Receita Mensal (último mês)", f"R$ {receita_mensal_proj[-1]:,.2f}")
+    
+    with col2:
+        st.metric("Comissão Mensal (último mês)", f"R$ {comissao_mensal_proj[-1]:,.2f}")
+    
+    with col3:
+        margem_ultimo_mes = projecao['margem_ultimo_mes']
+        st.metric("Margem Líquida", f"{margem_ultimo_mes:.1f}%")
+    
+    with st.expander("📒 Ledger por Coorte"):
+        render_cohort_ledger(ledger, meses_proj)
+    
+    st.markdown("---")
+    
+    # Análise de benefícios
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="success-box">
+            <h4>✅ Vantagens da Parceria</h4>
+            <ul>
+                <li><strong>Menor CAC:</strong> Economia de R$ {:.2f} por cliente (redução de {:.1f}%)</li>
+                <li><strong>Comissão competitiva:</strong> R$ {:.2f}/mês ({:.1f}% sobre plano de R$ {:.2f})</li>
+                <li><strong>Flexibilidade:</strong> Comissão ajustada ao plano + extensões contratadas</li>
+                <li><strong>Maior qualidade:</strong> Indicações geralmente têm melhor fit e maior taxa de conversão</li>
+                <li><strong>Relação CAC:LTV melhor:</strong> {:.1f}:1 vs {:.1f}:1 (ads)</li>
+                <li><strong>Sem risco:</strong> Pagamento apenas após conversão em cliente</li>
+                <li><strong>Escalável:</strong> Rede de contadores pode crescer exponencialmente</li>
+                <li><strong>Confiança:</strong> Indicação de profissional de confiança aumenta credibilidade</li>
+                <li><strong>Modelo recorrente:</strong> Comissão mensal incentiva acompanhamento contínuo</li>
+            </ul>
+        </div>
+        """.format(
+            economia_vs_ads, 
+            economia['economia_vs_ads_pct'], 
+            comissao_mensal,
+            percentual_comissao*100,
+            valor_total_mensal,
+            cac_ltv_indicacao, 
+            cac_ltv_ads
+        ), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="info-box">
+            <h4>📌 Pontos de Atenção</h4>
+            <ul>
+                <li><strong>Gestão de parceiros:</strong> Necessário sistema de acompanhamento de indicações</li>
+                <li><strong>Treinamento:</strong> Contadores precisam conhecer o produto</li>
+                <li><strong>SLA de pagamento:</strong> Definir prazos claros para comissões</li>
+                <li><strong>Qualificação:</strong> Estabelecer critérios para indicações válidas</li>
+                <li><strong>Suporte:</strong> Canal dedicado para dúvidas dos parceiros</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Recomendações estratégicas
+    st.markdown("### 🎯 Recomendações Estratégicas")
+    
+    st.markdown("""
+    <div class="alert-box">
+        <h4>📋 Plano de Ação Sugerido</h4>
+        <ol>
+            <li><strong>Fase 1 - Piloto (Mês 1-2):</strong>
+                <ul>
+                    <li>Selecionar 5-10 contadores parceiros</li>
+                    <li>Criar material de apoio e treinamento</li>
+                    <li>Definir processo de indicação e tracking</li>
+                    <li>Meta: 3-5 clientes indicados</li>
+                </ul>
+            </li>
+            <li><strong>Fase 2 - Expansão (Mês 3-6):</strong>
+                <ul>
+                    <li>Recrutar mais 20-30 contadores</li>
+                    <li>Implementar sistema de gamificação</li>
+                    <li>Criar programa de benefícios por performance</li>
+                    <li>Meta: 10-15 clientes/mês</li>
+                </ul>
+            </li>
+            <li><strong>Fase 3 - Escala (Mês 7+):</strong>
+                <ul>
+                    <li>Automatizar onboarding de parceiros</li>
+                    <li>Criar comunidade de parceiros</li>
+                    <li>Desenvolver co-marketing</li>
+                    <li>Meta: 20+ clientes/mês</li>
+                </ul>
+            </li>
+        </ol>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # KPIs para monitoramento
+    st.markdown("### 📊 KPIs para Monitoramento do Programa")
+    
+    kpis_parceria = pd.DataFrame({
+        'KPI': [
+            'Número de Parceiros Ativos',
+            'Indicações Qualificadas/Mês',
+            'Taxa de Conversão Indicações',
+            'CAC Médio por Indicação',
+            'LTV Médio Clientes Indicados',
+            'Tempo Médio de Conversão',
+            'NPS dos Parceiros',
+            'Receita via Parceria (%)',
+            'Ticket Médio Parceria'
+        ],
+        'Meta Mês 3': ['15', '10', '40%', f'R$ {cac_indicacao:.2f}', f'R$ {ltv_estimado:.2f}', '30 dias', '8+', '10%', f'R$ {valor_total_mensal:.2f}'],
+        'Meta Mês 6': ['30', '20', '45%', f'R$ {cac_indicacao*0.9:.2f}', f'R$ {ltv_estimado*1.1:.2f}', '25 dias', '9+', '20%', f'R$ {valor_total_mensal*1.15:.2f}'],
+        'Meta Mês 12': ['50+', '30+', '50%', f'R$ {cac_indicacao*0.8:.2f}', f'R$ {ltv_estimado*1.2:.2f}', '20 dias', '9+', '30%', f'R$ {valor_total_mensal*1.3:.2f}']
+    })
+    
+    st.dataframe(kpis_parceria, use_container_width=True, hide_index=True)
+    
+    # Comparativo de planos
+    st.markdown("### 📊 Comparativo: Comissão por Tipo de Plano")
+    
+    # Planos base (sem extensões) e todos os pacotes, a partir da grade de comissões
+    pacotes = bundle_table(percentual_comissao, meses_comissao)
+    planos_base = pacotes[pacotes['extensoes'] == 0]
+    df_comparativo = pd.DataFrame({
+        'Plano': describe_bundles(planos_base)['Plano'],
+        'Valor Mensal': planos_base['valor_mensal'],
+        'Comissão Mensal': planos_base['comissao_mensal'],
+        f'Comissão Total ({meses_comissao}m)': planos_base['comissao_total']
+    })
+    st.dataframe(
+        df_comparativo,
+        use_container_width=True,
+        hide_index=True,
+        column_config={c: COLUNA_REAIS for c in df_comparativo.columns[1:]}
+    )
+    
+    # Gráfico comparativo
+    fig_comp_planos = plan_commission_figure(df_comparativo['Plano'].tolist(),
+                                             planos_base['comissao_mensal'], percentual_comissao)
+    st.plotly_chart(fig_comp_planos, use_container_width=True)
+    
+    render_bundle_explorer(pacotes, percentual_comissao, meses_comissao, extensoes_selecionadas)
+    
+    st.info("""
+    💡 **Nota:** Os cálculos utilizam o plano e extensões selecionados acima. 
+    Configure diferentes combinações para simular diversos cenários de parceria.
+    Para análises mais precisas, recomenda-se rastrear a origem dos leads e 
+    os planos contratados por clientes vindos de indicações de contadores.
+    """)
\ No newline at end of file
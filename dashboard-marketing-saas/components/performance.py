@@ -0,0 +1,104 @@
+"""
+Painel Performance (opcional): spans de cada execução na sidebar
+"""
+import collections
+import functools
+
+import pandas as pd
+import streamlit as st
+
+from analytics.profiling import (
+    active_profile,
+    discard_profile,
+    export_jsonl,
+    profile_lines,
+    span,
+    start_profile,
+    stop_profile
+)
+from config import INSTRUMENTACAO
+
+CHAVE = 'perfil_ativo'
+
+
+def profiling_enabled():
+    """Instrumentação ligada nesta sessão (toggle da sidebar ou DASHBOARD_PROFILE=1)"""
+    return st.session_state.get(CHAVE, INSTRUMENTACAO['ativo'])
+
+
+def _history():
+    if 'perfis' not in st.session_state:
+        st.session_state['perfis'] = collections.deque(maxlen=INSTRUMENTACAO['historico'])
+    return st.session_state['perfis']
+
+
+def _finish(perfil, tenant=None):
+    """Encerra o perfil, guarda no histórico da sessão e grava no arquivo configurado"""
+    stop_profile(perfil)
+    _history().append(perfil)
+    if INSTRUMENTACAO['arquivo']:
+        export_jsonl([perfil], INSTRUMENTACAO['arquivo'], tenant=tenant)
+    return perfil
+
+
+def begin_rerun():
+    """Inicia o perfil da execução quando a instrumentação está ligada (senão None)"""
+    discard_profile()
+    return start_profile() if profiling_enabled() else None
+
+
+def profiled_tab(nome):
+    """Decorador das abas: span da aba; em reexecuções só do fragmento, um perfil próprio"""
+    def decorador(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if active_profile() is not None:
+                with span(f"aba: {nome}"):
+                    return func(*args, **kwargs)
+            if not profiling_enabled():
+                return func(*args, **kwargs)
+            perfil = start_profile(f"fragmento: {nome}")
+            try:
+                with span(f"aba: {nome}"):
+                    return func(*args, **kwargs)
+            finally:
+                _finish(perfil)
+        return wrapper
+    return decorador
+
+
+def _mb(valor):
+    return f"{valor / 1024 ** 2:+.1f} MB"
+
+
+def render_performance_panel(perfil, tenant=None):
+    """Toggle do painel e, com a instrumentação ligada, os spans da execução"""
+    with st.sidebar:
+        st.markdown("---")
+        st.toggle("⏱️ Performance", key=CHAVE, value=INSTRUMENTACAO['ativo'],
+                  help="Tempo, cache e memória de cada etapa da execução")
+        if perfil is None:
+            return
+        _finish(perfil, tenant)
+
+        st.metric("Execução", f"{perfil['duracao_ms']:.0f} ms")
+        st.caption(f"Cache: {perfil['cache_hits']} acertos, {perfil['cache_misses']} falhas · "
+                   f"memória {_mb(perfil['memoria_bytes'])}")
+        if perfil['spans']:
+            spans = pd.DataFrame({
+                'Etapa': ['\u2003' * s['nivel'] + ('↳ ' if s['nivel'] else '') + s['nome']
+                          for s in perfil['spans']],
+                'ms': [s['duracao_ms'] for s in perfil['spans']],
+                'Cache': [f"{s['cache_hits']}/{s['cache_misses']}" for s in perfil['spans']],
+                'Memória': [_mb(s['memoria_bytes']) for s in perfil['spans']]
+            })
+            st.dataframe(spans, hide_index=True, use_container_width=True,
+                         column_config={'ms': st.column_config.NumberColumn(format="%.1f")})
+
+        historico = list(_history())
+        st.download_button(
+            f"Exportar {len(historico)} execuções (JSON lines)",
+            '\n'.join(linha for p in historico for linha in profile_lines(p, tenant=tenant)) + '\n',
+            file_name='perfil_dashboard.jsonl',
+            mime='application/x-ndjson'
+        )
\ No newline at end of file
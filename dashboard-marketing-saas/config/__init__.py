@@ -4,9 +4,23 @@ Módulo de configuração do Dashboard Marketing SaaS ERP
 
 from .settings import (
     BENCHMARKS,
+    BENCHMARK_PROFILES,
     PLANOS,
     EXTENSOES,
     CUSTOS_LEAD,
+    GRADE_COMISSAO,
+    SIMULADOR,
+    PARCERIA,
+    GRAFICOS,
+    FONTE_DADOS,
+    CUBOS,
+    JANELAS,
+    TENANTS,
+    MULTI_TENANT,
+    CACHE,
+    API,
+    INSTRUMENTACAO,
+    LTV_MESES,
     PAGE_CONFIG
 )
 
@@ -14,9 +28,23 @@ from .styles import get_custom_css
 
 __all__ = [
     'BENCHMARKS',
+    'BENCHMARK_PROFILES',
     'PLANOS',
     'EXTENSOES',
     'CUSTOS_LEAD',
+    'GRADE_COMISSAO',
+    'SIMULADOR',
+    'PARCERIA',
+    'GRAFICOS',
+    'FONTE_DADOS',
+    'CUBOS',
+    'JANELAS',
+    'TENANTS',
+    'MULTI_TENANT',
+    'CACHE',
+    'API',
+    'INSTRUMENTACAO',
+    'LTV_MESES',
     'PAGE_CONFIG',
     'get_custom_css'
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Configurações centralizadas do projeto
 """
+import os
 
 BENCHMARKS = {
     'TC Usuários (%)': {'min': 8, 'max': 15, 'ideal': 10.5},
@@ -11,6 +12,12 @@ BENCHMARKS = {
     'Ticket Médio': {'min': 120, 'max': 200, 'ideal': 150}
 }
 
+# Perfis de benchmark selecionáveis por tenant (chaves omitidas no perfil de um
+# tenant vêm do perfil 'saas_erp')
+BENCHMARK_PROFILES = {
+    'saas_erp': BENCHMARKS
+}
+
 PLANOS = {
     'MEI': 69.90,
     'Simples Nacional': 119.90,
@@ -33,6 +40,113 @@ CUSTOS_LEAD = {
     'medio': 37.5
 }
 
+# Faixas de comissão oferecidas na parceria (percentual e meses de pagamento)
+GRADE_COMISSAO = {
+    'percentual_min': 5.0,
+    'percentual_max': 25.0,
+    'passo_percentual': 0.5,
+    'meses_min': 3,
+    'meses_max': 12
+}
+
+# Faixas do simulador de impacto da parceria (sliders da aba e corpo de
+# POST /partner/simulate); churn em % ao mês
+SIMULADOR = {
+    'clientes_min': 1,
+    'clientes_max': 50,
+    'meses_min': 1,
+    'meses_max': 36,
+    'churn_max': 20.0,
+    'passo_churn': 0.5
+}
+
+# Premissas da simulação Monte Carlo da parceria com contadores: taxas médias
+# (sorteadas por caminho de uma Beta com a concentração indicada) e custos do
+# programa. Sem número de caminhos explícito, são 'simulacoes' caminhos, limitados
+# a 'celulas_max' caminhos × meses (horizontes longos mantêm a aba interativa)
+PARCERIA = {
+    'conversao_indicacao': 0.45,
+    'churn_mensal': 0.03,
+    'adesao_extensoes': 0.6,
+    'concentracao': 100,
+    'dispersao_indicacoes': 0.25,
+    'custo_implantacao': 5000.0,
+    'custo_fixo_mensal': 1500.0,
+    'simulacoes': 100_000,
+    'celulas_max': 1_200_000
+}
+
+# Resolução dos gráficos de linha: com mais meses do que cabem na largura do
+# gráfico (largura_px / pixels_por_ponto), a série é reduzida no servidor
+# ('lttb' ou 'minmax') antes de montar os traces
+GRAFICOS = {
+    'largura_px': 1400,
+    'pixels_por_ponto': 4,
+    'metodo': 'lttb'
+}
+
+# Fonte de dados reais (Parquet/Arrow/CSV, arquivo ou diretório particionado).
+# Sem caminho configurado, o dashboard usa os dados de exemplo. Com
+# 'armazenamento', a fonte é ingerida de forma incremental (ver data/ingest.py).
+FONTE_DADOS = {
+    'caminho': os.environ.get('DASHBOARD_DATA_PATH'),
+    'armazenamento': os.environ.get('DASHBOARD_STORE_PATH'),
+    'coluna_data': 'Data',
+    'tamanho_lote': 1_000_000
+}
+
+# Cubos de agregação (data/cubes.py): granularidades do seletor de período
+# (nome -> frequência) e canais com cubo próprio (valores da coluna 'Canal')
+CUBOS = {
+    'granularidades': {'Dia': 'D', 'Semana': 'W', 'Mês': 'M', 'Trimestre': 'Q'},
+    'padrao': 'Mês',
+    'canais': ['Meta', 'Google']
+}
+
+# Janelas móveis (analytics/rolling.py) sobrepostas aos gráficos das abas
+# Evolução e Financeiro, em períodos da granularidade escolhida
+JANELAS = {
+    'periodos': [3, 6, 12],
+    'padrao': 3
+}
+
+# Modo multi-tenant: com tenants configurados, o parâmetro ?tenant= da URL
+# escolhe a partição de dados e o perfil de benchmark. Cada tenant define
+# 'nome', 'caminho' e 'armazenamento' (opcionais: sem caminho próprio, usa
+# <FONTE_DADOS['caminho']>/tenant=<chave>), 'perfil_benchmark' e 'benchmarks'
+# (sobreposições por KPI). O arquivo JSON em DASHBOARD_TENANTS acrescenta tenants.
+TENANTS = {}
+
+MULTI_TENANT = {
+    'arquivo': os.environ.get('DASHBOARD_TENANTS'),
+    'parametro': 'tenant'
+}
+
+# Orçamento de memória compartilhado pelos caches do processo (dados, resumos,
+# forecasts, simulações e figuras de todos os tenants), com descarte LRU
+CACHE = {
+    'limite_mb': float(os.environ.get('DASHBOARD_CACHE_MB', 512))
+}
+
+# API HTTP (api/): limites dos parâmetros por requisição e max-age do Cache-Control
+API = {
+    'max_caminhos': 200_000,
+    'max_horizonte': 24,
+    'max_age': 60
+}
+
+# Painel Performance (sidebar): ligado por padrão com DASHBOARD_PROFILE=1; com
+# DASHBOARD_PROFILE_LOG, os spans de cada execução são acrescentados ao arquivo
+# JSON lines. 'historico' é o número de execuções mantidas por sessão
+INSTRUMENTACAO = {
+    'ativo': os.environ.get('DASHBOARD_PROFILE') == '1',
+    'arquivo': os.environ.get('DASHBOARD_PROFILE_LOG'),
+    'historico': 20
+}
+
+# Meses de retenção usados na estimativa de LTV (Ticket Médio × meses)
+LTV_MESES = 12
+
 PAGE_CONFIG = {
     'page_title': "Dashboard Marketing - SaaS ERP",
     'page_icon': "📊",
@@ -2,9 +2,69 @@
 Módulo de gerenciamento de dados
 """
 
-from .loader import load_data, filter_data
+from .loader import load_data, load_cubes, filter_data, build_monthly_frame
+from .sources import aggregate_monthly, iter_batches
+from .ingest import refresh_store, read_store, read_watermark
+from .tenants import load_tenants, multi_tenant, get_tenant, tenant_benchmarks
+from .synthetic import generate_synthetic, write_synthetic
+from .filters import selection_key, selection_index, filter_view, selection_aggregate, month_slice
+from .cubes import TOTAL, aggregate_daily, build_cubes, cube_dates, cube_view, cube_summary
+from .aggregation import (
+    prefix_sums,
+    range_totals,
+    range_kpis,
+    summarize_range,
+    build_range_index,
+    range_index,
+    range_positions,
+    range_query,
+    range_queries
+)
+from .schema import TIPOS, compact_frame, validate_frame
+from .kpis import KPIS_DERIVADOS, compute_kpis, derive_frame, summarize, summary_for
 
 __all__ = [
     'load_data',
-    'filter_data'
+    'load_cubes',
+    'filter_data',
+    'build_monthly_frame',
+    'aggregate_monthly',
+    'iter_batches',
+    'refresh_store',
+    'read_store',
+    'read_watermark',
+    'load_tenants',
+    'multi_tenant',
+    'get_tenant',
+    'tenant_benchmarks',
+    'generate_synthetic',
+    'write_synthetic',
+    'KPIS_DERIVADOS',
+    'compute_kpis',
+    'derive_frame',
+    'summarize',
+    'summary_for',
+    'selection_key',
+    'selection_index',
+    'filter_view',
+    'selection_aggregate',
+    'month_slice',
+    'TOTAL',
+    'aggregate_daily',
+    'build_cubes',
+    'cube_dates',
+    'cube_view',
+    'cube_summary',
+    'prefix_sums',
+    'range_totals',
+    'range_kpis',
+    'summarize_range',
+    'build_range_index',
+    'range_index',
+    'range_positions',
+    'range_query',
+    'range_queries',
+    'TIPOS',
+    'compact_frame',
+    'validate_frame'
 ]
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Agregação de KPIs por intervalo: razão das somas com somas de prefixo
+
+O KPI de razão de um intervalo de períodos (taxas de conversão, Ticket Médio,
+CAC, ROI...) é a razão das somas dos seus componentes aditivos no intervalo, e
+não a média das razões de cada período, que dá o mesmo peso a meses com
+volumes diferentes. As colunas aditivas (COLUNAS_BASE) ficam acumuladas em
+somas de prefixo: o total de um intervalo contíguo [lo, hi) é P[hi] - P[lo],
+em O(1), e os KPIs de qualquer número de intervalos saem de uma única
+avaliação vetorizada das fórmulas de data.kpis.
+
+O índice de intervalos (somas de prefixo e ordinais dos períodos) é montado uma
+vez por versão dos dados, em load_data, e atende tanto os cards (range_query,
+no formato de data.kpis.summarize) quanto consultas em lote (range_queries),
+como as janelas móveis de um relatório.
+"""
+import numpy as np
+import pandas as pd
+
+from analytics.cache import cache_get, cache_set
+
+from .kpis import KPIS_RESUMO, compute_kpis, data_version
+from .periods import label_to_ordinal
+from .sources import COLUNAS_BASE
+
+
+def prefix_sums(df, columns=None):
+    """Somas de prefixo (n + 1 linhas, float64) das colunas aditivas; valores ausentes contam zero"""
+    columns = list(columns or COLUNAS_BASE)
+    valores = df[columns].to_numpy(dtype=np.float64)
+    prefixos = np.zeros((len(valores) + 1, len(columns)))
+    np.nancumsum(valores, axis=0, out=prefixos[1:])
+    return prefixos
+
+
+def range_totals(prefixos, lo, hi):
+    """Totais das colunas aditivas nos intervalos [lo, hi) (posições escalares ou arrays)"""
+    return prefixos[hi] - prefixos[lo]
+
+
+def range_kpis(prefixos, lo, hi, columns=None):
+    """KPIs dos intervalos [lo, hi): média por período das colunas aditivas e razão das somas
+
+    Os KPIs derivados são avaliados sobre o período médio do intervalo, o que
+    equivale à razão das somas. Retorna um dict nome -> array (um valor por
+    intervalo); intervalos vazios resultam em NaN.
+    """
+    columns = list(columns or COLUNAS_BASE)
+    lo, hi = np.atleast_1d(lo), np.atleast_1d(hi)
+    totais = range_totals(prefixos, lo, hi)
+    periodos = (hi - lo)[:, None]
+    medias = np.divide(totais, periodos, out=np.full(totais.shape, np.nan), where=periodos > 0)
+    return compute_kpis({c: medias[:, j] for j, c in enumerate(columns)})
+
+
+def _defined_ends(valores):
+    """Primeiro e último valor definido (não NaN) de `valores`, ou NaN se não houver"""
+    definidos = np.flatnonzero(~np.isnan(valores))
+    if not len(definidos):
+        return np.nan, np.nan
+    return valores[definidos[0]], valores[definidos[-1]]
+
+
+def summarize_range(df, prefixos, lo, hi, columns=None):
+    """Resumo (média, primeiro, último, variação) das linhas [lo, hi) de `df` em O(1)
+
+    `prefixos` são as somas de prefixo de `df` (prefix_sums). A média dos KPIs
+    de razão é a razão das somas do intervalo. Primeiro e último são os do
+    primeiro e do último período em que o KPI está definido (ex.: o CAC de um
+    dia sem clientes não entra).
+    """
+    columns = [c for c in (columns or KPIS_RESUMO) if c in df.columns]
+    if hi <= lo:
+        vazio = np.full(len(columns), np.nan)
+        media = primeiro = ultimo = vazio
+    else:
+        kpis = range_kpis(prefixos, lo, hi)
+        extremos = np.array([df[c].to_numpy()[[lo, hi - 1]] for c in columns], dtype=float)
+        for j in np.flatnonzero(np.isnan(extremos).any(axis=1)):
+            extremos[j] = _defined_ends(df[columns[j]].to_numpy(dtype=float)[lo:hi])
+        primeiro, ultimo = extremos[:, 0], extremos[:, 1]
+        media = np.array([
+            kpis[c][0] if c in kpis else np.nanmean(df[c].to_numpy(dtype=float)[lo:hi])
+            for c in columns
+        ])
+    variacao = np.divide(ultimo - primeiro, primeiro, out=np.full(len(columns), np.nan),
+                         where=primeiro != 0) * 100
+    return pd.DataFrame(
+        {'media': media, 'primeiro': primeiro, 'ultimo': ultimo, 'variacao': variacao},
+        index=columns
+    )
+
+
+def build_range_index(df):
+    """Índice de intervalos de `df`: ordinais dos períodos e somas de prefixo das colunas aditivas"""
+    ordinais = df.index.asi8 if isinstance(df.index, pd.PeriodIndex) else np.arange(len(df))
+    return {
+        'ordinais': ordinais,
+        'contiguo': len(ordinais) == 0 or ordinais[-1] - ordinais[0] + 1 == len(ordinais),
+        'prefixos': prefix_sums(df)
+    }
+
+
+def range_index(df):
+    """Índice de intervalos de `df`, montado uma vez por versão dos dados (cache compartilhado)"""
+    chave = ('intervalos', data_version(df))
+    encontrado, indice = cache_get('dados', chave)
+    if not encontrado:
+        indice = build_range_index(df)
+        cache_set('dados', chave, indice)
+    return indice
+
+
+def range_positions(indice, inicio, fim):
+    """Posições [lo, hi) dos períodos entre os ordinais `inicio` e `fim` (inclusive)
+
+    Aceita escalares ou arrays. Com períodos contíguos (sem meses faltando) a
+    posição é o deslocamento a partir do primeiro período, em O(1); senão, uma
+    busca binária.
+    """
+    ordinais = indice['ordinais']
+    inicio, fim = np.asarray(inicio, dtype=np.int64), np.asarray(fim, dtype=np.int64)
+    if not len(ordinais):
+        return np.zeros_like(inicio), np.zeros_like(fim)
+    if indice['contiguo']:
+        lo = np.clip(inicio - ordinais[0], 0, len(ordinais))
+        hi = np.clip(fim - ordinais[0] + 1, 0, len(ordinais))
+    else:
+        lo = np.searchsorted(ordinais, inicio, side='left')
+        hi = np.searchsorted(ordinais, fim, side='right')
+    return lo, np.maximum(lo, hi)
+
+
+def range_query(df, inicio=None, fim=None, columns=None):
+    """Resumo dos KPIs dos meses `inicio` a `fim` (rótulos 'Mai/25', inclusive) em O(1)
+
+    Mesmo formato de data.kpis.summarize; limites None deixam o intervalo aberto.
+    """
+    indice = range_index(df)
+    ordinais = indice['ordinais']
+    lo, hi = 0, len(ordinais)
+    if len(ordinais) and (inicio is not None or fim is not None):
+        lo, hi = range_positions(
+            indice,
+            ordinais[0] if inicio is None else label_to_ordinal(inicio),
+            ordinais[-1] if fim is None else label_to_ordinal(fim)
+        )
+    return summarize_range(df, indice['prefixos'], int(lo), int(hi), columns)
+
+
+def range_queries(df, lo, hi, totais=False):
+    """KPIs de muitos intervalos de posições [lo, hi) de uma vez (uma linha por intervalo)
+
+    Colunas: 'Períodos', as colunas aditivas (média por período, ou o total com
+    `totais=True`) e os KPIs derivados pela razão das somas.
+    """
+    indice = range_index(df)
+    lo, hi = np.atleast_1d(lo), np.atleast_1d(hi)
+    if totais:
+        kpis = compute_kpis(dict(zip(COLUNAS_BASE, range_totals(indice['prefixos'], lo, hi).T)))
+    else:
+        kpis = range_kpis(indice['prefixos'], lo, hi)
+    return pd.DataFrame({'Períodos': hi - lo, **kpis})
\ No newline at end of file
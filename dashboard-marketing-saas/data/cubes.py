@@ -0,0 +1,158 @@
+"""
+Cubos de agregação por granularidade (dia, semana, mês, trimestre) e canal
+
+Na carga dos dados, as colunas aditivas (COLUNAS_BASE) são somadas uma vez no
+grão da fonte (dia, ou mês para fontes mensais) e por canal (coluna 'Canal'), e
+daí consolidadas em cada granularidade de CUBOS. Cada cubo é um frame no
+esquema compacto (data.schema) com os KPIs derivados (taxas, CAC, ROI...)
+recalculados a partir das somas do período, nunca pela média das razões.
+Trocar de granularidade, canal ou intervalo de datas é uma consulta ao cubo
+(busca binária no índice de períodos), sem novo groupby sobre as linhas da
+fonte, e o resumo do intervalo vem das somas de prefixo do cubo.
+"""
+import numpy as np
+import pandas as pd
+
+from analytics.cache import cache_get, cache_set, content_key
+from config import CUBOS
+
+from .aggregation import build_range_index, summarize_range
+from .kpis import data_version, derive_frame
+from .periods import days_to_periods, months_to_periods, period_end, period_start
+from .schema import compact_frame, validate_frame
+from .sources import COLUNA_DATA, COLUNAS_BASE
+
+COLUNA_CANAL = 'Canal'
+TOTAL = 'Total'
+
+# Conversão do grão da fonte para as demais granularidades
+_CONVERSOES = {'D': days_to_periods, 'M': months_to_periods}
+_DERIVAVEIS = {'D': 'DWMQ', 'M': 'MQ'}
+
+# Número de parciais mantidas antes de consolidar (como em data.sources)
+_MAX_PARCIAIS = 64
+
+
+def aggregate_daily(batches, columns=None, date_column=COLUNA_DATA):
+    """Soma as colunas aditivas por (dia, canal), lote a lote
+
+    Índice do resultado: (dias desde 1970-01-01, canal), com canal vazio quando
+    a fonte não tem a coluna 'Canal'. Retorna None para fontes sem data diária.
+    """
+    columns = list(columns or COLUNAS_BASE)
+    parciais = []
+    for chunk in batches:
+        if date_column not in chunk.columns:
+            return None
+        dias = np.asarray(chunk[date_column].to_numpy(), dtype='datetime64[D]')
+        validos = ~np.isnat(dias)
+        if COLUNA_CANAL in chunk.columns:
+            canais = chunk[COLUNA_CANAL].astype(str).to_numpy()
+        else:
+            canais = np.full(len(chunk), '')
+        valores = chunk.reindex(columns=columns, fill_value=0)[validos]
+        parciais.append(valores.groupby([dias[validos].astype(np.int64), canais[validos]]).sum())
+        if len(parciais) >= _MAX_PARCIAIS:
+            parciais = [pd.concat(parciais).groupby(level=[0, 1]).sum()]
+    if not parciais:
+        vazio = pd.MultiIndex.from_arrays([np.array([], dtype=np.int64), np.array([], dtype=str)])
+        return pd.DataFrame(columns=columns, index=vazio, dtype=float)
+    return pd.concat(parciais).groupby(level=[0, 1]).sum().sort_index()
+
+
+def _rollup(base, grao, freq):
+    """Somas de `base` (índice no grão da fonte) consolidadas em `freq`, com os KPIs recalculados"""
+    ordinais = _CONVERSOES[grao](base.index.to_numpy(), freq)
+    somas = base.groupby(ordinais).sum()
+    frame = derive_frame(somas.reset_index(drop=True))
+    return validate_frame(compact_frame(frame, somas.index.to_numpy(), freq), freq)
+
+
+def build_cubes(totais, grao='D'):
+    """Cubos de cada granularidade e canal a partir das somas no grão `grao` ('D' ou 'M')
+
+    `totais` tem índice (ordinal do período no grão, canal), como o de
+    aggregate_daily. Retorna um dict com 'grao', 'versao', 'granularidades' e
+    'canais' disponíveis, 'frames' (frame por (granularidade, canal)) e
+    'indices' (índice de intervalos de cada frame, data.aggregation).
+    """
+    totais = totais.reindex(columns=COLUNAS_BASE, fill_value=0).astype(float)
+    presentes = set(totais.index.get_level_values(1))
+    canais = [TOTAL] + [c for c in CUBOS['canais'] if c in presentes]
+    granularidades = [nome for nome, freq in CUBOS['granularidades'].items() if freq in _DERIVAVEIS[grao]]
+    frames = {}
+    for canal in canais:
+        base = totais.groupby(level=0).sum() if canal == TOTAL else totais.xs(canal, level=1)
+        for nome in granularidades:
+            frames[(nome, canal)] = _rollup(base, grao, CUBOS['granularidades'][nome])
+    return {
+        'grao': grao,
+        'versao': int(pd.util.hash_pandas_object(totais).sum()),
+        'granularidades': granularidades,
+        'canais': canais,
+        'frames': frames,
+        'indices': {chave: build_range_index(frame) for chave, frame in frames.items()}
+    }
+
+
+def frame_cubes(df):
+    """Cubos de mês e trimestre a partir do frame mensal do dashboard (fontes sem data diária)"""
+    chave = ('cubos', data_version(df))
+    encontrado, cubos = cache_get('dados', chave)
+    if not encontrado:
+        indice = pd.MultiIndex.from_arrays([df.index.asi8, np.full(len(df), '')])
+        totais = pd.DataFrame(df[COLUNAS_BASE].to_numpy(dtype=float), index=indice, columns=COLUNAS_BASE)
+        cubos = build_cubes(totais, 'M')
+        cache_set('dados', chave, cubos)
+    return cubos
+
+
+def cube_dates(cubos):
+    """Primeiro e último dia cobertos pelos cubos (datetime.date), ou None sem dados"""
+    frame = cubos['frames'][(cubos['granularidades'][0], TOTAL)]
+    if frame.empty:
+        return None
+    freq = CUBOS['granularidades'][cubos['granularidades'][0]]
+    ordinais = frame.index.asi8
+    return (pd.Timestamp(period_start(ordinais[:1], freq)[0]).date(),
+            pd.Timestamp(period_end(ordinais[-1:], freq)[0]).date())
+
+
+def _positions(frame, granularidade, inicio, fim):
+    """Posições [lo, hi) dos períodos que se sobrepõem às datas [inicio, fim]: O(log n)"""
+    freq = CUBOS['granularidades'][granularidade]
+    ordinais = frame.index.asi8
+    lo, hi = 0, len(ordinais)
+    if inicio is not None:
+        alvo = days_to_periods(np.datetime64(inicio, 'D').astype(np.int64), freq)
+        lo = int(np.searchsorted(ordinais, alvo, side='left'))
+    if fim is not None:
+        alvo = days_to_periods(np.datetime64(fim, 'D').astype(np.int64), freq)
+        hi = int(np.searchsorted(ordinais, alvo, side='right'))
+    return lo, max(lo, hi)
+
+
+def cube_view(cubos, granularidade, inicio=None, fim=None, canal=TOTAL):
+    """Períodos do cubo que se sobrepõem ao intervalo de datas, como fatia sem cópia
+
+    Datas None deixam o intervalo aberto. O recorte é compartilhado com o cubo
+    e não deve ser alterado.
+    """
+    frame = cubos['frames'][(granularidade, canal)]
+    lo, hi = _positions(frame, granularidade, inicio, fim)
+    if lo == 0 and hi == len(frame):
+        return frame
+    recorte = frame.iloc[lo:hi]
+    versao = int(content_key(cubos['versao'], granularidade, canal, lo, hi)[:16], 16)
+    recorte.attrs['versao'] = (id(recorte), versao)
+    return recorte
+
+
+def cube_summary(cubos, granularidade, inicio=None, fim=None, canal=TOTAL):
+    """Resumo dos KPIs do recorte do cubo em O(1), pelas somas de prefixo do cubo
+
+    A média dos KPIs de razão é a razão das somas do intervalo (data.aggregation).
+    """
+    frame = cubos['frames'][(granularidade, canal)]
+    lo, hi = _positions(frame, granularidade, inicio, fim)
+    return summarize_range(frame, cubos['indices'][(granularidade, canal)]['prefixos'], lo, hi)
\ No newline at end of file
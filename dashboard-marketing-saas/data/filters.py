@@ -0,0 +1,102 @@
+"""
+Filtro por seleção de meses com chave canônica e recortes em cache
+
+A seleção do multiselect é canonizada (meses únicos, sem depender da ordem em
+que foram escolhidos) e, junto com a versão dos dados, forma a chave de cache.
+O cache compartilhado guarda só o array de posições das linhas selecionadas;
+o recorte é montado a partir dele (o próprio frame quando todos os meses estão
+selecionados, uma fatia sem cópia quando são contíguos) e recebe uma versão
+derivada da chave, para que gráficos e resumos em cache não recalculem o hash
+do recorte. No esquema compacto (índice mensal ordenado, um rótulo por mês) as
+posições vêm de buscas binárias no índice, sem comparar strings linha a linha.
+Agregados da seleção ficam no cache pela mesma chave: uma nova
+execução por outro widget não refaz filtro nem agregação.
+"""
+import numpy as np
+import pandas as pd
+
+from analytics.cache import cache_get, cache_set, content_key
+
+from .kpis import data_version
+from .periods import label_to_ordinal
+
+NAMESPACE = 'filtros'
+
+
+def selection_key(df, selected_months):
+    """Chave canônica da seleção: (versão dos dados, meses únicos ordenados)"""
+    return data_version(df), tuple(sorted(set(selected_months)))
+
+
+def _period_ordinals(df):
+    """Ordinais do índice mensal quando ele permite busca binária (senão None)"""
+    indice = df.index
+    mes = df['Mês']
+    if (isinstance(indice, pd.PeriodIndex) and indice.freqstr == 'M' and indice.is_monotonic_increasing
+            and isinstance(mes.dtype, pd.CategoricalDtype) and len(mes.cat.categories) == len(df)):
+        return indice.asi8
+    return None
+
+
+def _search(ordinais, meses):
+    """Posições dos meses (rótulos) em um array ordenado de ordinais: O(k log n)"""
+    try:
+        alvo = np.unique([label_to_ordinal(m) for m in meses]).astype(np.int64)
+    except ValueError:
+        return None
+    posicoes = np.searchsorted(ordinais, alvo)
+    dentro = posicoes < len(ordinais)
+    posicoes = posicoes[dentro]
+    return posicoes[ordinais[posicoes] == alvo[dentro]]
+
+
+def selection_index(df, selected_months):
+    """Posições (int64, crescentes) das linhas dos meses selecionados, em cache"""
+    chave = selection_key(df, selected_months)
+    encontrado, posicoes = cache_get(NAMESPACE, chave)
+    if not encontrado:
+        ordinais = _period_ordinals(df)
+        posicoes = _search(ordinais, chave[1]) if ordinais is not None else None
+        if posicoes is None:
+            posicoes = np.flatnonzero(df['Mês'].isin(chave[1]).to_numpy())
+        posicoes = posicoes.astype(np.int64)
+        posicoes.flags.writeable = False
+        cache_set(NAMESPACE, chave, posicoes)
+    return posicoes
+
+
+def filter_view(df, selected_months):
+    """Recorte de `df` com os meses selecionados, sem máscara booleana a cada execução
+
+    O recorte é compartilhado com o frame de origem e não deve ser alterado.
+    """
+    posicoes = selection_index(df, selected_months)
+    if len(posicoes) == len(df):
+        return df
+    if len(posicoes) and posicoes[-1] - posicoes[0] + 1 == len(posicoes):
+        recorte = df.iloc[posicoes[0]:posicoes[-1] + 1]
+    else:
+        recorte = df.iloc[posicoes]
+    versao = int(content_key(*selection_key(df, selected_months))[:16], 16)
+    recorte.attrs['versao'] = (id(recorte), versao)
+    return recorte
+
+
+def selection_aggregate(df, selected_months, nome, calcular, namespace='resumo'):
+    """Resultado de `calcular(recorte)` em cache por (chave da seleção, nome)"""
+    chave = (selection_key(df, selected_months), nome)
+    encontrado, valor = cache_get(namespace, chave)
+    if not encontrado:
+        valor = calcular(filter_view(df, selected_months))
+        cache_set(namespace, chave, valor)
+    return valor
+
+
+def month_slice(df, inicio, fim):
+    """Meses de `inicio` a `fim` (rótulos, inclusive) como fatia do frame: O(log n)"""
+    ordinais = _period_ordinals(df)
+    if ordinais is None:
+        raise ValueError("Frame sem índice mensal ordenado (use data.schema.compact_frame)")
+    lo = np.searchsorted(ordinais, label_to_ordinal(inicio), side='left')
+    hi = np.searchsorted(ordinais, label_to_ordinal(fim), side='right')
+    return df.iloc[lo:hi]
\ No newline at end of file
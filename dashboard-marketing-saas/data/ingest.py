@@ -0,0 +1,177 @@
+"""
+Ingestão incremental (append-only) para a tabela mensal de KPIs
+
+O armazenamento persiste os totais mensais já agregados e uma marca d'água
+(watermark) com a última data ingerida e os arquivos já processados. Cada
+atualização lê apenas arquivos novos ou alterados, filtra linhas posteriores à
+marca d'água e recalcula as métricas derivadas somente dos meses afetados. Em
+arquivos sem coluna de data (grão mensal), a marca d'água guarda quantas linhas
+de cada arquivo já foram somadas, e só as linhas acrescentadas são lidas.
+
+Uso em lote:
+    python -m data.ingest FONTE ARMAZENAMENTO
+"""
+import argparse
+import datetime
+import json
+import os
+import threading
+
+import pandas as pd
+
+from .periods import label_to_ordinal, ordinal_to_label
+from .schema import COLUNAS, build_monthly_frame
+from .sources import (
+    COLUNA_DATA,
+    COLUNAS_BASE,
+    TAMANHO_LOTE,
+    aggregate_batches,
+    iter_batches,
+    source_signature
+)
+
+ARQUIVO_AGREGADO = 'agregado_mensal.csv'
+ARQUIVO_WATERMARK = 'watermark.json'
+
+_lock = threading.Lock()
+
+
+def read_watermark(store):
+    """Lê a marca d'água do armazenamento (vazia se ainda não houve ingestão)"""
+    caminho = os.path.join(store, ARQUIVO_WATERMARK)
+    if not os.path.exists(caminho):
+        return {'versao': 0, 'ultima_data': None, 'ultimo_periodo': None, 'arquivos': [],
+                'linhas': {}}
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_store(store):
+    """Lê a tabela mensal persistida (índice = ordinal do mês)"""
+    caminho = os.path.join(store, ARQUIVO_AGREGADO)
+    if not os.path.exists(caminho):
+        vazio = pd.DataFrame(columns=COLUNAS)
+        vazio.index.name = 'Período'
+        return vazio
+    return pd.read_csv(caminho, index_col='Período')
+
+
+def _write_atomic(caminho, escrever):
+    """Grava em arquivo temporário e substitui o destino de uma vez"""
+    temporario = caminho + '.tmp'
+    escrever(temporario)
+    os.replace(temporario, caminho)
+
+
+def _write_json(dados):
+    def escrever(caminho):
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+    return escrever
+
+
+def _pending_files(source, watermark):
+    """Arquivos da fonte ainda não ingeridos (novos ou alterados desde a última execução)"""
+    ingeridos = {tuple(a) for a in watermark['arquivos']}
+    assinatura = source_signature(source)
+    return [a[0] for a in assinatura if a not in ingeridos], assinatura
+
+
+def _new_batches(pendentes, date_column, batch_size, since, linhas):
+    """Lotes com as linhas novas de cada arquivo pendente
+
+    Arquivos com a coluna de data são filtrados por `since`. Nos demais, as
+    primeiras `linhas[arquivo]` linhas (já ingeridas) são puladas, e `linhas` é
+    atualizado com o total de linhas lidas do arquivo.
+    """
+    for arquivo in pendentes:
+        ingeridas, lidas = linhas.get(arquivo, 0), 0
+        for chunk in iter_batches(arquivo, COLUNAS_BASE, date_column=date_column,
+                                  batch_size=batch_size, since=since):
+            if date_column not in chunk.columns:
+                inicio = max(0, ingeridas - lidas)
+                lidas += len(chunk)
+                linhas[arquivo] = lidas
+                chunk = chunk.iloc[inicio:]
+            yield chunk
+
+
+def _tracking_max(batches, date_column, estado):
+    """Repassa os lotes registrando a maior data vista"""
+    for chunk in batches:
+        if date_column in chunk.columns and len(chunk):
+            maior = pd.Timestamp(chunk[date_column].max())
+            if estado['max'] is None or maior > estado['max']:
+                estado['max'] = maior
+        yield chunk
+
+
+def fold_totals(store_df, novos):
+    """Soma os totais novos aos meses existentes e recalcula só os meses afetados"""
+    afetados = novos.index
+    base = store_df.reindex(afetados)[COLUNAS_BASE].fillna(0) + novos[COLUNAS_BASE]
+    atualizados = build_monthly_frame(base)
+    atualizados.index = afetados
+    resultado = pd.concat([store_df.drop(afetados, errors='ignore'), atualizados])
+    resultado.index.name = 'Período'
+    return resultado[COLUNAS].sort_index()
+
+
+def refresh_store(source, store, date_column=COLUNA_DATA, batch_size=TAMANHO_LOTE):
+    """Incorpora ao armazenamento apenas as linhas novas da fonte
+
+    Retorna a versão da marca d'água (incrementada quando houve dados novos).
+    Assume fonte append-only: linhas com data até a marca d'água são ignoradas.
+    Em fontes sem coluna de data (grão mensal), só as linhas acrescentadas a cada
+    arquivo desde a última ingestão são somadas.
+    """
+    with _lock:
+        os.makedirs(store, exist_ok=True)
+        watermark = read_watermark(store)
+        pendentes, assinatura = _pending_files(source, watermark)
+        if not pendentes:
+            return watermark['versao']
+
+        estado = {'max': None}
+        linhas = dict(watermark.get('linhas', {}))
+        lotes = _new_batches(pendentes, date_column, batch_size, watermark['ultima_data'], linhas)
+        novos = aggregate_batches(_tracking_max(lotes, date_column, estado),
+                                  COLUNAS_BASE, date_column=date_column)
+
+        if len(novos):
+            atual = fold_totals(read_store(store), novos)
+            _write_atomic(os.path.join(store, ARQUIVO_AGREGADO),
+                          lambda caminho: atual.to_csv(caminho))
+            ultimo = atual.index.max()
+        else:
+            ultimo = (label_to_ordinal(watermark['ultimo_periodo'])
+                      if watermark['ultimo_periodo'] else None)
+
+        if estado['max'] is not None:
+            watermark['ultima_data'] = estado['max'].isoformat()
+        watermark.update({
+            'versao': watermark['versao'] + (1 if len(novos) else 0),
+            'ultimo_periodo': ordinal_to_label(ultimo) if ultimo is not None else None,
+            'arquivos': [list(a) for a in assinatura],
+            'linhas': linhas,
+            'atualizado_em': datetime.datetime.now().isoformat(timespec='seconds')
+        })
+        _write_atomic(os.path.join(store, ARQUIVO_WATERMARK), _write_json(watermark))
+        return watermark['versao']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingestão incremental da tabela mensal de KPIs")
+    parser.add_argument('fonte', help="arquivo ou diretório Parquet/Arrow/CSV com dados brutos")
+    parser.add_argument('armazenamento', help="diretório do agregado mensal e da marca d'água")
+    parser.add_argument('--coluna-data', default=COLUNA_DATA)
+    args = parser.parse_args(argv)
+
+    versao = refresh_store(args.fonte, args.armazenamento, date_column=args.coluna_data)
+    watermark = read_watermark(args.armazenamento)
+    print(f"Versão {versao} - último período: {watermark['ultimo_periodo']} "
+          f"(dados até {watermark['ultima_data']})")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
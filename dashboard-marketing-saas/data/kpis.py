@@ -0,0 +1,107 @@
+"""
+Motor de KPIs derivados e estatísticas de resumo por filtro
+
+Cada KPI derivado é declarado como uma fórmula sobre colunas base (ou KPIs
+declarados antes dele). Todas as fórmulas são avaliadas de uma vez sobre uma
+matriz NumPy, e o resumo (média, primeiro, último, variação) de cada seleção
+de meses é calculado em uma única passada e guardado em cache (data.filters);
+a média dos KPIs de razão é a razão das somas (data.aggregation).
+"""
+import numpy as np
+import pandas as pd
+
+from analytics.cache import content_key
+from config import LTV_MESES
+
+
+def _div(num, den):
+    """Divisão vetorizada; denominador zero resulta em NaN"""
+    out = np.full(np.shape(num), np.nan)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+# Fórmulas avaliadas na ordem de declaração (dependências primeiro)
+KPIS_DERIVADOS = {
+    'Total Ads': lambda c: c['Custo Meta'] + c['Custo Google'],
+    'TC Usuários (%)': lambda c: _div(c['Leads'], c['Primeira Visita']) * 100,
+    'TC Leads (%)': lambda c: _div(c['Clientes Web'], c['Leads']) * 100,
+    'Ticket Médio': lambda c: _div(c['Receita Web'], c['Clientes Web']),
+    'CAC': lambda c: _div(c['Total Ads'], c['Clientes Web']),
+    'LTV': lambda c: c['Ticket Médio'] * LTV_MESES,
+    'CAC:LTV': lambda c: _div(c['LTV'], c['CAC']),
+    'ROI (%)': lambda c: _div(c['LTV'] - c['CAC'], c['CAC']) * 100
+}
+
+# KPIs resumidos para os cards, a tabela de benchmarks e o simulador de parceria
+KPIS_RESUMO = [
+    'Sessões', 'Leads', 'Clientes Web', 'Receita Web', 'Total Ads',
+    'TC Usuários (%)', 'TC Leads (%)', 'Ticket Médio', 'CAC', 'LTV', 'CAC:LTV', 'ROI (%)'
+]
+
+
+def compute_kpis(base):
+    """Calcula todos os KPIs derivados a partir das colunas base
+
+    `base` é um DataFrame (ou dict de arrays) com as colunas aditivas. Retorna
+    um dict nome -> array com as colunas base e as derivadas.
+    """
+    nomes = [c for c in base.keys() if c not in KPIS_DERIVADOS]
+    matriz = np.column_stack([np.asarray(base[c], dtype=float) for c in nomes])
+    saida = np.empty((matriz.shape[0], len(KPIS_DERIVADOS)))
+
+    colunas = {nome: matriz[:, i] for i, nome in enumerate(nomes)}
+    for j, (nome, formula) in enumerate(KPIS_DERIVADOS.items()):
+        saida[:, j] = formula(colunas)
+        colunas[nome] = saida[:, j]
+    return colunas
+
+
+def derive_frame(df):
+    """Retorna uma cópia de `df` com os KPIs derivados (re)calculados"""
+    colunas = compute_kpis(df.drop(columns=['Mês'], errors='ignore'))
+    out = df.copy()
+    for nome in KPIS_DERIVADOS:
+        out[nome] = colunas[nome]
+    return out
+
+
+def data_version(df):
+    """Identificador do conteúdo de `df` (guardado em df.attrs após o primeiro cálculo)
+
+    Considera o índice, as colunas e a ordem das linhas: frames com os mesmos
+    valores em outros períodos têm versões diferentes. O pandas copia `attrs`
+    para fatias e cópias; o id do objeto guardado junto evita que um recorte
+    reaproveite a versão do DataFrame de origem.
+    """
+    dono, versao = df.attrs.get('versao', (None, None))
+    if dono != id(df):
+        linhas = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        versao = int(content_key(list(df.columns), linhas)[:16], 16)
+        df.attrs['versao'] = (id(df), versao)
+    return versao
+
+
+def summarize(df, columns=None):
+    """Média, primeiro, último e variação (%) de cada KPI em uma passada
+
+    A média dos KPIs de razão é a razão das somas do período (data.aggregation).
+    """
+    from .aggregation import prefix_sums, summarize_range
+
+    return summarize_range(df, prefix_sums(df), 0, len(df), columns)
+
+
+def summary_for(df, selected_months):
+    """Resumo dos meses selecionados
+
+    Meses contíguos são resolvidos em O(1) pelo índice de intervalos
+    (data.aggregation); as demais seleções ficam em cache pela chave canônica.
+    """
+    from .aggregation import range_index, summarize_range
+    from .filters import selection_aggregate, selection_index
+
+    posicoes = selection_index(df, selected_months)
+    if len(posicoes) and posicoes[-1] - posicoes[0] + 1 == len(posicoes):
+        return summarize_range(df, range_index(df)['prefixos'], int(posicoes[0]), int(posicoes[-1]) + 1)
+    return selection_aggregate(df, selected_months, 'resumo', summarize)
\ No newline at end of file
@@ -1,32 +1,120 @@
 """
 Carregamento e preparação de dados
+
+Os carregamentos (frame mensal e cubos de agregação) ficam no cache
+compartilhado do processo (analytics.cache), com chave pela fonte do tenant e
+pela assinatura dos arquivos, dentro do orçamento de memória comum a todos os
+tenants.
 """
 import pandas as pd
-import streamlit as st
 
-@st.cache_data
-def load_data():
-    """Carrega os dados do dashboard"""
+from analytics.cache import memoize
+from config import FONTE_DADOS
+from .aggregation import range_index
+from .cubes import COLUNA_CANAL, aggregate_daily, build_cubes, frame_cubes
+from .filters import filter_view
+from .ingest import read_store, refresh_store
+from .kpis import derive_frame
+from .schema import COLUNAS, build_monthly_frame, compact_frame, validate_frame
+from .sources import COLUNAS_BASE, aggregate_monthly, iter_batches, source_signature
+from .tenants import get_tenant
+
+
+def load_data(source=None, months=None, tenant=None):
+    """Carrega os dados do dashboard (fonte do tenant, fonte configurada ou dados de exemplo)
+
+    O DataFrame retornado (esquema compacto de data.schema, índice mensal
+    'Período') é compartilhado entre sessões e não deve ser alterado. O índice
+    de intervalos (somas de prefixo, data.aggregation) é montado junto, uma vez
+    por versão dos dados.
+    """
+    fonte = get_tenant(tenant)
+    caminho = source or fonte['caminho']
+    meses = tuple(months) if months else None
+    if not caminho:
+        df = _load_sample()
+    elif fonte['armazenamento']:
+        versao = refresh_store(
+            caminho,
+            fonte['armazenamento'],
+            date_column=FONTE_DADOS['coluna_data'],
+            batch_size=FONTE_DADOS['tamanho_lote']
+        )
+        df = _load_store(fonte['armazenamento'], meses, versao)
+    else:
+        df = _load_source(caminho, meses, source_signature(caminho))
+    range_index(df)
+    return df
+
+
+@memoize('dados')
+def _load_sample():
+    """Dados de exemplo (Mai/25 a Set/25); KPIs derivados calculados pelo motor de KPIs"""
     data = {
         'Mês': ['Mai/25', 'Jun/25', 'Jul/25', 'Ago/25', 'Set/25'],
         'Sessões': [5218, 5600, 5717, 7654, 8028],
         'Primeira Visita': [2900, 3562, 3500, 5400, 5548],
         'Leads': [270, 290, 401, 600, 604],
-        'TC Usuários (%)': [9.32, 8.79, 11.46, 11.11, 10.89],
         'Clientes Web': [16, 15, 18, 20, 24],
-        'TC Leads (%)': [5.93, 5.50, 4.50, 3.33, 3.97],
         'Receita Web': [2114.56, 1991.31, 2591.91, 2728.92, 3393.42],
-        'Ticket Médio': [132.16, 132.75, 149.99, 136.45, 141.40],
         'Custo Meta': [2238.52, 2328.16, 2731.39, 3476.39, 3807.17],
-        'Custo Google': [2934.49, 3083.29, 3194.67, 4932.45, 6127.84],
-        'Total Ads': [5173.01, 5411.32, 5926.06, 8408.84, 9935.01],
-        'CAC': [323.31, 360.75, 329.23, 420.44, 413.96],
-        'LTV': [1585.92, 1593.00, 1799.88, 1637.40, 1696.80],
-        'CAC:LTV': [4.9, 4.4, 5.5, 3.9, 4.1],
-        'ROI (%)': [390.52, 341.57, 446.70, 289.45, 309.90]
+        'Custo Google': [2934.49, 3083.29, 3194.67, 4932.45, 6127.84]
     }
-    return pd.DataFrame(data)
+    return validate_frame(compact_frame(derive_frame(pd.DataFrame(data))[COLUNAS]))
+
+
+@memoize('dados')
+def _load_source(path, months, signature):
+    """Agrega a fonte ao grão mensal; `signature` invalida o cache quando os arquivos mudam"""
+    totais = aggregate_monthly(
+        path,
+        COLUNAS_BASE,
+        months,
+        date_column=FONTE_DADOS['coluna_data'],
+        batch_size=FONTE_DADOS['tamanho_lote']
+    )
+    return validate_frame(compact_frame(build_monthly_frame(totais), totais.index))
+
+
+@memoize('dados')
+def _load_store(store, months, version):
+    """Lê o agregado mensal persistido; `version` (marca d'água) invalida o cache"""
+    df = read_store(store)
+    if months:
+        df = df[df['Mês'].isin(months)]
+    return validate_frame(compact_frame(df, df.index))
+
+
+def load_cubes(source=None, months=None, tenant=None):
+    """Cubos de agregação (data.cubes) da mesma fonte de load_data
+
+    Fontes com data diária geram cubos do dia ao trimestre, em uma leitura da
+    fonte; os dados de exemplo, fontes mensais e o armazenamento incremental
+    (agregado mensal), cubos de mês e trimestre.
+    """
+    fonte = get_tenant(tenant)
+    caminho = source or fonte['caminho']
+    if caminho and not fonte['armazenamento']:
+        cubos = _load_source_cubes(caminho, tuple(months) if months else None, source_signature(caminho))
+        if cubos is not None:
+            return cubos
+    return frame_cubes(load_data(source, months, tenant))
+
+
+@memoize('dados')
+def _load_source_cubes(path, months, signature):
+    """Soma a fonte por (dia, canal) e monta os cubos (None para fontes sem data diária)"""
+    lotes = iter_batches(
+        path,
+        COLUNAS_BASE + [COLUNA_CANAL],
+        months,
+        date_column=FONTE_DADOS['coluna_data'],
+        batch_size=FONTE_DADOS['tamanho_lote']
+    )
+    diario = aggregate_daily(lotes, COLUNAS_BASE, FONTE_DADOS['coluna_data'])
+    return None if diario is None else build_cubes(diario, 'D')
+
 
 def filter_data(df, selected_months):
-    """Filtra dados pelos meses selecionados"""
-    return df[df['Mês'].isin(selected_months)]
\ No newline at end of file
+    """Filtra dados pelos meses selecionados (recorte em cache, ver data.filters)"""
+    return filter_view(df, selected_months)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Utilitários de períodos: rótulos mensais ('Mai/25') e ordinais das demais
+granularidades (dia, semana, trimestre), compatíveis com os do pandas.Period
+"""
+import numpy as np
+import pandas as pd
+
+MESES_ABREV = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun',
+               'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
+
+
+def label_to_ordinal(label):
+    """Converte 'Mai/25' no ordinal mensal (meses desde Jan/1970)"""
+    mes, ano = label.split('/')
+    ano = int(ano)
+    if ano < 100:
+        ano += 2000
+    return (ano - 1970) * 12 + MESES_ABREV.index(mes.capitalize())
+
+
+def ordinal_to_label(ordinal):
+    """Converte o ordinal mensal no rótulo 'Mai/25'"""
+    ano, mes = divmod(int(ordinal), 12)
+    return f"{MESES_ABREV[mes]}/{(1970 + ano) % 100:02d}"
+
+
+def dates_to_ordinals(values):
+    """Converte um array de datas no ordinal mensal correspondente"""
+    return np.asarray(values, dtype='datetime64[ns]').astype('datetime64[M]').astype(np.int64)
+
+
+def ordinal_to_date(ordinal):
+    """Primeiro dia do mês representado pelo ordinal"""
+    return np.datetime64(int(ordinal), 'M').astype('datetime64[D]')
+
+
+def next_labels(label, n):
+    """Rótulos dos n meses seguintes a `label`"""
+    inicio = label_to_ordinal(label)
+    return [ordinal_to_label(inicio + i) for i in range(1, n + 1)]
+
+
+def days_to_periods(dias, freq):
+    """Ordinais do período `freq` ('D', 'W', 'M' ou 'Q') de dias (dias desde 1970-01-01)"""
+    dias = np.asarray(dias, dtype=np.int64)
+    if freq == 'D':
+        return dias
+    if freq == 'W':
+        return (dias + 3) // 7 + 1  # semanas de segunda a domingo (W-SUN)
+    meses = dias.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    return months_to_periods(meses, freq)
+
+
+def months_to_periods(meses, freq):
+    """Ordinais do período `freq` ('M' ou 'Q') de ordinais mensais"""
+    meses = np.asarray(meses, dtype=np.int64)
+    if freq == 'M':
+        return meses
+    if freq == 'Q':
+        return meses // 3
+    raise ValueError(f"Granularidade sem conversão a partir de meses: {freq}")
+
+
+def period_start(ordinais, freq):
+    """Primeiro dia (datetime64[D]) de cada período"""
+    ordinais = np.asarray(ordinais, dtype=np.int64)
+    if freq == 'D':
+        dias = ordinais
+    elif freq == 'W':
+        dias = (ordinais - 1) * 7 - 3
+    else:
+        meses = ordinais * 3 if freq == 'Q' else ordinais
+        return meses.astype('datetime64[M]').astype('datetime64[D]')
+    return dias.astype('datetime64[D]')
+
+
+def period_end(ordinais, freq):
+    """Último dia (datetime64[D]) de cada período"""
+    return period_start(np.asarray(ordinais, dtype=np.int64) + 1, freq) - np.timedelta64(1, 'D')
+
+
+def period_labels(ordinais, freq):
+    """Rótulos dos períodos: '05/05/25' (dia), 'Sem 05/05/25', 'Mai/25' ou 'T2/25'"""
+    ordinais = np.asarray(ordinais, dtype=np.int64)
+    if freq == 'M':
+        return [ordinal_to_label(o) for o in ordinais]
+    if freq == 'Q':
+        return [f"T{o % 4 + 1}/{(1970 + o // 4) % 100:02d}" for o in ordinais]
+    datas = pd.DatetimeIndex(period_start(ordinais, freq)).strftime('%d/%m/%y')
+    return [f"Sem {d}" for d in datas] if freq == 'W' else list(datas)
\ No newline at end of file
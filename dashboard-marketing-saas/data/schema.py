@@ -0,0 +1,111 @@
+"""
+Esquema e montagem do frame mensal do dashboard
+
+O frame do dashboard é compacto e tipado: índice PeriodIndex mensal
+('Período', ordenado e sem repetições), 'Mês' como categórico ordenado com os
+rótulos 'Mai/25', contagens em int32 e valores monetários, razões e KPIs
+derivados em float64. validate_frame confere o esquema.
+"""
+import numpy as np
+import pandas as pd
+
+from .kpis import derive_frame
+from .periods import label_to_ordinal, ordinal_to_label, period_labels
+from .sources import COLUNAS_BASE
+
+COLUNAS = [
+    'Mês', 'Sessões', 'Primeira Visita', 'Leads', 'TC Usuários (%)',
+    'Clientes Web', 'TC Leads (%)', 'Receita Web', 'Ticket Médio',
+    'Custo Meta', 'Custo Google', 'Total Ads', 'CAC', 'LTV', 'CAC:LTV', 'ROI (%)'
+]
+
+# Tipo de cada métrica: contagens em int32 (float64 quando há NaN, frações ou
+# valores fora do int32). Valores monetários ficam em float64 para manter os
+# centavos exatos em somas e exportações, e razões e KPIs derivados também: em
+# float32 cada leitura carregaria o ruído da conversão (4.300000190734863)
+TIPOS = {
+    'Sessões': 'int32',
+    'Primeira Visita': 'int32',
+    'Leads': 'int32',
+    'Clientes Web': 'int32',
+    'Receita Web': 'float64',
+    'Custo Meta': 'float64',
+    'Custo Google': 'float64',
+    'Total Ads': 'float64',
+    'TC Usuários (%)': 'float64',
+    'TC Leads (%)': 'float64',
+    'Ticket Médio': 'float64',
+    'CAC': 'float64',
+    'LTV': 'float64',
+    'CAC:LTV': 'float64',
+    'ROI (%)': 'float64'
+}
+
+_INT32 = np.iinfo(np.int32)
+
+
+def build_monthly_frame(totais):
+    """Monta o frame do dashboard a partir dos totais mensais (índice = ordinal do mês)"""
+    df = pd.DataFrame({'Mês': [ordinal_to_label(o) for o in totais.index]})
+    for col in COLUNAS_BASE:
+        df[col] = totais[col].to_numpy()
+    return derive_frame(df)[COLUNAS]
+
+
+def _compact_column(valores, coluna):
+    """Coluna no tipo de TIPOS; contagens que não cabem em int32 ficam em float64"""
+    valores = np.asarray(valores, dtype=float)
+    if TIPOS[coluna] == 'int32':
+        cabe = (len(valores) == 0 or np.isfinite(valores).all() and (valores == np.round(valores)).all()
+                and _INT32.min <= valores.min() and valores.max() <= _INT32.max)
+        return valores.astype(np.int32) if cabe else valores
+    return valores.astype(TIPOS[coluna])
+
+
+def compact_frame(df, ordinais=None, freq='M'):
+    """Frame no esquema compacto, ordenado por período
+
+    `ordinais` são os ordinais das linhas na granularidade `freq` (padrão:
+    meses convertidos de 'Mês'); em 'Mês' ficam os rótulos do período.
+    """
+    if ordinais is None:
+        ordinais = [label_to_ordinal(m) for m in df['Mês']]
+    ordinais = np.asarray(ordinais, dtype=np.int64)
+    ordem = np.argsort(ordinais, kind='stable')
+    ordinais = ordinais[ordem]
+    codigos, rotulos = pd.factorize(pd.Series(period_labels(ordinais, freq), dtype='str'))
+    saida = pd.DataFrame(
+        {'Mês': pd.Categorical.from_codes(codigos, categories=rotulos, ordered=True)},
+        index=pd.PeriodIndex.from_ordinals(ordinais, freq=freq, name='Período')
+    )
+    for col in COLUNAS[1:]:
+        saida[col] = _compact_column(df[col].to_numpy()[ordem], col)
+    return saida
+
+
+def validate_frame(df, freq='M'):
+    """Confere o esquema compacto (índice na granularidade `freq`); ValueError com as divergências"""
+    erros = []
+    faltando = [c for c in COLUNAS if c not in df.columns]
+    if faltando:
+        erros.append(f"colunas ausentes: {', '.join(faltando)}")
+    indice = df.index
+    if not isinstance(indice, pd.PeriodIndex) or indice.dtype != pd.PeriodDtype(freq):
+        erros.append(f"índice deve ser um PeriodIndex de frequência {freq}")
+    elif not (indice.is_unique and indice.is_monotonic_increasing):
+        erros.append("períodos repetidos ou fora de ordem")
+    if 'Mês' in df.columns:
+        mes = df['Mês']
+        if not (isinstance(mes.dtype, pd.CategoricalDtype) and mes.dtype.ordered):
+            erros.append("'Mês' deve ser categórico ordenado")
+        elif isinstance(indice, pd.PeriodIndex) and len(df) and (
+                [mes.iat[0], mes.iat[-1]] != period_labels(indice.asi8[[0, -1]], freq)):
+            erros.append("'Mês' não corresponde ao período do índice")
+    for col, tipo in TIPOS.items():
+        if col in df.columns:
+            aceitos = {tipo, 'float64'} if tipo == 'int32' else {tipo}
+            if str(df[col].dtype) not in aceitos:
+                erros.append(f"'{col}' com tipo {df[col].dtype} (esperado {tipo})")
+    if erros:
+        raise ValueError("Frame fora do esquema: " + "; ".join(erros))
+    return df
\ No newline at end of file
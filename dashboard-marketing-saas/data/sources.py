@@ -0,0 +1,207 @@
+"""
+Fontes de dados colunares (Parquet/Arrow/CSV) com agregação mensal em streaming
+"""
+import datetime
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+from .periods import dates_to_ordinals, label_to_ordinal, ordinal_to_date
+
+COLUNA_DATA = 'Data'
+
+# Colunas aditivas: podem ser somadas do grão diário para o mensal
+COLUNAS_BASE = [
+    'Sessões',
+    'Primeira Visita',
+    'Leads',
+    'Clientes Web',
+    'Receita Web',
+    'Custo Meta',
+    'Custo Google'
+]
+
+FORMATOS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'ipc',
+    '.feather': 'ipc',
+    '.ipc': 'ipc',
+    '.csv': 'csv'
+}
+
+TAMANHO_LOTE = 1_000_000
+
+# Número de parciais mantidas antes de consolidar (limita memória em arquivos grandes)
+_MAX_PARCIAIS = 64
+
+
+def detect_format(path):
+    """Detecta o formato da fonte pela extensão (arquivo ou primeiro arquivo do diretório)"""
+    if isinstance(path, (list, tuple)):
+        return detect_format(path[0])
+    if os.path.isdir(path):
+        for raiz, _, arquivos in os.walk(path):
+            for nome in sorted(arquivos):
+                ext = os.path.splitext(nome)[1].lower()
+                if ext in FORMATOS:
+                    return FORMATOS[ext]
+        raise ValueError(f"Nenhum arquivo Parquet/Arrow/CSV encontrado em {path}")
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATOS:
+        raise ValueError(f"Formato não suportado: {ext or path}")
+    return FORMATOS[ext]
+
+
+def source_signature(path):
+    """Assinatura (mtime, tamanho) dos arquivos da fonte, usada como chave de cache"""
+    if os.path.isdir(path):
+        arquivos = sorted(
+            os.path.join(raiz, nome)
+            for raiz, _, nomes in os.walk(path)
+            for nome in nomes
+            if os.path.splitext(nome)[1].lower() in FORMATOS
+        )
+    else:
+        arquivos = [path]
+    return tuple((f, os.path.getmtime(f), os.path.getsize(f)) for f in arquivos)
+
+
+def _month_ranges(months):
+    """Agrupa meses em intervalos contíguos [início, fim) de ordinais"""
+    ordinais = sorted({label_to_ordinal(m) for m in months})
+    faixas = []
+    for o in ordinais:
+        if faixas and faixas[-1][1] == o:
+            faixas[-1][1] = o + 1
+        else:
+            faixas.append([o, o + 1])
+    return faixas
+
+
+@functools.lru_cache(maxsize=1)
+def _arrow():
+    """Módulos pyarrow e pyarrow.dataset, importados no primeiro uso (None sem pyarrow)
+
+    O pyarrow.dataset só é necessário com uma fonte configurada; importá-lo no
+    carregamento do módulo pesaria em toda inicialização do dashboard.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:  # pyarrow é opcional para CSV
+        return None, None
+    return pa, ds
+
+
+def _arrow_scalar(ordinal, tipo):
+    """Limite de mês como escalar Arrow do mesmo tipo da coluna de data"""
+    pa, _ = _arrow()
+    dia = ordinal_to_date(ordinal).astype(datetime.date)
+    if pa.types.is_date(tipo):
+        return pa.scalar(dia, type=tipo)
+    if pa.types.is_timestamp(tipo) and tipo.tz is None:
+        return pa.scalar(datetime.datetime.combine(dia, datetime.time()), type=tipo)
+    return None
+
+
+def _arrow_filter(dataset, months, date_column, since=None):
+    """Expressão de filtro (predicate pushdown) para os meses pedidos e a marca d'água"""
+    if date_column not in dataset.schema.names:
+        return None
+    pa, ds = _arrow()
+    tipo = dataset.schema.field(date_column).type
+    expr = None
+    for inicio, fim in _month_ranges(months or []):
+        lo, hi = _arrow_scalar(inicio, tipo), _arrow_scalar(fim, tipo)
+        if lo is None:
+            return None
+        faixa = (ds.field(date_column) >= lo) & (ds.field(date_column) < hi)
+        expr = faixa if expr is None else expr | faixa
+    if since is not None and (pa.types.is_date(tipo) or pa.types.is_timestamp(tipo)):
+        limite = pa.scalar(pd.Timestamp(since).to_pydatetime()).cast(tipo)
+        posterior = ds.field(date_column) > limite
+        expr = posterior if expr is None else expr & posterior
+    return expr
+
+
+def _projection(columns, available, date_column):
+    """Colunas a ler: as pedidas mais a chave temporal (data diária ou rótulo 'Mês')"""
+    chave = date_column if date_column in available else 'Mês'
+    return [c for c in dict.fromkeys(list(columns) + [chave]) if c in available]
+
+
+def iter_batches(path, columns, months=None, date_column=COLUNA_DATA,
+                 batch_size=TAMANHO_LOTE, since=None):
+    """Lê a fonte em lotes, carregando apenas as colunas pedidas
+
+    `path` pode ser um arquivo, um diretório ou uma lista de arquivos. Com
+    `since`, apenas linhas com data estritamente posterior são lidas.
+    """
+    formato = detect_format(path)
+    _, ds = _arrow()
+    if ds is not None:
+        dataset = ds.dataset(list(path) if isinstance(path, tuple) else path, format=formato)
+        disponiveis = _projection(columns, dataset.schema.names, date_column)
+        scanner = dataset.scanner(
+            columns=disponiveis,
+            filter=_arrow_filter(dataset, months, date_column, since),
+            batch_size=batch_size
+        )
+        for lote in scanner.to_batches():
+            if lote.num_rows:
+                yield lote.to_pandas()
+    elif formato == 'csv':
+        arquivos = path if isinstance(path, (list, tuple)) else [path]
+        for arquivo in arquivos:
+            usecols = _projection(columns, pd.read_csv(arquivo, nrows=0).columns, date_column)
+            datas = [date_column] if date_column in usecols else None
+            for chunk in pd.read_csv(arquivo, usecols=usecols, parse_dates=datas,
+                                     chunksize=batch_size):
+                if since is not None and datas:
+                    chunk = chunk[chunk[date_column] > pd.Timestamp(since)]
+                yield chunk
+    else:
+        raise ImportError("pyarrow é necessário para ler arquivos Parquet/Arrow: pip install pyarrow")
+
+
+def _month_keys(chunk, date_column):
+    """Ordinal mensal de cada linha (coluna de data diária ou rótulo 'Mês')"""
+    if date_column in chunk.columns:
+        return dates_to_ordinals(chunk[date_column].to_numpy())
+    return np.array([label_to_ordinal(m) for m in chunk['Mês']], dtype=np.int64)
+
+
+def aggregate_monthly(path, columns=None, months=None, date_column=COLUNA_DATA,
+                      batch_size=TAMANHO_LOTE, since=None):
+    """Soma as colunas aditivas por mês, lote a lote, sem materializar a fonte inteira"""
+    columns = list(columns or COLUNAS_BASE)
+    lotes = iter_batches(path, columns, months, date_column, batch_size, since)
+    return aggregate_batches(lotes, columns, months, date_column)
+
+
+def aggregate_batches(batches, columns, months=None, date_column=COLUNA_DATA):
+    """Consolida lotes já lidos em totais mensais (índice = ordinal do mês)"""
+    alvo = None
+    if months:
+        alvo = np.array(sorted({label_to_ordinal(m) for m in months}), dtype=np.int64)
+
+    parciais = []
+    for chunk in batches:
+        chaves = _month_keys(chunk, date_column)
+        valores = chunk.reindex(columns=columns, fill_value=0)
+        if alvo is not None:
+            mascara = np.isin(chaves, alvo)
+            chaves, valores = chaves[mascara], valores[mascara]
+        parciais.append(valores.groupby(chaves).sum())
+        if len(parciais) >= _MAX_PARCIAIS:
+            parciais = [pd.concat(parciais).groupby(level=0).sum()]
+
+    if not parciais:
+        totais = pd.DataFrame(columns=columns, dtype=float)
+    else:
+        totais = pd.concat(parciais).groupby(level=0).sum().sort_index()
+    totais.index.name = 'Período'
+    return totais
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""
+Gerador determinístico de dados sintéticos de marketing (grão diário por campanha)
+
+Produz linhas com o mesmo esquema das fontes diárias (Data + colunas aditivas
+de COLUNAS_BASE), mais Tenant, Canal e Campanha. Os volumes seguem tendência de
+crescimento, sazonalidade anual e semanal, e o funil é consistente por
+construção (Clientes Web ≤ Leads ≤ Primeira Visita ≤ Sessões): cada etapa é uma
+amostra binomial da anterior. Os custos vão para a coluna do canal da campanha
+(Custo Meta ou Custo Google; campanhas orgânicas não têm custo).
+
+Cada dia de cada tenant tem sua própria semente, derivada de (seed, tenant,
+dia): o resultado é o mesmo a cada execução, independe do tamanho dos lotes, e
+a saída é gravada lote a lote, sem materializar o conjunto inteiro.
+
+Uso (na raiz do projeto):
+    python -m data.synthetic dados/ --tenants acme,beta --dias 1825 --campanhas 40
+    python -m data.synthetic dados/ --linhas 1000000000 --formato parquet
+"""
+import argparse
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+from .sources import COLUNA_DATA, COLUNAS_BASE, TAMANHO_LOTE
+
+# Parâmetros por canal: participação nas campanhas, custo por sessão (R$) e
+# taxas médias do funil (primeira visita/sessão, lead/primeira visita, cliente/lead)
+CANAIS = {
+    'Meta': {'peso': 0.4, 'custo_sessao': 0.95, 'nova': 0.65, 'lead': 0.09, 'cliente': 0.035},
+    'Google': {'peso': 0.4, 'custo_sessao': 1.25, 'nova': 0.6, 'lead': 0.11, 'cliente': 0.045},
+    'Orgânico': {'peso': 0.2, 'custo_sessao': 0.0, 'nova': 0.5, 'lead': 0.08, 'cliente': 0.05}
+}
+
+COLUNA_CUSTO = {'Meta': 'Custo Meta', 'Google': 'Custo Google'}
+
+# Sessões diárias de um tenant (somadas as campanhas) no início do período,
+# ticket médio (R$) e crescimento anual médio
+SESSOES_DIA = 220
+TICKET_MEDIO = 130.0
+CRESCIMENTO_ANUAL = 0.25
+
+# Fator por dia da semana (segunda a domingo)
+FATOR_SEMANA = np.array([1.1, 1.15, 1.1, 1.05, 0.95, 0.7, 0.65])
+
+COLUNAS = [COLUNA_DATA, 'Tenant', 'Canal', 'Campanha'] + COLUNAS_BASE
+
+
+def _campaigns(seed, indice_tenant, campanhas):
+    """Atributos fixos das campanhas de um tenant (canal, volume e taxas)"""
+    rng = np.random.default_rng([seed, indice_tenant])
+    nomes = list(CANAIS)
+    pesos = np.array([CANAIS[c]['peso'] for c in nomes])
+    canal = rng.choice(len(nomes), size=campanhas, p=pesos / pesos.sum())
+    volume = rng.lognormal(0.0, 0.6, campanhas)
+
+    def taxa(chave):
+        media = np.array([CANAIS[nomes[i]][chave] for i in canal])
+        return np.clip(media * rng.lognormal(0.0, 0.2, campanhas), 0.0, 1.0)
+
+    return {
+        'canal': canal,
+        'nomes': [f"{nomes[i].lower()}-{j:04d}" for j, i in enumerate(canal)],
+        'sessoes': SESSOES_DIA * volume / volume.sum(),
+        'custo_sessao': np.array([CANAIS[nomes[i]]['custo_sessao'] for i in canal])
+                        * rng.lognormal(0.0, 0.15, campanhas),
+        'nova': taxa('nova'),
+        'lead': taxa('lead'),
+        'cliente': taxa('cliente'),
+        'escala': rng.lognormal(0.0, 0.5),
+        'crescimento': CRESCIMENTO_ANUAL * rng.uniform(0.5, 1.5),
+        'fase': rng.uniform(0, 365.25)
+    }
+
+
+def _day(seed, indice_tenant, dia, media, campanhas):
+    """Amostras de um dia (sessões, primeira visita, leads, clientes, receita, custo)"""
+    rng = np.random.default_rng([seed, indice_tenant, dia])
+    sessoes = rng.poisson(media)
+    primeira = rng.binomial(sessoes, campanhas['nova'])
+    leads = rng.binomial(primeira, campanhas['lead'])
+    clientes = rng.binomial(leads, campanhas['cliente'])
+    # Soma de `clientes` tickets com distribuição gama (forma 4): zero sem clientes
+    receita = rng.gamma(4.0 * clientes, TICKET_MEDIO / 4.0)
+    custo = sessoes * campanhas['custo_sessao'] * rng.lognormal(0.0, 0.1, sessoes.shape)
+    return sessoes, primeira, leads, clientes, receita, custo
+
+
+def _block(seed, indice_tenant, tenant, campanhas, inicio, dia_inicial, dias):
+    """Linhas de `dias` dias a partir de `dia_inicial` (dias desde `inicio`) para um tenant"""
+    t = np.arange(dia_inicial, dia_inicial + dias)
+    datas = inicio + t.astype('timedelta64[D]')
+    dia_semana = (datas.astype(np.int64) + 3) % 7  # 1970-01-01 foi quinta-feira
+
+    sazonal = 1 + 0.2 * np.sin(2 * np.pi * (t + campanhas['fase']) / 365.25)
+    nivel = campanhas['escala'] * (1 + campanhas['crescimento']) ** (t / 365.25)
+    media = (nivel * sazonal * FATOR_SEMANA[dia_semana])[:, None] * campanhas['sessoes'][None, :]
+
+    amostras = [_day(seed, indice_tenant, dia, linha, campanhas) for dia, linha in zip(t, media)]
+    sessoes, primeira, leads, clientes, receita, custo = (np.stack(c) for c in zip(*amostras))
+
+    n = sessoes.size
+    canal = np.broadcast_to(campanhas['canal'], sessoes.shape).ravel()
+    nomes_canais = list(CANAIS)
+    lote = {
+        COLUNA_DATA: np.repeat(datas, sessoes.shape[1]),
+        'Tenant': pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), [tenant]),
+        'Canal': pd.Categorical.from_codes(canal, nomes_canais),
+        'Campanha': pd.Categorical.from_codes(
+            np.tile(np.arange(sessoes.shape[1]), dias), campanhas['nomes']
+        ),
+        'Sessões': sessoes.ravel(),
+        'Primeira Visita': primeira.ravel(),
+        'Leads': leads.ravel(),
+        'Clientes Web': clientes.ravel(),
+        'Receita Web': receita.ravel().round(2)
+    }
+    for nome, coluna in COLUNA_CUSTO.items():
+        lote[coluna] = np.where(canal == nomes_canais.index(nome), custo.ravel(), 0.0).round(2)
+    return pd.DataFrame(lote)[COLUNAS]
+
+
+def generate_synthetic(tenants=('demo',), inicio='2021-01-01', dias=5 * 365, campanhas=20,
+                       seed=0, linhas=None, batch_size=TAMANHO_LOTE):
+    """Gera os dados sintéticos em lotes (DataFrames de até ~`batch_size` linhas)
+
+    Para cada tenant, percorre os dias em blocos; `linhas` limita o total de
+    linhas geradas, dividido igualmente entre os tenants. O resultado depende
+    apenas dos parâmetros (não de `batch_size`).
+    """
+    inicio = np.datetime64(inicio, 'D')
+    dias_lote = max(1, batch_size // campanhas)
+    for indice, tenant in enumerate(tenants):
+        restantes = None
+        if linhas is not None:
+            restantes = linhas // len(tenants) + (indice < linhas % len(tenants))
+        atributos = _campaigns(seed, indice, campanhas)
+        for dia in range(0, dias, dias_lote):
+            if restantes is not None and restantes <= 0:
+                break
+            lote = _block(seed, indice, tenant, atributos, inicio, dia, min(dias_lote, dias - dia))
+            if restantes is not None:
+                lote = lote.iloc[:restantes]
+                restantes -= len(lote)
+            yield lote
+
+
+def _writer(caminho, formato):
+    """Funções (gravar lote, fechar) para um arquivo Parquet ou CSV"""
+    if formato == 'csv':
+        estado = {'cabecalho': True}
+
+        def gravar(lote):
+            lote.to_csv(caminho, mode='w' if estado['cabecalho'] else 'a',
+                        header=estado['cabecalho'], index=False)
+            estado['cabecalho'] = False
+        return gravar, lambda: None
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    estado = {'escritor': None}
+
+    def gravar(lote):
+        tabela = pa.Table.from_pandas(lote, preserve_index=False)
+        if estado['escritor'] is None:
+            estado['escritor'] = pq.ParquetWriter(caminho, tabela.schema)
+        estado['escritor'].write_table(tabela)
+
+    def fechar():
+        if estado['escritor'] is not None:
+            estado['escritor'].close()
+    return gravar, fechar
+
+
+def write_synthetic(destino, formato='parquet', tenants=('demo',), linhas_por_arquivo=50_000_000,
+                    **parametros):
+    """Grava os dados sintéticos em `destino` (diretório), lote a lote
+
+    Com mais de um tenant, cada um vai para `destino/tenant=<chave>/`, o caminho
+    padrão de um tenant sem fonte própria. Os arquivos são divididos a cada
+    `linhas_por_arquivo` linhas. Retorna a lista de arquivos gravados.
+    """
+    if formato not in ('parquet', 'csv'):
+        raise ValueError(f"Formato desconhecido: {formato}")
+    arquivos = []
+    atual = {'tenant': None, 'linhas': 0, 'fechar': None}
+
+    def novo_arquivo(tenant):
+        if atual['fechar']:
+            atual['fechar']()
+        pasta = os.path.join(destino, f'tenant={tenant}') if len(tenants) > 1 else destino
+        os.makedirs(pasta, exist_ok=True)
+        parte = sum(os.path.dirname(a) == pasta for a in arquivos)
+        caminho = os.path.join(pasta, f'parte-{parte:05d}.{formato}')
+        arquivos.append(caminho)
+        atual['gravar'], atual['fechar'] = _writer(caminho, formato)
+        atual['tenant'], atual['linhas'] = tenant, 0
+
+    try:
+        for lote in generate_synthetic(tenants, **parametros):
+            tenant = lote['Tenant'].iat[0] if len(lote) else atual['tenant']
+            if tenant != atual['tenant'] or atual['linhas'] >= linhas_por_arquivo:
+                novo_arquivo(tenant)
+            atual['gravar'](lote)
+            atual['linhas'] += len(lote)
+    finally:
+        if atual['fechar']:
+            atual['fechar']()
+    return arquivos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos de marketing (diário por campanha)")
+    parser.add_argument('destino', help="diretório de saída")
+    parser.add_argument('--formato', choices=['parquet', 'csv'], default='parquet')
+    parser.add_argument('--tenants', default='demo', help="chaves dos tenants, separadas por vírgula")
+    parser.add_argument('--inicio', default='2021-01-01', help="primeiro dia (AAAA-MM-DD)")
+    parser.add_argument('--dias', type=int, help="dias por tenant (padrão: 5 anos, ou o necessário para --linhas)")
+    parser.add_argument('--campanhas', type=int, default=20, help="campanhas por tenant")
+    parser.add_argument('--linhas', type=int,
+                        help="total de linhas; sem --dias explícito, define os dias necessários")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--linhas-por-arquivo', type=int, default=50_000_000)
+    args = parser.parse_args(argv)
+
+    tenants = tuple(t.strip() for t in args.tenants.split(',') if t.strip())
+    dias = args.dias
+    if dias is None:
+        dias = math.ceil(args.linhas / (len(tenants) * args.campanhas)) if args.linhas else 5 * 365
+    arquivos = write_synthetic(
+        args.destino, args.formato, tenants, args.linhas_por_arquivo,
+        inicio=args.inicio, dias=dias, campanhas=args.campanhas, seed=args.seed, linhas=args.linhas
+    )
+    print(f"{len(arquivos)} arquivo(s) em {args.destino}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
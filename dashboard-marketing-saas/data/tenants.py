@@ -0,0 +1,83 @@
+"""
+Tenants do modo multi-tenant: partição de dados e perfil de benchmark por empresa
+
+Sem tenants configurados o dashboard funciona como antes, com a fonte de
+config.FONTE_DADOS. Com tenants, cada chave resolve a sua própria fonte (e o
+seu próprio armazenamento incremental), de modo que dados de um tenant nunca
+são servidos a outro; os caches do processo são compartilhados.
+"""
+import functools
+import json
+import os
+
+from config import BENCHMARK_PROFILES, BENCHMARKS, FONTE_DADOS, MULTI_TENANT, TENANTS
+
+PERFIL_PADRAO = 'saas_erp'
+
+
+@functools.lru_cache(maxsize=1)
+def load_tenants():
+    """Tenants de config.TENANTS acrescidos do arquivo JSON de DASHBOARD_TENANTS"""
+    tenants = dict(TENANTS)
+    arquivo = MULTI_TENANT['arquivo']
+    if arquivo:
+        with open(arquivo, encoding='utf-8') as f:
+            tenants.update(json.load(f))
+    return tenants
+
+
+def multi_tenant():
+    """True quando há tenants configurados"""
+    return bool(load_tenants())
+
+
+def tenant_benchmarks(perfil=None, sobreposicoes=None):
+    """Benchmarks de um perfil com sobreposições por KPI (faixas ausentes vêm do padrão)"""
+    if perfil is not None and perfil not in BENCHMARK_PROFILES:
+        raise ValueError(f"Perfil de benchmark desconhecido: {perfil}")
+    base = BENCHMARK_PROFILES[perfil or PERFIL_PADRAO]
+    sobreposicoes = sobreposicoes or {}
+    return {
+        kpi: {**BENCHMARKS.get(kpi, {}), **base.get(kpi, {}), **sobreposicoes.get(kpi, {})}
+        for kpi in {**BENCHMARKS, **base, **sobreposicoes}
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_tenant(chave=None):
+    """Configuração resolvida de um tenant: nome, caminho, armazenamento e benchmarks
+
+    Sem tenants configurados, `chave` deve ser None e o resultado usa
+    config.FONTE_DADOS. Com tenants, uma chave ausente ou desconhecida é um
+    ValueError (nunca há fallback para os dados de outro tenant).
+    """
+    tenants = load_tenants()
+    if not tenants:
+        if chave is not None:
+            raise ValueError(f"Modo multi-tenant desativado: tenant '{chave}' não configurado")
+        return {
+            'chave': None,
+            'nome': None,
+            'caminho': FONTE_DADOS['caminho'],
+            'armazenamento': FONTE_DADOS['armazenamento'],
+            'benchmarks': tenant_benchmarks()
+        }
+    if chave is None:
+        raise ValueError("Tenant não informado")
+    if chave not in tenants:
+        raise ValueError(f"Tenant desconhecido: {chave}")
+
+    config = tenants[chave]
+    caminho = config.get('caminho')
+    if caminho is None and FONTE_DADOS['caminho']:
+        caminho = os.path.join(FONTE_DADOS['caminho'], f"tenant={chave}")
+    armazenamento = config.get('armazenamento')
+    if armazenamento is None and FONTE_DADOS['armazenamento']:
+        armazenamento = os.path.join(FONTE_DADOS['armazenamento'], chave)
+    return {
+        'chave': chave,
+        'nome': config.get('nome', chave),
+        'caminho': caminho,
+        'armazenamento': armazenamento,
+        'benchmarks': tenant_benchmarks(config.get('perfil_benchmark'), config.get('benchmarks'))
+    }
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Configuração dos testes: raiz do projeto no sys.path (como em benchmarks/suite.py)
+
+Uso (na raiz do projeto):
+    python -m pytest -q tests
+"""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Testes da API HTTP com o cliente de testes do Starlette (dados de exemplo)
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip('httpx')
+
+from starlette.testclient import TestClient  # noqa: E402
+
+from api import app  # noqa: E402
+from config import FONTE_DADOS  # noqa: E402
+from data.tenants import get_tenant  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def cliente():
+    return TestClient(app)
+
+
+def test_health(cliente):
+    assert cliente.get('/health').json() == {'status': 'ok'}
+
+
+def test_kpis_e_etag(cliente):
+    resposta = cliente.get('/kpis', params={'months': 'Mai/25:Set/25'})
+    assert resposta.status_code == 200
+    corpo = resposta.json()
+    assert corpo['meses'] == ['Mai/25', 'Jun/25', 'Jul/25', 'Ago/25', 'Set/25']
+    assert set(corpo['principais']) == {'CAC', 'LTV', 'ROI (%)', 'TC Leads (%)'}
+
+    repetida = cliente.get('/kpis', params={'months': 'Mai/25:Set/25'},
+                           headers={'If-None-Match': resposta.headers['etag']})
+    assert repetida.status_code == 304
+
+
+def test_kpis_sem_ruido_de_float32(cliente):
+    kpis = cliente.get('/kpis', params={'months': 'Mai/25:Set/25'}).json()['kpis']
+    # KPIs de razão em float64, não float32 alargado (4.300000190734863)
+    assert all(float(np.float32(kpis[k][c])) != kpis[k][c]
+               for k in ('TC Usuários (%)', 'TC Leads (%)', 'CAC:LTV') for c in ('primeiro', 'ultimo'))
+
+
+def test_kpis_mes_sem_dados(cliente):
+    resposta = cliente.get('/kpis', params={'months': 'Jan/19'})
+    assert resposta.status_code == 400
+    assert 'Jan/19' in resposta.json()['erro']
+
+
+@pytest.mark.parametrize('meses', ['Jan/20:Fev/20', ''])
+def test_kpis_intervalo_sem_dados(cliente, meses):
+    assert cliente.get('/kpis', params={'months': meses}).status_code == 400
+
+
+def test_fonte_ausente(cliente, monkeypatch, tmp_path):
+    monkeypatch.setitem(FONTE_DADOS, 'caminho', str(tmp_path / 'nao-existe.parquet'))
+    get_tenant.cache_clear()
+    try:
+        resposta = cliente.get('/kpis')
+    finally:
+        get_tenant.cache_clear()
+    assert resposta.status_code == 503
+    assert 'erro' in resposta.json()
+
+
+def test_benchmarks(cliente):
+    corpo = cliente.get('/benchmarks').json()
+    assert set(corpo['benchmarks']['CAC']) >= {'status'}
+
+
+def test_forecast(cliente):
+    corpo = cliente.get('/forecast/Leads', params={'horizon': 2}).json()
+    assert corpo['kpi'] == 'Leads'
+    assert len(corpo['previsao']) == 2
+
+
+@pytest.mark.parametrize('params', [
+    {'horizon': 0},
+    {'horizon': 'x'},
+    {'level': 2},
+    {'model': 'desconhecido'}
+])
+def test_forecast_parametros_invalidos(cliente, params):
+    assert cliente.get('/forecast/Leads', params=params).status_code == 400
+
+
+def test_forecast_kpi_desconhecido(cliente):
+    assert cliente.get('/forecast/Desconhecido').status_code == 400
+
+
+def test_simulacao_padrao(cliente):
+    corpo = cliente.post('/partner/simulate', json={}).json()
+    assert corpo['projecao']['total_clientes'] == 60
+    assert corpo['projecao']['roi_indicacao'] is not None
+
+
+def test_simulacao_monte_carlo(cliente):
+    corpo = cliente.post('/partner/simulate', json={'monte_carlo': True, 'caminhos': 500}).json()
+    assert corpo['monte_carlo']['caminhos'] == 500
+
+
+@pytest.mark.parametrize('corpo', [
+    {'clientes_mes': 0},
+    {'clientes_mes': 2.5},
+    {'meses': 0},
+    {'meses': -3},
+    {'meses': 3000},
+    {'churn': 1.5},
+    {'percentual_comissao': 15},
+    {'meses_comissao': True},
+    {'caminhos': 0},
+    {'extensoes': 'PDV'},
+    {'extensoes': [1]},
+    {'plano': ['x']},
+    {'plano': 'Inexistente'},
+    {'monte_carlo': 'sim'},
+    {'desconhecido': 1}
+])
+def test_simulacao_parametros_invalidos(cliente, corpo):
+    resposta = cliente.post('/partner/simulate', json=corpo)
+    assert resposta.status_code == 400
+    assert resposta.json()['erro']
+
+
+def test_simulacao_corpo_invalido(cliente):
+    assert cliente.post('/partner/simulate', content=b'{').status_code == 400
+    assert cliente.post('/partner/simulate', json=[1]).status_code == 400
\ No newline at end of file
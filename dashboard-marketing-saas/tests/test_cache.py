@@ -0,0 +1,22 @@
+"""
+Testes das chaves de cache (content_key) e da versão dos dados (data_version)
+"""
+import numpy as np
+import pandas as pd
+
+from analytics.cache import content_key
+from data.kpis import data_version
+
+
+def test_content_key_de_objetos_pelo_valor():
+    a = np.array(['ab' + 'c', 1.5, None], dtype=object)
+    b = np.array([''.join(['a', 'bc']), 1.5, None], dtype=object)
+    assert content_key(a) == content_key(b)
+    assert content_key(a) != content_key(np.array(['abd', 1.5, None], dtype=object))
+
+
+def test_data_version_considera_o_indice():
+    df = pd.DataFrame({'Leads': [10, 20]}, index=pd.period_range('2025-05', periods=2, freq='M'))
+    outro = df.set_axis(pd.period_range('2024-05', periods=2, freq='M'))
+    assert data_version(df) != data_version(outro)
+    assert data_version(df) == data_version(df.copy())
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Testes da ingestão incremental (data.ingest)
+"""
+import pandas as pd
+
+from data.ingest import read_store, refresh_store
+from data.periods import label_to_ordinal
+
+
+def _sessoes(store):
+    agregado = read_store(store)
+    return {m: int(agregado.loc[label_to_ordinal(m), 'Sessões']) for m in ('Jan/25', 'Fev/25', 'Mar/25')
+            if label_to_ordinal(m) in agregado.index}
+
+
+def test_acrescimo_em_arquivo_mensal_existente(tmp_path):
+    fonte, store = tmp_path / 'mensal.csv', str(tmp_path / 'store')
+    pd.DataFrame({'Mês': ['Jan/25', 'Fev/25'], 'Sessões': [10, 10]}).to_csv(fonte, index=False)
+    assert refresh_store(str(fonte), store) == 1
+
+    with open(fonte, 'a', encoding='utf-8') as f:
+        f.write('Mar/25,7\n')
+    assert refresh_store(str(fonte), store) == 2
+    assert _sessoes(store) == {'Jan/25': 10, 'Fev/25': 10, 'Mar/25': 7}
+
+    # Sem alterações, nada é somado de novo
+    assert refresh_store(str(fonte), store) == 2
+    assert _sessoes(store) == {'Jan/25': 10, 'Fev/25': 10, 'Mar/25': 7}
+
+
+def test_acrescimo_em_arquivo_diario_existente(tmp_path):
+    fonte, store = tmp_path / 'diario.csv', str(tmp_path / 'store')
+    pd.DataFrame({'Data': ['2025-01-10', '2025-02-10'], 'Sessões': [10, 10]}).to_csv(fonte, index=False)
+    refresh_store(str(fonte), store)
+
+    with open(fonte, 'a', encoding='utf-8') as f:
+        f.write('2025-03-10,7\n')
+    refresh_store(str(fonte), store)
+    assert _sessoes(store) == {'Jan/25': 10, 'Fev/25': 10, 'Mar/25': 7}
\ No newline at end of file
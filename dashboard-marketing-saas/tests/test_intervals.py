@@ -0,0 +1,19 @@
+"""
+Testes dos intervalos de predição por bootstrap (analytics.intervals)
+"""
+import numpy as np
+import pytest
+
+from analytics.intervals import _warmup
+from analytics.models import MODELOS, PERIODO_SAZONAL
+
+
+@pytest.mark.parametrize('n', [8, 13, 20, 24, 36])
+@pytest.mark.parametrize('modelo', list(MODELOS))
+def test_warmup_e_o_trecho_ajustado_pela_propria_serie(modelo, n):
+    t = np.arange(n)
+    y = 100 + 2 * t + 10 * np.sin(2 * np.pi * t / PERIODO_SAZONAL) + np.random.default_rng(n).normal(0, 3, n)
+    ajustado, _ = MODELOS[modelo](y, 3, PERIODO_SAZONAL)
+    # Os resíduos do aquecimento são nulos e o primeiro resíduo depois dele não
+    iniciais = int(np.argmax(np.abs(y - ajustado) > 1e-9))
+    assert _warmup(modelo, n, PERIODO_SAZONAL) == iniciais
\ No newline at end of file
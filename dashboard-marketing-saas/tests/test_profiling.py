@@ -0,0 +1,22 @@
+"""
+Testes da instrumentação por execução (analytics.profiling)
+"""
+import threading
+
+from analytics.cache import cache_get, cache_set
+from analytics.profiling import span, start_profile, stop_profile
+
+
+def test_cache_contado_so_na_propria_execucao():
+    cache_set('teste', 'chave', 1)
+    perfil = start_profile()
+    with span('etapa'):
+        cache_get('teste', 'chave')
+        cache_get('teste', 'ausente')
+        # Outra sessão (thread do Streamlit) usando o mesmo cache ao mesmo tempo
+        outra = threading.Thread(target=lambda: [cache_get('teste', 'chave') for _ in range(5)])
+        outra.start()
+        outra.join()
+    stop_profile(perfil)
+    assert (perfil['cache_hits'], perfil['cache_misses']) == (1, 1)
+    assert (perfil['spans'][0]['cache_hits'], perfil['spans'][0]['cache_misses']) == (1, 1)
\ No newline at end of file
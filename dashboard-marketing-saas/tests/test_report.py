@@ -0,0 +1,26 @@
+"""
+Testes do relatório sem Streamlit (analytics.report)
+"""
+import pytest
+
+from analytics.report import build_report, expand_months, main
+
+MESES = ['Mai/25', 'Jun/25', 'Jul/25', 'Ago/25', 'Set/25']
+
+
+def test_expand_months():
+    assert expand_months('Jun/25:Ago/25, Mai/25', MESES) == ['Jun/25', 'Jul/25', 'Ago/25', 'Mai/25']
+
+
+def test_intervalo_sem_dados_e_erro():
+    with pytest.raises(ValueError, match='Meses sem dados'):
+        expand_months('Jan/20:Fev/20', MESES)
+    with pytest.raises(ValueError):
+        build_report(None, [])
+
+
+def test_main_intervalo_sem_dados_sai_com_erro(capsys):
+    with pytest.raises(SystemExit) as saida:
+        main(['--months', 'Jan/20:Fev/20', '--format', 'csv'])
+    assert saida.value.code != 0
+    assert capsys.readouterr().out == ''
\ No newline at end of file
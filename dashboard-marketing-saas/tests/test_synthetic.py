@@ -0,0 +1,21 @@
+"""
+Testes do gerador de dados sintéticos (data.synthetic)
+"""
+import pandas as pd
+
+from data.synthetic import generate_synthetic
+
+
+def _frame(**parametros):
+    return pd.concat(generate_synthetic(**parametros), ignore_index=True)
+
+
+def test_resultado_independe_do_lote():
+    pequeno = _frame(dias=60, campanhas=7, seed=3, batch_size=10)
+    grande = _frame(dias=60, campanhas=7, seed=3, batch_size=100_000)
+    pd.testing.assert_frame_equal(pequeno, grande)
+
+
+def test_linhas_divididas_entre_tenants():
+    df = _frame(tenants=('a', 'b', 'c'), dias=30, campanhas=10, linhas=301)
+    assert df['Tenant'].value_counts().sort_index().tolist() == [101, 100, 100]
\ No newline at end of file